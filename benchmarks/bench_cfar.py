@@ -0,0 +1,45 @@
+"""
+CFAR detection cost against training window size and tile size, and the
+measured false alarm rate against the requested one, on exponential noise
+with a few injected targets.
+
+Run with `python benchmarks/bench_cfar.py`.
+"""
+import timeit
+
+import numpy as np
+
+from pyrasim.sfcw.detection import CFAR
+
+
+def noise_map(shape=(1024, 2048), seed=0):
+    rng = np.random.default_rng(seed)
+    power = rng.exponential(size=shape)
+    power[rng.integers(0, shape[0], 20), rng.integers(0, shape[1], 20)] += 1e4
+    return power
+
+
+def main():
+    power = noise_map()
+    print(f"{power.shape} map, {power.nbytes/2**20:.0f} MiB")
+    print(f"{'method':>6s} {'training':>8s} {'time (s)':>9s} {'pfa':>9s} {'measured':>9s}")
+    for method in ("ca", "go", "so"):
+        for training in (4, 16, 64):
+            cfar = CFAR(method, guard=2, training=training, pfa=1e-4)
+            elapsed = timeit.timeit(lambda: cfar.detect_power(power), number=1)
+            rows, _, _ = cfar.detect_power(power)
+            print(f"{method:>6s} {training:8d} {elapsed:9.3f} {cfar.pfa:9.0e} {(len(rows) - 20)/power.size:9.1e}")
+    small = power[:128]
+    for training in (2, 4):
+        cfar = CFAR("os", guard=1, training=training, pfa=1e-4)
+        elapsed = timeit.timeit(lambda: cfar.detect_power(small), number=1)
+        print(f"{'os':>6s} {training:8d} {elapsed*power.shape[0]/128:9.3f} {cfar.pfa:9.0e}   (scaled from 128 rows)")
+
+    print(f"\n{'tile bytes':>10s} {'time (s)':>9s}")
+    for tile_bytes in (2**16, 2**20, 2**24, 2**30):
+        cfar = CFAR("ca", guard=2, training=16, pfa=1e-4, tile_bytes=tile_bytes)
+        print(f"{tile_bytes:10d} {timeit.timeit(lambda: cfar.detect_power(power), number=1):9.3f}")
+
+
+if __name__ == "__main__":
+    main()
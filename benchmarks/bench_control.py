@@ -0,0 +1,58 @@
+"""
+Latency and throughput of per-step XML-RPC frequency control against a local
+flowgraph stand-in: a new ServerProxy per call (the old _getXmlRpc usage), one
+persistent connection, system.multicall batches and the pipelined schedule.
+
+Run with `python benchmarks/bench_control.py`.
+"""
+import time
+
+import numpy as np
+
+from pyrasim.sfcw.control import FlowgraphController, FlowgraphStandIn
+from pyrasim.sfcw.utils import _getXmlRpc
+
+
+def rate(n: int, seconds: float) -> str:
+    return f"{n/seconds:10.0f} steps/s {1e6*seconds/n:9.1f} us/step"
+
+
+def main(n_steps: int = 2000):
+    frequencies = 100e6 + np.arange(n_steps)*10e3
+    with FlowgraphStandIn() as server:
+        host, port = server.address
+
+        start = time.perf_counter()
+        for frequency in frequencies[:n_steps//4]:
+            _getXmlRpc(host, port).set_center_freq(float(frequency))
+        print(f"{'proxy per call':24s}", rate(n_steps//4, time.perf_counter() - start))
+
+        with FlowgraphController(host, port) as controller:
+            start = time.perf_counter()
+            for frequency in frequencies:
+                controller.set_frequency(frequency)
+            print(f"{'persistent connection':24s}", rate(n_steps, time.perf_counter() - start))
+
+            for batch_size in (16, 256):
+                controller.batch_size = batch_size
+                start = time.perf_counter()
+                controller.set_frequencies(frequencies)
+                print(f"{f'multicall x{batch_size}':24s}", rate(n_steps, time.perf_counter() - start))
+
+            # Acquisition and processing each take ~100 us per step
+            acquire = lambda i, frequency: time.sleep(1e-4)
+            process = lambda data: time.sleep(1e-4)
+            start = time.perf_counter()
+            for i, frequency in enumerate(frequencies):
+                controller.set_frequency(frequency)
+                process(acquire(i, frequency))
+            print(f"{'sequential schedule':24s}", rate(n_steps, time.perf_counter() - start))
+            start = time.perf_counter()
+            controller.run_schedule(frequencies, acquire, process)
+            print(f"{'pipelined schedule':24s}", rate(n_steps, time.perf_counter() - start))
+            print(controller.stats.as_dict())
+        assert server.values["center_freq"] == frequencies[-1]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Import-time budget: each module is imported in a fresh interpreter (best of
+a few runs, from `python -X importtime`), its cost on top of numpy is
+checked against IMPORT_BUDGETS, and none of the plotting or transport
+libraries may be loaded on the way. Headless plotting must not load
+matplotlib either. Exits with status 1 if any check fails.
+
+Run with `python benchmarks/bench_import_time.py`.
+"""
+import subprocess
+import sys
+
+# Milliseconds a module may take to import, on top of numpy
+IMPORT_BUDGETS = {
+    "pyrasim.cli": 60,
+    "pyrasim.signals": 60,
+    "pyrasim.sfcw": 100,
+    "pyrasim.sfcw.sweep": 120,
+    "pyrasim.sfcw.montecarlo": 120,
+    "pyrasim.sfcw.stream": 100,
+    "pyrasim.sfcw.control": 100,
+}
+
+# Only loaded on first use of plot() or of the ZMQ/XML-RPC helpers
+DEFERRED = ("matplotlib", "zmq", "xmlrpc.client", "xmlrpc.server", "cProfile")
+
+HEADLESS_PLOT = """
+from pyrasim.plot import set_headless
+from pyrasim.signals import CosineWaveform
+set_headless()
+CosineWaveform(1.0, 1e3, 0.0, 1e-3, 0.0, 1e5).plot()
+"""
+
+CLI_VERSION = """
+import sys
+from pyrasim.cli import main
+sys.argv = ["pyrasim", "--version"]
+main()
+"""
+
+
+def import_time(statement: str, module: str, runs: int = 5):
+    """
+    Best import time (ms) of `module` without the numpy import inside it,
+    while running `statement`, and the deferred modules loaded by then.
+    """
+    check = f"{statement}\nimport sys\nprint('deferred:' + ','.join(m for m in {DEFERRED!r} if m in sys.modules))"
+    best = None
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", check], capture_output=True, text=True, check=True)
+        cumulative = {}
+        for line in result.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[1].strip().isdigit():
+                cumulative[fields[2].strip()] = int(fields[1])/1000
+        if module in cumulative:
+            own = cumulative[module] - cumulative.get("numpy", 0.0)
+            best = own if best is None else min(best, own)
+        loaded = result.stdout.strip().splitlines()[-1][len("deferred:"):].split(",")
+    return best, [m for m in loaded if m]
+
+
+def main() -> int:
+    print(f"{'module':28s} {'ms':>7s} {'budget':>7s}  deferred modules loaded")
+    failed = 0
+    for module, budget in IMPORT_BUDGETS.items():
+        own, loaded = import_time(f"import {module}", module)
+        ok = own <= budget and not loaded
+        failed += not ok
+        print(f"{module:28s} {own:7.1f} {budget:7d}  {', '.join(loaded) or '-'}{'' if ok else '  FAIL'}")
+
+    for name, statement in (("headless plot()", HEADLESS_PLOT), ("pyrasim --version", CLI_VERSION)):
+        _, loaded = import_time(statement, "")
+        failed += bool(loaded)
+        print(f"{name:28s} {'':7s} {'':7s}  {', '.join(loaded) or '-'}{'  FAIL' if loaded else ''}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Cost of the instrumentation hooks: a disabled stage on its own, and many
+small waveform additions (one synthesis and arithmetic stage per call) with
+instrumentation disabled and enabled, and a check that the CLI --profile
+flag writes its report.
+
+Run with `python benchmarks/bench_instrumentation.py`.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+from pyrasim import instrumentation
+from pyrasim.signals import CosineWaveform, sample_cache
+
+
+def small_sums(n: int = 2000):
+    for i in range(n):
+        a = CosineWaveform(1.0, 1e3, 0.0, 1e-4, i*1e-4, 1e6)
+        b = CosineWaveform(0.5, 2e3, 0.3, 1e-4, i*1e-4 + 5e-5, 1e6)
+        (a + b).amplitude_axis
+
+
+def check_cli_profile():
+    """
+    `pyrasim --profile sfcw ...` (bare flag, default path) and
+    --profile-output both write a report with the SFCW stages.
+    """
+    command = [sys.executable, "-c", "import sys; from pyrasim.cli import main; sys.argv[0] = 'pyrasim'; main()"]
+    sfcw = ["sfcw", "-tr", "10", "--suppress-progress"]
+    with tempfile.TemporaryDirectory() as directory:
+        for flags, path in (
+                (["--profile"], "pyrasim_profile.json"),
+                (["--profile", "--profile-output", "custom.json"], "custom.json"),
+                ):
+            result = subprocess.run(command + flags + sfcw, cwd=directory, capture_output=True, text=True)
+            assert result.returncode == 0, result.stderr
+            with open(os.path.join(directory, path)) as f:
+                stages = json.load(f)["stages"]
+            assert any(name.startswith("sfcw.") for name in stages), stages
+            print(f"{' '.join(flags + sfcw)}: {path} with {len(stages)} stages")
+
+
+def main(number: int = 1_000_000):
+    instrumentation.disable()
+    per_stage = timeit.timeit(lambda: instrumentation.stage("bench").__enter__(), number=number)/number
+    print(f"disabled stage: {per_stage*1e9:.0f} ns")
+
+    timings = {}
+    for enabled in (False, True):
+        (instrumentation.enable if enabled else instrumentation.disable)()
+        sample_cache.clear()
+        timings[enabled] = min(timeit.repeat(small_sums, number=1, repeat=5))
+    instrumentation.disable()
+    print(f"2000 small sums: disabled {timings[False]:.4f} s, enabled {timings[True]:.4f} s "
+          f"({100*(timings[True]/timings[False] - 1):+.1f}%)")
+    print(f"stages over the 5 enabled repeats: {instrumentation.report()}")
+    check_cli_profile()
+
+
+if __name__ == "__main__":
+    main()
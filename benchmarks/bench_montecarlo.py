@@ -0,0 +1,55 @@
+"""
+Monte Carlo Pd/Pfa of a CA-CFAR on SFCW range profiles: trials per second
+against the worker count, with the check that the statistics do not depend
+on it, the measured Pfa against the CFAR design value for each range
+window, and a short detection curve with and without K-distributed clutter.
+
+Run with `python benchmarks/bench_montecarlo.py`.
+"""
+import timeit
+
+from pyrasim.sfcw import SteppedFrequencyCW
+from pyrasim.sfcw.detection import CFAR
+from pyrasim.sfcw.montecarlo import NoiseModel, detection_curve, run_trials
+
+RADAR = dict(
+    N_bursts=4, n_pulses=128, target_range=40.0, target_velocity=0.0, freq_step_size=1e6,
+    freq_start=1e9, pulse_width=2e-6, pulse_repetion_interval=1e-5, transmitted_amplitude=1.0,
+    transmitted_relative_phase=0.0,
+    )
+
+
+def main():
+    sfcw = SteppedFrequencyCW(**RADAR)
+    detector = CFAR("ca", guard=2, training=8, pfa=1e-3)
+    noise = NoiseModel(snr_db=-12.0)
+    n_trials = 20000
+
+    print(f"{'jobs':>4s} {'time (s)':>9s} {'trials/s':>9s} {'pd':>7s} {'pfa':>9s}")
+    reference = None
+    for jobs in (1, 2, 4):
+        statistics = None
+
+        def run():
+            nonlocal statistics
+            statistics = run_trials(sfcw, n_trials, noise, detector, jobs=jobs, seed=7)
+        elapsed = timeit.timeit(run, number=1)
+        reference = reference or statistics
+        print(f"{jobs:4d} {elapsed:9.3f} {n_trials/elapsed:9.0f} {statistics.pd:7.4f} {statistics.pfa:9.2e}"
+              f"{'' if statistics == reference else '  MISMATCH'}")
+
+    print(f"\n{'window':>11s} {'pfa':>9s} {'design':>9s}")
+    for window in ("rectangular", "hann"):
+        statistics = run_trials(sfcw, n_trials, noise, detector, window=window, jobs=0, seed=7)
+        print(f"{window:>11s} {statistics.pfa:9.2e} {detector.pfa:9.2e}")
+
+    snrs = (-21, -18, -15, -12, -9)
+    print(f"\n{'snr (dB)':>8s} {'pd':>7s} {'pfa':>9s} {'pd clutter':>10s} {'pfa clutter':>11s}")
+    clean = detection_curve(sfcw, snrs, 5000, detector=detector)
+    clutter = detection_curve(sfcw, snrs, 5000, NoiseModel(clutter_to_noise_db=0.0, clutter_shape=0.5), detector=detector)
+    for snr, a, b in zip(snrs, clean, clutter):
+        print(f"{snr:8.0f} {a.pd:7.4f} {a.pfa:9.2e} {b.pd:10.4f} {b.pfa:11.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+NCO (phasor recurrence) against direct cos/exp sample generation: speed
+and maximum deviation, in float64 and float32, for a tone and an SFCW burst.
+
+Run with `python benchmarks/bench_nco.py`.
+"""
+import timeit
+
+import numpy as np
+
+from pyrasim.signals import ComplexSinusoidWaveform, CosineWaveform, TimeAxis
+from pyrasim.signals.nco import NCO_BLOCK
+from pyrasim.sfcw.burst import synthesize_burst
+
+
+def reference(frequency, time_start, sample_rate, length):
+    """
+    Exact phasors from integer cycle arithmetic (long double).
+    """
+    n = np.arange(length, dtype=np.longdouble)
+    cycles = np.longdouble(frequency)*(np.longdouble(time_start) + n/np.longdouble(sample_rate))
+    return np.exp(2j*np.pi*(cycles % 1).astype(np.float64))
+
+
+def main(n_samples: int = 2**24, time_start: float = 1e3):
+    frequency, sample_rate = 1.234567e6, 1e7
+    time_axis = TimeAxis(time_start, sample_rate, n_samples)
+    exact = reference(frequency, time_start, sample_rate, n_samples)
+    eps = np.finfo(np.float64).eps
+    bound = 2*np.pi*eps*n_samples*frequency/sample_rate + 4*eps*np.ceil(n_samples/NCO_BLOCK)
+
+    print(f"{n_samples} samples starting at t = {time_start} s")
+    print(f"{'signal':>8s} {'synthesis':>9s} {'dtype':>8s} {'time (s)':>9s} {'max error':>10s} {'bound':>9s}")
+    for label, signal_class in (("cosine", CosineWaveform), ("complex", ComplexSinusoidWaveform)):
+        expected = exact if signal_class is ComplexSinusoidWaveform else exact.real
+        for synthesis in ("direct", "nco"):
+            for dtype in (np.float64, np.float32):
+                signal = signal_class(
+                    1.0, frequency, 0.0, n_samples/sample_rate, time_start, sample_rate,
+                    synthesis=synthesis, dtype=dtype,
+                    )
+                elapsed = timeit.timeit(lambda: signal._sample_amplitudes(time_axis), number=1)
+                error = np.max(np.abs(signal._sample_amplitudes(time_axis) - expected))
+                limit = bound + 2*np.finfo(dtype).eps
+                print(f"{label:>8s} {synthesis:>9s} {np.dtype(dtype).name:>8s} {elapsed:9.4f} {error:10.2e} {limit if synthesis == 'nco' else np.nan:9.2e}")
+                if synthesis == "nco":
+                    assert error <= limit
+
+    n_pulses = 64
+    frequencies = 1e9 + np.arange(n_pulses)*1e6
+    time_starts = np.arange(n_pulses)*1e-3
+    print(f"\nburst of {n_pulses} pulses x {2**16} samples")
+    for analytic in (False, True):
+        results = {}
+        for synthesis in ("direct", "nco"):
+            run = lambda: synthesize_burst(1.0, frequencies, 0.3, time_starts, 2**16/8e9, 8e9, analytic=analytic, synthesis=synthesis)
+            results[synthesis] = (timeit.timeit(run, number=3)/3, run().samples)
+        speedup = results["direct"][0]/results["nco"][0]
+        error = np.max(np.abs(results["direct"][1] - results["nco"][1]))
+        print(f"analytic={analytic!s:5s} direct {results['direct'][0]:.4f} s, nco {results['nco'][0]:.4f} s, {speedup:.1f}x, max deviation {error:.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Memory of pulse descriptors and parameter records: one SineWaveform per
+pulse against the structured-array schedule, and SteppedFrequencyCW
+instances against slotted SteppedFrequencyParams records, as held by a
+sweep.
+
+Run with `python benchmarks/bench_params.py`.
+"""
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from pyrasim.sfcw import SteppedFrequencyCW
+
+RADAR = dict(
+    N_bursts=64, n_pulses=1024, target_range=40.0, target_velocity=0.0, freq_step_size=1e6,
+    freq_start=1e9, pulse_width=2e-6, pulse_repetion_interval=1e-5, transmitted_amplitude=1.0,
+    transmitted_relative_phase=0.0,
+    )
+
+
+def allocated(build):
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main(n_records: int = 100_000):
+    sfcw = SteppedFrequencyCW(**RADAR)
+    n = 16 * sfcw.n_pulses
+    waveforms, waveform_bytes = allocated(lambda: [sfcw.transmitted_waveform(i) for i in range(n)])
+    schedule, schedule_bytes = allocated(lambda: sfcw.schedule(16))
+    t_waveforms = timeit.timeit(lambda: [sfcw.transmitted_waveform(i) for i in range(n)], number=1)
+    t_schedule = timeit.timeit(lambda: sfcw.schedule(16), number=1)
+    assert np.allclose([w.frequency for w in waveforms[:sfcw.n_pulses]], -schedule["frequency"][:sfcw.n_pulses])
+    print(f"{n} pulses: SineWaveform {waveform_bytes/n:6.0f} B/pulse {t_waveforms:7.3f} s, "
+          f"schedule {schedule_bytes/n:4.0f} B/pulse {t_schedule:7.4f} s")
+
+    ranges = np.linspace(5, 140, n_records)
+    _, cw_bytes = allocated(lambda: [SteppedFrequencyCW(**{**RADAR, "target_range": r}) for r in ranges])
+    _, params_bytes = allocated(lambda: [SteppedFrequencyCW(**{**RADAR, "target_range": r}).params for r in ranges])
+    print(f"{n_records} records: SteppedFrequencyCW {cw_bytes/n_records:5.0f} B, "
+          f"SteppedFrequencyParams {params_bytes/n_records:5.0f} B")
+
+
+if __name__ == "__main__":
+    main()
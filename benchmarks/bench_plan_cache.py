@@ -0,0 +1,51 @@
+"""
+Shared processing plans: a serial SFCW sweep with plan_cache enabled against
+one that has to rebuild its constants at every point, plus range-Doppler
+processors built from a thread pool, with the cache statistics.
+
+Run with `python benchmarks/bench_plan_cache.py`.
+"""
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pyrasim.sfcw.doppler import RangeDopplerProcessor
+from pyrasim.sfcw.plans import plan_cache
+from pyrasim.sfcw.sweep import run_sweep
+
+BASE = dict(
+    N_bursts=4, n_pulses=1024, target_velocity=0.0, freq_step_size=1e6, freq_start=1e9,
+    pulse_width=2e-6, pulse_repetion_interval=1e-5, transmitted_amplitude=1.0,
+    transmitted_relative_phase=0.0,
+    )
+
+
+def sweep():
+    grid = {"target_range": list(np.linspace(5, 140, 400))}
+    for _ in run_sweep({k: v for k, v in BASE.items() if k != "target_range"}, grid, chunk_size=50):
+        pass
+
+
+def processors(n=64):
+    def build(_):
+        return RangeDopplerProcessor(1024, 512, 1e9, 1e6, 1e-5, range_window="kaiser", doppler_window="blackman")
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(build, range(n)))
+
+
+def main():
+    for name, run in (("sweep of 400 points", sweep), ("64 range-Doppler processors", processors)):
+        max_bytes = plan_cache.max_bytes
+        plan_cache.resize(0)
+        uncached = timeit.timeit(run, number=1)
+        plan_cache.resize(max_bytes)
+        plan_cache.clear()
+        plan_cache.reset_stats()
+        cached = timeit.timeit(run, number=1)
+        print(f"{name:28s} uncached {uncached:.3f} s, cached {cached:.3f} s ({uncached/cached:.1f}x)")
+        print(f"{'':28s} {plan_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Level-of-detail plotting: rendering a multi-million-sample waveform through
+its min/max envelope (waveform_figure) against handing every sample to
+matplotlib, plus the cost of re-decimating after a zoom. Both render
+off-screen with Agg.
+
+Run with `python benchmarks/bench_plot_lod.py`.
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from pyrasim.plot.mpl.time_domain import minmax_decimate, waveform_figure
+from pyrasim.signals import CosineWaveform
+
+
+def full_figure(waveform, path):
+    figure = Figure(figsize=(10, 4), dpi=100)
+    FigureCanvasAgg(figure)
+    figure.add_subplot().plot(np.asarray(waveform.time_axis), waveform.amplitude_axis)
+    figure.savefig(path)
+
+
+def measure(function, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    print(f"{'samples':>10s} {'full (s)':>9s} {'full MiB':>9s} {'lod (s)':>8s} {'lod MiB':>8s} {'zoom (ms)':>10s}")
+    for n_samples in (10**6, 5*10**6, 2*10**7):
+        # 20 MHz carrier at 200 MS/s with a slow amplitude ramp underneath
+        waveform = CosineWaveform(1.0, 20e6, 0.0, n_samples/200e6, 0.0, 200e6)
+        samples = waveform.amplitude_axis
+
+        # The envelope keeps the extremes of every column
+        indices, values = minmax_decimate(samples, 1000)
+        assert values.max() == samples.max() and values.min() == samples.min()
+
+        full = "skipped"
+        if n_samples <= 5*10**6:
+            _, elapsed, peak = measure(full_figure, waveform, os.path.join(directory, "full.png"))
+            full = f"{elapsed:9.2f} {peak/2**20:9.1f}"
+        figure, elapsed, peak = measure(waveform_figure, waveform, os.path.join(directory, "lod.png"))
+
+        ax = figure.axes[0]
+        start = time.perf_counter()
+        ax.set_xlim(waveform.duration*0.4, waveform.duration*0.41)
+        zoom = time.perf_counter() - start
+        points = len(ax.lines[0].get_xdata())
+        print(f"{n_samples:10d} {full:>19s} {elapsed:8.2f} {peak/2**20:8.1f} {zoom*1e3:10.2f}  ({points} points after zoom)")
+
+
+if __name__ == "__main__":
+    main()
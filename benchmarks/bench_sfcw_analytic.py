@@ -0,0 +1,40 @@
+"""
+Closed-form ("analytic") SFCW I/Q samples against time-domain synthesis:
+agreement of the two modes and speedup of the analytic one.
+
+Run with `python benchmarks/bench_sfcw_analytic.py`.
+"""
+import timeit
+
+import numpy as np
+
+from pyrasim.sfcw import SteppedFrequencyCW
+
+# Largest |time - analytic| allowed, relative to the transmitted amplitude;
+# the time-domain gate edges fall on whole samples, which costs about 1%
+TOLERANCE = 2e-2
+
+# (transmitted amplitude, transmitted phase) pairs checked
+SIGNALS = ((1.0, 0.0), (2.5, 0.3), (0.4, -2.0))
+
+
+def main(number: int = 3):
+    print(f"{'n_pulses':>8s} {'velocity':>9s} {'A':>5s} {'phase':>6s} {'rel error':>10s} "
+          f"{'time (s)':>10s} {'analytic (s)':>13s} {'speedup':>9s}")
+    for n_pulses in (64, 512):
+        for velocity in (0.0, 30.0, 3000.0):
+            for amplitude, phase in SIGNALS:
+                sfcw = SteppedFrequencyCW(8, n_pulses, 37, velocity, 1e5, 10e6, 2e-6, 1e-5, amplitude, phase)
+                time_domain = sfcw.iq_samples(mode="time")
+                analytic = sfcw.iq_samples(mode="analytic")
+                error = np.max(np.abs(time_domain - analytic))/amplitude
+
+                t_time = timeit.timeit(lambda: sfcw.iq_samples(mode="time"), number=1)
+                t_analytic = timeit.timeit(lambda: sfcw.iq_samples(mode="analytic"), number=number)/number
+                print(f"{n_pulses:8d} {velocity:9.1f} {amplitude:5.1f} {phase:6.1f} {error:10.2e} "
+                      f"{t_time:10.4f} {t_analytic:13.6f} {t_time/t_analytic:8.0f}x")
+                assert error < TOLERANCE, f"analytic mode disagrees with time mode: {error:.2e}"
+
+
+if __name__ == "__main__":
+    main()
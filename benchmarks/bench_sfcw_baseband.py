@@ -0,0 +1,35 @@
+"""
+SFCW range profiles from RF time-domain synthesis against complex baseband
+envelopes: samples per pulse, run time and agreement, for rising carriers.
+
+Run with `python benchmarks/bench_sfcw_baseband.py`.
+"""
+import timeit
+
+import numpy as np
+
+from pyrasim.sfcw import Scene, SteppedFrequencyCW
+
+
+def main(n_bursts: int = 4, n_pulses: int = 64):
+    scene = Scene(np.linspace(10, 140, 16), velocities=1.0, amplitudes=np.linspace(1, 0.2, 16))
+    print(f"{'f0 (GHz)':>8s} {'RF samples':>10s} {'BB samples':>10s} {'time (s)':>9s} {'baseband (s)':>12s} {'speedup':>8s} {'deviation':>10s}")
+    for freq_start in (2e8, 1e9, 5e9):
+        radar = SteppedFrequencyCW(
+            N_bursts=n_bursts, n_pulses=n_pulses, target_range=60.0, target_velocity=0.0,
+            freq_step_size=1e6, freq_start=freq_start, pulse_width=2e-6, pulse_repetion_interval=1e-5,
+            transmitted_amplitude=1.0, transmitted_relative_phase=0.0, scene=scene,
+            )
+        rf = radar.operate(mode="time").profiles
+        bb = radar.operate(mode="baseband").profiles
+        t_rf = timeit.timeit(lambda: radar.operate(mode="time"), number=1)
+        t_bb = timeit.timeit(lambda: radar.operate(mode="baseband"), number=3)/3
+        deviation = np.max(np.abs(rf - bb))/np.max(np.abs(rf))
+        print(
+            f"{freq_start/1e9:8.1f} {radar.received_burst().n_samples:10d} {radar.received_baseband_burst().n_samples:10d}"
+            f" {t_rf:9.4f} {t_bb:12.4f} {t_rf/t_bb:7.0f}x {deviation:10.1e}"
+            )
+
+
+if __name__ == "__main__":
+    main()
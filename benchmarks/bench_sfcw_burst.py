@@ -0,0 +1,32 @@
+"""
+Batched SFCW burst synthesis against one SineWaveform per pulse.
+
+Run with `python benchmarks/bench_sfcw_burst.py`.
+"""
+import timeit
+
+import numpy as np
+
+from pyrasim.signals import sinusoid
+from pyrasim.sfcw import SteppedFrequencyCW
+
+
+def per_pulse(sfcw: SteppedFrequencyCW):
+    return [sfcw.received_waveform(i).amplitude_axis for i in range(sfcw.n_pulses)]
+
+
+def main(number: int = 3):
+    print(f"{'n_pulses':>8s} {'per pulse (s)':>14s} {'burst (s)':>10s} {'speedup':>8s}")
+    for n_pulses in (16, 128, 1024, 4096):
+        sfcw = SteppedFrequencyCW(1, n_pulses, 30, 0, 1e5, 10e6, 1e-6, 4e-6, 1, 0)
+        sinusoid.sample_cache.clear()
+        assert np.allclose(sfcw.received_burst().samples, np.vstack(per_pulse(sfcw)))
+
+        sinusoid.sample_cache.clear()
+        t_pulse = timeit.timeit(lambda: per_pulse(sfcw), number=1)
+        t_burst = timeit.timeit(lambda: sfcw.received_burst(), number=number)/number
+        print(f"{n_pulses:8d} {t_pulse:14.4f} {t_burst:10.5f} {t_pulse/t_burst:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
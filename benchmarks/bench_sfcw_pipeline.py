@@ -0,0 +1,27 @@
+"""
+Throughput of the SFCW receive chain in range profiles per second.
+
+Run with `python benchmarks/bench_sfcw_pipeline.py`.
+"""
+import time
+
+from pyrasim.sfcw import SteppedFrequencyCW
+
+
+def profiles_per_second(sfcw: SteppedFrequencyCW, **kwargs) -> float:
+    start = time.perf_counter()
+    profile = sfcw.operate(**kwargs)
+    return profile.profiles.shape[0]/(time.perf_counter() - start)
+
+
+def main():
+    print(f"{'n_pulses':>8s} {'N_bursts':>8s} {'profiles/s':>12s}")
+    for n_pulses in (64, 256, 1024):
+        for n_bursts in (1, 16, 128):
+            sfcw = SteppedFrequencyCW(n_bursts, n_pulses, 30, 0, 1e5, 10e6, 1e-6, 4e-6, 1, 0)
+            rate = profiles_per_second(sfcw, pad_factor=2)
+            print(f"{n_pulses:8d} {n_bursts:8d} {rate:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
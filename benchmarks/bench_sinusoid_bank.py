@@ -0,0 +1,49 @@
+"""
+Summing and sampling K tones with SinusoidBank against pairwise
+Sinusoid.__add__ and per-tone sampling, on a uniform TimeAxis (phasor
+matrix products) and on a plain array of times (direct cosines).
+
+Run with `python benchmarks/bench_sinusoid_bank.py`.
+"""
+import functools
+import timeit
+
+import numpy as np
+
+from pyrasim.signals import Sinusoid, SinusoidBank, TimeAxis
+
+
+def pairwise(tones, time_axis):
+    total = functools.reduce(lambda a, b: a + b, tones)
+    return total._sample_amplitudes(time_axis)
+
+
+def per_tone(tones, time_axis):
+    return sum(tone._sample_amplitudes(time_axis) for tone in tones)
+
+
+def main(n_samples: int = 10_000):
+    rng = np.random.default_rng(0)
+    uniform = TimeAxis(0.0, 1e3, n_samples)
+    time_axis = np.asarray(uniform)
+    print(f"{'tones':>6s} {'distinct':>8s} {'per tone (s)':>13s} {'bank (s)':>9s} {'speedup':>8s} "
+          f"{'array (s)':>10s} {'speedup':>8s}")
+    for n_tones in (16, 256, 4096):
+        for distinct in (1, n_tones):
+            frequencies = rng.integers(1, distinct + 1, n_tones)*1.0
+            tones = [Sinusoid(a, f, p) for a, f, p in zip(rng.uniform(0, 1, n_tones), frequencies, rng.uniform(-np.pi, np.pi, n_tones))]
+            if distinct == 1:
+                assert np.allclose(pairwise(tones, time_axis), per_tone(tones, time_axis))
+            bank = lambda: SinusoidBank.from_sinusoids(tones).merged().sample(uniform)
+            array = lambda: SinusoidBank.from_sinusoids(tones).merged().sample(time_axis)
+            expected = per_tone(tones, time_axis)
+            assert np.allclose(bank(), expected) and np.allclose(array(), expected)
+            t_tone = timeit.timeit(lambda: per_tone(tones, time_axis), number=1)
+            t_bank = timeit.timeit(bank, number=1)
+            t_array = timeit.timeit(array, number=1)
+            print(f"{n_tones:6d} {distinct:8d} {t_tone:13.4f} {t_bank:9.4f} {t_tone/t_bank:7.1f}x "
+                  f"{t_array:10.4f} {t_tone/t_array:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Replay of simulated SFCW I/Q bursts over an in-process ZMQ PUB/SUB link into
+the ring buffer and range-profile processing.
+
+Run with `python benchmarks/bench_stream.py`.
+"""
+import threading
+import time
+
+import numpy as np
+
+from pyrasim.sfcw import SteppedFrequencyCW
+from pyrasim.sfcw.stream import BurstPublisher, BurstSubscriber, RingBuffer, inproc_pair
+
+
+def replay(n_pulses: int, n_bursts: int, chunk_bursts: int, policy: str = "block"):
+    sfcw = SteppedFrequencyCW(n_bursts, n_pulses, 30, 0, 1e5, 10e6, 1e-6, 4e-6, 1, 0)
+    chunks = list(sfcw.iq_chunks(chunk_bursts=chunk_bursts, mode="analytic"))
+    pub_socket, sub_socket = inproc_pair(f"bench-{n_pulses}-{chunk_bursts}-{policy}", hwm=16)
+    publisher = BurstPublisher(pub_socket, policy=policy)
+    subscriber = BurstSubscriber(sub_socket, RingBuffer(4*chunk_bursts, n_pulses))
+    # Let the subscription reach the publisher before sending
+    time.sleep(0.05)
+
+    profiles = 0
+    done = threading.Event()
+
+    def consume():
+        nonlocal profiles
+        while not done.is_set() or subscriber.receive(0):
+            subscriber.receive(10)
+            if len(subscriber.ring):
+                profiles += subscriber.range_profiles(sfcw.freq_step_size).profiles.shape[0]
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    publisher.publish_chunks(chunks)
+    done.set()
+    consumer.join()
+    pub_socket.close()
+    sub_socket.close()
+    return publisher.stats.as_dict(), subscriber.stats.as_dict(), profiles
+
+
+def main():
+    print(f"{'n_pulses':>8s} {'chunk':>6s} {'policy':>6s} {'bursts/s':>10s} {'MB/s':>8s} {'stalls':>7s} {'dropped':>8s} {'profiles':>9s}")
+    for n_pulses in (256, 4096):
+        for chunk_bursts in (1, 64):
+            for policy in ("block", "drop"):
+                sent, received, profiles = replay(n_pulses, 4096, chunk_bursts, policy)
+                print(
+                    f"{n_pulses:8d} {chunk_bursts:6d} {policy:>6s} {sent['bursts_per_second']:10.0f} "
+                    f"{sent['bytes_per_second']/1e6:8.1f} {sent['stalls']:7d} {sent['dropped']:8d} {profiles:9d}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Waveform.__add__/__mul__ against the per-sample loop merge they replaced.
+
+Run with `python benchmarks/bench_waveform_arithmetic.py`.
+"""
+import timeit
+
+import numpy as np
+
+from pyrasim.signals import CosineWaveform, ComplexSinusoidWaveform
+
+
+def legacy_combine(a, b, op):
+    """
+    Reference merge: float matching of the boundaries on the result time axis
+    followed by one Python-level iteration per sample.
+    """
+    start = min(a.time_start, b.time_start)
+    duration = max(a.time_end, b.time_end) - start
+    time_axis = np.arange(round(duration*a.sample_rate) + 1)/a.sample_rate + start
+    atol = 0.5/a.sample_rate
+    a_amp, b_amp = a.amplitude_axis, b.amplitude_axis
+    result = np.zeros(len(time_axis), dtype=np.result_type(a_amp, b_amp))
+
+    s_i = np.isclose(time_axis, a.time_axis[0], rtol=0, atol=atol).nonzero()[0][0]
+    s_j = np.isclose(time_axis, a.time_axis[-1], rtol=0, atol=atol).nonzero()[0][0]
+    o_i = np.isclose(time_axis, b.time_axis[0], rtol=0, atol=atol).nonzero()[0][0]
+    o_j = np.isclose(time_axis, b.time_axis[-1], rtol=0, atol=atol).nonzero()[0][0]
+
+    for r_k in range(len(result)):
+        in_a = s_i <= r_k <= s_j
+        in_b = o_i <= r_k <= o_j
+        if in_a and in_b:
+            result[r_k] = op(a_amp[r_k - s_i], b_amp[r_k - o_i])
+        elif in_a:
+            result[r_k] = a_amp[r_k - s_i]
+        elif in_b:
+            result[r_k] = b_amp[r_k - o_i]
+    return result
+
+
+def cases(n_samples: int):
+    """
+    The four overlap layouts of Waveform.__add__, for real and complex waveforms.
+    """
+    sample_rate = 1e6
+    duration = n_samples/sample_rate
+    layouts = {
+        "overlap_right": (0.0, duration/2),
+        "disjoint_right": (0.0, 2*duration),
+        "overlap_left": (duration/2, 0.0),
+        "disjoint_left": (2*duration, 0.0),
+    }
+    for name, (a_start, b_start) in layouts.items():
+        for kind in (CosineWaveform, ComplexSinusoidWaveform):
+            a = kind(1.0, 1e3, 0.0, duration, a_start, sample_rate)
+            b = kind(0.5, 2e3, 0.3, duration, b_start, sample_rate)
+            yield f"{name}/{kind.__name__}", a, b
+
+
+def main(n_samples: int = 200_000, number: int = 3):
+    print(f"{'case':48s} {'op':>4s} {'legacy (s)':>11s} {'vector (s)':>11s} {'speedup':>8s}")
+    for name, a, b in cases(n_samples):
+        for symbol, op in (("+", np.add), ("*", np.multiply)):
+            expected = legacy_combine(a, b, op)
+            result = op(a, b).amplitude_axis
+            n = min(len(result), len(expected))
+            assert np.allclose(result[:n], expected[:n])
+
+            t_legacy = timeit.timeit(lambda: legacy_combine(a, b, op), number=1)
+            t_vector = timeit.timeit(lambda: op(a, b), number=number)/number
+            print(f"{name:48s} {symbol:>4s} {t_legacy:11.4f} {t_vector:11.5f} {t_legacy/t_vector:8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark cases of harness.py: sinusoid synthesis, waveform arithmetic and
+SFCW pulse generation. Samples are cached by default, so cases timing the
+synthesis clear sample_cache on every call.
+"""
+import numpy as np
+
+from harness import CASES, case  # noqa: F401
+from pyrasim.signals import ComplexSinusoidWaveform, CosineWaveform, SineWaveform, sample_cache
+from pyrasim.sfcw import SteppedFrequencyCW
+
+KINDS = {"cosine": CosineWaveform, "sine": SineWaveform, "complex": ComplexSinusoidWaveform}
+
+# Start of the second operand of __add__/__mul__, in durations of the first
+LAYOUTS = {"overlap_right": 0.5, "disjoint_right": 2.0, "overlap_left": -0.5, "disjoint_left": -2.0}
+
+
+@case(kind=["cosine", "sine"], sample_rate=[1e6, 1e7, 1e8])
+def construct(kind, sample_rate, duration=1e-2):
+    """
+    Construction of a real waveform and synthesis of its samples.
+    """
+    def run():
+        sample_cache.clear()
+        return KINDS[kind](1.0, 1e5, 0.3, duration, 0.0, sample_rate).amplitude_axis
+    return run, len(run())
+
+
+@case(cached=[False, True], n_samples=[10**4, 10**6])
+def amplitude_axis(cached, n_samples, sample_rate=1e7):
+    """
+    ComplexSinusoidWaveform.amplitude_axis, synthesized or read back from
+    sample_cache.
+    """
+    waveform = ComplexSinusoidWaveform(1.0, 1e5, 0.3, n_samples/sample_rate, 0.0, sample_rate)
+
+    def run():
+        if not cached:
+            sample_cache.clear()
+        return waveform.amplitude_axis
+    return run, n_samples
+
+
+@case(layout=list(LAYOUTS), op=["add", "mul"], kind=["cosine", "complex"], n_samples=[10**5])
+def arithmetic(layout, op, kind, n_samples, sample_rate=1e6):
+    """
+    Waveform.__add__/__mul__ of two waveforms in each overlap layout, on
+    cached operand samples.
+    """
+    duration = n_samples/sample_rate
+    start = LAYOUTS[layout]*duration
+    a = KINDS[kind](1.0, 1e3, 0.0, duration, max(-start, 0.0), sample_rate)
+    b = KINDS[kind](0.5, 2e3, 0.3, duration, max(start, 0.0), sample_rate)
+    function = {"add": np.add, "mul": np.multiply}[op]
+
+    def run():
+        return function(a, b).amplitude_axis
+    return run, len(run())
+
+
+def _radar(n_pulses):
+    return SteppedFrequencyCW(1, n_pulses, 30, 0, 1e5, 10e6, 1e-6, 4e-6, 1, 0)
+
+
+@case(n_pulses=[16, 128, 1024])
+def sfcw_pulses(n_pulses):
+    """
+    SteppedFrequencyCW transmitted pulses generated one SineWaveform at a
+    time, each synthesized through sample_cache.
+    """
+    sfcw = _radar(n_pulses)
+
+    def run():
+        sample_cache.clear()
+        return [sfcw.transmitted_waveform(i).amplitude_axis for i in range(n_pulses)]
+    return run, sum(len(pulse) for pulse in run())
+
+
+@case(n_pulses=[16, 128, 1024])
+def sfcw_burst(n_pulses):
+    """
+    The same pulses synthesized as one batched burst.
+    """
+    sfcw = _radar(n_pulses)
+
+    def run():
+        return sfcw.transmitted_burst().samples
+    return run, run().size
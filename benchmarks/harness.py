@@ -0,0 +1,157 @@
+"""
+Benchmark harness for the hot paths of the library, runnable offline with
+the standard library only.
+
+Cases are functions registered with @case(param=[values, ...], ...), run
+once for every combination of the parameters, as pytest.mark.parametrize
+or asv params would. A case gets its parameters as keyword arguments and
+returns the callable to time and the number of samples it produces per
+call. Each one is timed (best of `repeat`), reported in samples/s, and run
+once more under tracemalloc for its peak memory (numpy buffers included).
+
+Results are compared against the stored baselines (baselines.json next to
+this file) and a case that got slower than `tolerance` or allocates more
+than before is reported as a regression, with a non-zero exit status.
+Baselines depend on the machine: refresh them with --save after changes
+that are meant to move them.
+
+Run with `python benchmarks/harness.py [-k filter] [--save]`.
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+# Seconds each timing repeat runs for at least
+MIN_REPEAT_TIME = 0.1
+
+# Allocations below this are never reported as a memory regression
+MEMORY_SLACK = 64 * 2**10
+
+CASES: List["Case"] = []
+
+
+@dataclass
+class Case:
+    name: str
+    function: Callable[..., Tuple[Callable[[], object], int]]
+    params: Dict
+
+    @property
+    def id(self) -> str:
+        if not self.params:
+            return self.name
+        values = (f"{k}={v:g}" if isinstance(v, float) else f"{k}={v}" for k, v in self.params.items())
+        return f"{self.name}[{','.join(values)}]"
+
+
+def case(**params):
+    """
+    Register a benchmark case for every combination of `params`.
+    """
+    def register(function):
+        names = list(params)
+        for values in itertools.product(*(params[name] for name in names)):
+            CASES.append(Case(function.__name__, function, dict(zip(names, values))))
+        return function
+    return register
+
+
+@dataclass
+class Result:
+    seconds: float
+    samples: int
+    peak_bytes: int
+
+    @property
+    def samples_per_second(self) -> float:
+        return self.samples/self.seconds
+
+    def as_dict(self) -> Dict:
+        return {"seconds": self.seconds, "samples_per_second": self.samples_per_second, "peak_bytes": self.peak_bytes}
+
+
+def measure(bench: Case, repeat: int = 5) -> Result:
+    run, samples = bench.function(**bench.params)
+    run()
+    timer = timeit.Timer(run)
+    number = 1
+    while timer.timeit(number) < MIN_REPEAT_TIME and number < 10**6:
+        number *= 2
+    seconds = min(timer.repeat(repeat, number))/number
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(seconds, samples, peak)
+
+
+def regressions(result: Result, baseline: Dict, tolerance: float) -> List[str]:
+    found = []
+    if result.seconds > baseline["seconds"]*(1 + tolerance):
+        found.append(f"time {result.seconds/baseline['seconds']:.2f}x")
+    if result.peak_bytes > baseline["peak_bytes"]*(1 + tolerance) + MEMORY_SLACK:
+        found.append(f"memory {result.peak_bytes/2**20:.2f} MiB vs {baseline['peak_bytes']/2**20:.2f} MiB")
+    return found
+
+
+def load_baselines(path: str) -> Dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baselines(path: str, baselines: Dict):
+    with open(path, "w") as f:
+        json.dump(dict(sorted(baselines.items())), f, indent=2)
+        f.write("\n")
+
+
+def main(argv=None) -> int:
+    # Imported here: cases registers into the harness module, not __main__
+    from cases import CASES as registered
+
+    parser = argparse.ArgumentParser(description="Run the benchmark cases and compare them with the baselines.")
+    parser.add_argument("-k", dest="filter", default="", help="Only run cases whose id contains this text.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repeats, the best one is kept.")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative slowdown or memory growth.")
+    parser.add_argument("--baselines", default=BASELINES, help="Baselines JSON file.")
+    parser.add_argument("--save", action="store_true", help="Store the results as the new baselines.")
+    args = parser.parse_args(argv)
+
+    baselines = load_baselines(args.baselines)
+    failed = 0
+    print(f"{'case':72s} {'time (s)':>10s} {'samples/s':>10s} {'peak MiB':>9s} {'vs base':>8s}")
+    for bench in registered:
+        if args.filter not in bench.id:
+            continue
+        result = measure(bench, args.repeat)
+        baseline = baselines.get(bench.id)
+        ratio = f"{result.seconds/baseline['seconds']:.2f}x" if baseline else "new"
+        print(f"{bench.id:72s} {result.seconds:10.2e} {result.samples_per_second:10.3g} "
+              f"{result.peak_bytes/2**20:9.2f} {ratio:>8s}")
+        if baseline and not args.save:
+            for message in regressions(result, baseline, args.tolerance):
+                print(f"    REGRESSION {message}")
+                failed += 1
+        baselines[bench.id] = result.as_dict()
+
+    if args.save:
+        save_baselines(args.baselines, baselines)
+        print(f"Baselines saved to {args.baselines}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,11 @@ from .config import (
     get_argument_parser,
     parse_cli_args,
 )
+from .commands import sfcw_command
+
+commands: Dict[str, Callable[[ArgumentParser, Namespace], None]] = {
+    "sfcw": sfcw_command,
+}
 
 def main():
     parser: ArgumentParser = get_argument_parser()
@@ -21,15 +26,21 @@ def main():
         from pyrasim.version import PACKAGE_VERSION
         print(PACKAGE_VERSION)
         return
-    # if args.command in commands:
-    #     if hasattr(args, "suppress_progress") and args.suppress_progress is False:
-    #         from .utility import register_progress
-    #         register_progress()
-    #     try:
-    #         commands[args.command](parser, args)
-    #     except KeyboardInterrupt:
-    #         return
-    #     except Exception:
-    #         print(format_exc())
+    if args.command in commands:
+        # The commands only write files, never plots
+        from pyrasim.plot import set_headless
+        set_headless()
+        try:
+            if args.profile:
+                from pyrasim.instrumentation import profile_run
+                with profile_run(args.profile_output, "cprofile" in args.profile_with, "tracemalloc" in args.profile_with):
+                    commands[args.command](parser, args)
+            else:
+                commands[args.command](parser, args)
+        except KeyboardInterrupt:
+            return
+        except Exception:
+            print(format_exc())
+            sys.exit(1)
     else:
         parser.print_help()
@@ -0,0 +1,120 @@
+from argparse import (
+    ArgumentParser,
+    Namespace,
+)
+import os
+import sys
+from typing import (
+    Dict,
+    List,
+)
+
+MHZ: float = 1e6
+US: float = 1e-6
+PRECISIONS: Dict[str, str] = {"single": "float32", "double": "float64"}
+
+def sfcw_grid(args: Namespace) -> Dict[str, List[float]]:
+    """
+    Swept SteppedFrequencyCW fields from the command line arguments.
+    """
+    grid = {
+        "target_range": args.target_range,
+        "target_velocity": args.target_velocity,
+        "freq_step_size": [step*MHZ for step in args.frequency_step],
+    }
+    if args.n_pulses is not None:
+        grid["n_pulses"] = [int(n) for n in args.n_pulses]
+    return grid
+
+def sfcw_base(args: Namespace) -> Dict:
+    """
+    SteppedFrequencyCW arguments shared by every sweep point.
+    """
+    base = dict(
+        N_bursts=args.n_bursts,
+        target_range=0,
+        target_velocity=0,
+        freq_step_size=args.frequency_step[0]*MHZ,
+        freq_start=args.start_frequency*MHZ,
+        pulse_width=args.pulse_width*US,
+        pulse_repetion_interval=args.pulse_repetition_interval*US,
+        transmitted_amplitude=1,
+        transmitted_relative_phase=0,
+        dtype=PRECISIONS[args.precision],
+    )
+    if args.n_pulses is None:
+        base["n_pulses"] = int(round((args.end_frequency - args.start_frequency)/args.frequency_step[0])) + 1
+    return base
+
+def output_path(args: Namespace, default_name: str, extension: str) -> str:
+    name = args.output_name[0] or default_name
+    return os.path.join(args.output_dir, f"{name}.{extension}")
+
+def check_sfcw_args(parser: ArgumentParser, args: Namespace):
+    """
+    Report the argument combinations argparse cannot check on its own as
+    usage errors (exit status 2).
+    """
+    from pyrasim.output import TABLE_WRITERS
+    from pyrasim.output.tables import BinaryWriter
+
+    if args.n_pulses is None and len(args.frequency_step) > 1:
+        parser.error("--n-pulses is required when sweeping --frequency-step")
+    if args.output_profiles and args.n_pulses is not None and len(args.n_pulses) > 1:
+        parser.error("--output-profiles requires a single --n-pulses")
+    if args.output_format not in TABLE_WRITERS:
+        parser.error(f"--output-format must be one of {', '.join(TABLE_WRITERS)}")
+    if TABLE_WRITERS[args.output_format] is BinaryWriter and not args.output:
+        parser.error(f"--output-format {args.output_format} requires --output-to")
+    # 0 is the documented "one per CPU"
+    if args.jobs < 0:
+        parser.error("--jobs must be a positive integer, or 0 for one per CPU")
+
+def sfcw_command(parser: ArgumentParser, args: Namespace):
+    from pyrasim.output import RawArrayWriter, TABLE_WRITERS, get_table_writer
+    from pyrasim.sfcw.sweep import COLUMNS, grid_size, run_sweep
+
+    check_sfcw_args(parser, args)
+    grid = sfcw_grid(args)
+    total = grid_size(grid)
+    done = 0
+
+    table_path = None
+    if args.output:
+        os.makedirs(args.output_dir, exist_ok=True)
+        table_path = output_path(args, "sfcw", TABLE_WRITERS[args.output_format].extension)
+    table = get_table_writer(args.output_format, COLUMNS, table_path, args.output_significant_digits)
+    profiles = None
+    if args.output_profiles:
+        os.makedirs(args.output_dir, exist_ok=True)
+        profiles = RawArrayWriter(
+            output_path(args, "sfcw_profiles", "bin"),
+            dtype=PRECISIONS[args.precision],
+            metadata={"grid": grid, "pad_factor": args.pad_factor},
+            )
+
+    # The profiles file gets its sidecar even if the sweep fails midway
+    try:
+        with table:
+            for rows, magnitudes in run_sweep(
+                    sfcw_base(args),
+                    grid,
+                    jobs=args.jobs,
+                    chunk_size=args.chunk_size,
+                    mode=args.mode,
+                    pad_factor=args.pad_factor,
+                    profiles=profiles is not None,
+                    ):
+                table.write_rows(rows)
+                if profiles is not None:
+                    if profiles.rows == 0:
+                        profiles.row_shape = (len(magnitudes[0]),)
+                    profiles.append(magnitudes)
+                done += len(rows)
+                if not args.suppress_progress:
+                    print(f"\r{done}/{total}", end="", file=sys.stderr, flush=True)
+    finally:
+        if profiles is not None:
+            profiles.close()
+    if not args.suppress_progress:
+        print(file=sys.stderr)
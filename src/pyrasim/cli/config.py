@@ -12,6 +12,19 @@ from typing import (
     Optional,
 )
 
+from pyrasim.constants import SIMULATION_MODES
+
+def sweep_values(text: str) -> List[float]:
+    """
+    Parse a sweep specification: a single value, a comma separated list
+    ("10,20,40") or an inclusive range "start:stop:step" ("10:50:10").
+    """
+    if ":" in text:
+        start, stop, step = (float(value) for value in text.split(":"))
+        count = int(round((stop - start)/step)) + 1
+        return [start + i*step for i in range(count)]
+    return [float(value) for value in text.split(",")]
+
 def add_input_args(parser: ArgumentParser):
     parser.add_argument(
         "--start-frequency",
@@ -34,11 +47,108 @@ def add_input_args(parser: ArgumentParser):
     parser.add_argument(
         "--frequency-step",
         "-fs",
+        metavar="SWEEP",
+        type=sweep_values,
+        dest="frequency_step",
+        default=[10.0],
+        help="Frequency Step (MHz). Accepts a sweep: 'value', 'a,b,c' or 'start:stop:step'.",
+    )
+    parser.add_argument(
+        "--n-pulses",
+        "-n",
+        metavar="SWEEP",
+        type=sweep_values,
+        dest="n_pulses",
+        default=None,
+        help="Number of frequency steps (N). Defaults to the steps between the start and end frequencies.",
+    )
+    parser.add_argument(
+        "--target-range",
+        "-tr",
+        metavar="SWEEP",
+        type=sweep_values,
+        dest="target_range",
+        default=[10.0],
+        help="Target range (m). Accepts a sweep.",
+    )
+    parser.add_argument(
+        "--target-velocity",
+        "-tv",
+        metavar="SWEEP",
+        type=sweep_values,
+        dest="target_velocity",
+        default=[0.0],
+        help="Target velocity (ms-1). Accepts a sweep.",
+    )
+    parser.add_argument(
+        "--n-bursts",
+        "-nb",
+        metavar="INTEGER",
+        type=int,
+        dest="n_bursts",
+        default=1,
+        help="Number of bursts.",
+    )
+    parser.add_argument(
+        "--pulse-width",
+        "-pw",
         metavar="FLOAT",
         type=float,
-        dest="frequency_step",
-        default=10,
-        help="Frequency Step (MHz).",
+        dest="pulse_width",
+        default=1,
+        help="Pulse width (us).",
+    )
+    parser.add_argument(
+        "--pulse-repetition-interval",
+        "-pri",
+        metavar="FLOAT",
+        type=float,
+        dest="pulse_repetition_interval",
+        default=4,
+        help="Pulse repetition interval (us).",
+    )
+    parser.add_argument(
+        "--mode",
+        metavar="STRING",
+        type=str,
+        dest="mode",
+        choices=SIMULATION_MODES,
+        default="analytic",
+        help="Simulation mode: 'analytic' (closed form), 'time' (time-domain synthesis) or 'baseband' (synthesis of the complex envelopes). Defaults to 'analytic'.",
+    )
+    parser.add_argument(
+        "--pad-factor",
+        metavar="INTEGER",
+        type=int,
+        dest="pad_factor",
+        default=4,
+        help="Zero-padding factor of the range profile IFFT.",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        metavar="INTEGER",
+        type=int,
+        dest="jobs",
+        default=1,
+        help="Number of worker processes, 0 for one per CPU. Defaults to 1.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        metavar="INTEGER",
+        type=int,
+        dest="chunk_size",
+        default=16,
+        help="Sweep points per work unit sent to a worker.",
+    )
+    parser.add_argument(
+        "--precision",
+        metavar="STRING",
+        type=str,
+        dest="precision",
+        choices=("single", "double"),
+        default="double",
+        help="Sample precision: 'single' (float32/complex64) or 'double' (float64/complex128). Defaults to 'double'.",
     )
 
 def add_output_args(
@@ -59,7 +169,7 @@ def add_output_args(
         dest="output_format",
         type=str,
         default="markdown",
-        help="The output format to use: 'markdown'/'md', 'csv', 'json', or 'latex'/'tex'. Defaults to 'markdown'.",
+        help="The output format to use: 'markdown'/'md', 'csv', 'json', 'latex'/'tex' or 'binary'/'bin' (raw float64 rows with a JSON sidecar). Defaults to 'markdown'.",
     )
     parser.add_argument(
         "--output-name",
@@ -89,6 +199,13 @@ def add_output_args(
         default=".",
         help="The path to the output directory. Defaults to the current working directory.",
     )
+    parser.add_argument(
+        "--output-profiles",
+        "-op",
+        dest="output_profiles",
+        action="store_true",
+        help="Also stream the range profile magnitude of every point to a raw binary file with a JSON sidecar in the output directory.",
+    )
     parser.add_argument(
         "--suppress-progress",
         dest="suppress_progress",
@@ -127,4 +244,28 @@ def get_argument_parser() -> ArgumentParser:
         dest="version",
         help="Print the current version.",
     )
+    parser.add_argument(
+        "--profile",
+        dest="profile",
+        action="store_true",
+        help="Time the synthesis, arithmetic and SFCW stages and dump the statistics as JSON to the profile output.",
+    )
+    parser.add_argument(
+        "--profile-output",
+        metavar="STRING",
+        type=str,
+        dest="profile_output",
+        default="pyrasim_profile.json",
+        help="The path of the --profile report. Defaults to 'pyrasim_profile.json'.",
+    )
+    parser.add_argument(
+        "--profile-with",
+        metavar="STRING",
+        type=str,
+        action="append",
+        choices=("cprofile", "tracemalloc"),
+        dest="profile_with",
+        default=[],
+        help="Also run the profiled command under 'cprofile' or 'tracemalloc' and add their summaries to the report. Can be repeated.",
+    )
     return parser
@@ -1 +1,5 @@
-LIGHT_SPEED = 2.998e8
\ No newline at end of file
+LIGHT_SPEED = 2.998e8
+
+# Ways SteppedFrequencyCW simulates the I/Q samples, see iq_samples(); kept
+# here so the CLI can list them without importing numpy
+SIMULATION_MODES = ("time", "analytic", "baseband")
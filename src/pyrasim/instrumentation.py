@@ -0,0 +1,218 @@
+import atexit
+import json
+import os
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Optional
+
+# Set to 1 to collect stage statistics, or to a path to also dump them there at exit
+PROFILE_ENV = "PYRASIM_PROFILE"
+
+# Entries kept in the cProfile and tracemalloc sections of a report
+REPORT_TOP = 30
+
+_enabled = False
+_lock = threading.Lock()
+# name -> [calls, seconds, samples, bytes]
+_stages: Dict[str, list] = {}
+
+
+class _Stage:
+    """
+    Times one pass through a stage; record() adds the samples and bytes it
+    produced.
+    """
+    __slots__ = ("name", "samples", "nbytes", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.samples = 0
+        self.nbytes = 0
+
+    def record(self, samples: int, nbytes: int = 0):
+        self.samples += samples
+        self.nbytes += nbytes
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _add(self.name, perf_counter() - self.start, self.samples, self.nbytes)
+
+
+class _NullStage:
+    """
+    Stage handed out while instrumentation is disabled: does nothing.
+    """
+    __slots__ = ()
+
+    def record(self, samples: int, nbytes: int = 0):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+def _add(name: str, seconds: float, samples: int, nbytes: int, calls: int = 1):
+    with _lock:
+        totals = _stages.setdefault(name, [0, 0.0, 0, 0])
+        totals[0] += calls
+        totals[1] += seconds
+        totals[2] += samples
+        totals[3] += nbytes
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    with _lock:
+        _stages.clear()
+
+
+def stage(name: str):
+    """
+    Context manager timing a pass through stage `name`:
+
+        with instrumentation.stage("signals.synthesis") as s:
+            samples = ...
+            s.record(samples.size, samples.nbytes)
+
+    While instrumentation is disabled, a shared no-op stage is returned, so
+    the cost left in the hot paths is one flag test.
+    """
+    return _Stage(name) if _enabled else _NULL_STAGE
+
+
+def count(name: str, samples: int = 0, nbytes: int = 0):
+    """
+    Count an event of stage `name` without timing it.
+    """
+    if _enabled:
+        _add(name, 0.0, samples, nbytes)
+
+
+def report() -> Dict:
+    """
+    Statistics of every stage since the last reset().
+    """
+    with _lock:
+        stages = {name: list(totals) for name, totals in sorted(_stages.items())}
+    return {
+        name: {
+            "calls": calls,
+            "seconds": seconds,
+            "samples": samples,
+            "bytes": nbytes,
+            "samples_per_second": samples/seconds if seconds > 0 else None,
+        }
+        for name, (calls, seconds, samples, nbytes) in stages.items()
+    }
+
+
+def dump(path: str, extra: Optional[Dict] = None):
+    """
+    Write report() (plus the `extra` sections) as JSON to `path`.
+    """
+    with open(path, "w") as f:
+        json.dump({"stages": report(), **(extra or {})}, f, indent=2)
+        f.write("\n")
+
+
+def _cprofile_summary(profiler: "cProfile.Profile") -> list:
+    import pstats
+
+    stats = pstats.Stats(profiler).stats
+    rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:REPORT_TOP]
+    return [
+        {
+            "function": f"{filename}:{line}({function})",
+            "calls": calls,
+            "total_seconds": total,
+            "cumulative_seconds": cumulative,
+        }
+        for (filename, line, function), (_, calls, total, cumulative, _) in rows
+    ]
+
+
+def _tracemalloc_summary(snapshot: tracemalloc.Snapshot, peak: int) -> Dict:
+    return {
+        "peak_bytes": peak,
+        "top": [
+            {"location": str(stat.traceback), "bytes": stat.size, "count": stat.count}
+            for stat in snapshot.statistics("lineno")[:REPORT_TOP]
+        ],
+    }
+
+
+@contextmanager
+def profile_run(path: Optional[str] = None, cprofile: bool = False, memory: bool = False):
+    """
+    Collect stage statistics over one run, optionally under cProfile and
+    tracemalloc, and dump them as JSON to `path`. The previous enabled state
+    is restored afterwards. Only this process is covered: stages run in
+    worker processes are not collected.
+
+    Args:
+        path: JSON report, None to only keep the statistics in memory
+        cprofile: add the top functions by cumulative time
+        memory: add the tracemalloc peak and top allocation sites
+    """
+    # Profiling modules are only loaded when asked for
+    import cProfile
+
+    was_enabled = _enabled
+    enable()
+    reset()
+    profiler = cProfile.Profile() if cprofile else None
+    if memory:
+        tracemalloc.start()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        extra = {}
+        if profiler is not None:
+            profiler.disable()
+            extra["cprofile"] = _cprofile_summary(profiler)
+        if memory:
+            _, peak = tracemalloc.get_traced_memory()
+            extra["tracemalloc"] = _tracemalloc_summary(tracemalloc.take_snapshot(), peak)
+            tracemalloc.stop()
+        if path is not None:
+            dump(path, extra)
+        if not was_enabled:
+            disable()
+
+
+def _from_environment():
+    setting = os.environ.get(PROFILE_ENV, "")
+    if setting in ("", "0"):
+        return
+    enable()
+    if setting != "1":
+        atexit.register(dump, setting)
+
+
+_from_environment()
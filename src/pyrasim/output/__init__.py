@@ -0,0 +1,2 @@
+from .arrays import RawArrayWriter, load_raw
+from .tables import TableWriter, get_table_writer, TABLE_WRITERS
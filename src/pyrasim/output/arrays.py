@@ -0,0 +1,82 @@
+import json
+from typing import (
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+import numpy.typing as npt
+
+
+def sidecar_path(path: str) -> str:
+    return path + ".json"
+
+
+class RawArrayWriter:
+    """
+    Appends blocks of rows to a raw, C-ordered binary file as they are
+    produced, so arrays larger than memory (I/Q matrices, range profiles) can
+    be written incrementally.
+
+    On close a JSON sidecar `<path>.json` records dtype, shape and any
+    metadata, which is all np.memmap needs to map the file back; see
+    load_raw.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            dtype: npt.DTypeLike,
+            row_shape: Tuple[int, ...] = (),
+            columns: Optional[Sequence[str]] = None,
+            metadata: Optional[Dict] = None,
+            ):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.row_shape = tuple(row_shape)
+        self.columns = None if columns is None else list(columns)
+        self.metadata = metadata or {}
+        self.rows = 0
+        self.stream = open(path, "wb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, block: npt.ArrayLike):
+        """
+        Append one row or a (rows, *row_shape) block.
+        """
+        block = np.ascontiguousarray(block, dtype=self.dtype).reshape((-1,) + self.row_shape)
+        self.stream.write(block.tobytes())
+        self.rows += len(block)
+
+    def close(self):
+        if self.stream.closed:
+            return
+        self.stream.close()
+        with open(sidecar_path(self.path), "w") as sidecar:
+            json.dump({
+                "dtype": self.dtype.str,
+                "shape": [self.rows, *self.row_shape],
+                "order": "C",
+                "columns": self.columns,
+                "metadata": self.metadata,
+            }, sidecar, indent=2)
+
+
+def load_raw(path: str, mode: str = "r") -> np.ndarray:
+    """
+    Memory-map a file written by RawArrayWriter. A file without rows cannot
+    be mapped, so an empty array of the recorded dtype and shape is returned.
+    """
+    with open(sidecar_path(path)) as sidecar:
+        header = json.load(sidecar)
+    dtype, shape = np.dtype(header["dtype"]), tuple(header["shape"])
+    if shape[0] == 0:
+        return np.empty(shape, dtype=dtype, order=header["order"])
+    return np.memmap(path, dtype=dtype, mode=mode, shape=shape, order=header["order"])
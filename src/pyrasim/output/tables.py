@@ -0,0 +1,182 @@
+import csv
+import json
+import sys
+from abc import ABC, abstractmethod
+from typing import (
+    IO,
+    Iterable,
+    Optional,
+    Sequence,
+)
+
+import numpy as np
+
+from .arrays import RawArrayWriter
+
+
+class TableWriter(ABC):
+    """
+    Streams table rows to a text stream as they are produced. Nothing but the
+    current row is held in memory.
+
+    Use as a context manager, or call close() once every row is written.
+    """
+    extension: str = "txt"
+
+    def __init__(self, stream: IO, columns: Sequence[str], significant_digits: int = 6):
+        self.stream = stream
+        self.columns = list(columns)
+        self.significant_digits = significant_digits
+        self.rows = 0
+        self.write_header()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def format_value(self, value) -> str:
+        if isinstance(value, (int, np.integer)):
+            return str(value)
+        return f"{value:.{self.significant_digits}g}"
+
+    def write_header(self):
+        pass
+
+    @abstractmethod
+    def write_row(self, row: Sequence):
+        pass
+
+    def write_rows(self, rows: Iterable[Sequence]):
+        for row in rows:
+            self.write_row(row)
+            self.rows += 1
+        self.stream.flush()
+
+    def write_footer(self):
+        pass
+
+    def close(self):
+        self.write_footer()
+        self.stream.flush()
+        if self.stream not in (sys.stdout, sys.stderr):
+            self.stream.close()
+
+
+class MarkdownWriter(TableWriter):
+    extension = "md"
+
+    def write_header(self):
+        self.stream.write("| " + " | ".join(self.columns) + " |\n")
+        self.stream.write("|" + "---|"*len(self.columns) + "\n")
+
+    def write_row(self, row: Sequence):
+        self.stream.write("| " + " | ".join(self.format_value(value) for value in row) + " |\n")
+
+
+class CSVWriter(TableWriter):
+    extension = "csv"
+
+    def write_header(self):
+        self.writer = csv.writer(self.stream)
+        self.writer.writerow(self.columns)
+
+    def write_row(self, row: Sequence):
+        self.writer.writerow([self.format_value(value) for value in row])
+
+
+class JSONWriter(TableWriter):
+    """
+    A JSON array of one object per row, written incrementally. Values that
+    are not finite are written as null.
+    """
+    extension = "json"
+
+    def write_header(self):
+        self.stream.write("[")
+
+    def json_value(self, value):
+        if isinstance(value, (int, np.integer)):
+            return int(value)
+        # NaN and infinities have no JSON literal
+        if not np.isfinite(value):
+            return None
+        return float(self.format_value(value))
+
+    def write_row(self, row: Sequence):
+        record = {column: self.json_value(value) for column, value in zip(self.columns, row)}
+        self.stream.write(("," if self.rows else "") + "\n  " + json.dumps(record, allow_nan=False))
+
+    def write_footer(self):
+        self.stream.write("\n]\n")
+
+
+class LatexWriter(TableWriter):
+    extension = "tex"
+
+    def write_header(self):
+        self.stream.write("\\begin{tabular}{" + "r"*len(self.columns) + "}\n")
+        self.stream.write(" & ".join(column.replace("_", "\\_") for column in self.columns) + " \\\\\n\\hline\n")
+
+    def write_row(self, row: Sequence):
+        self.stream.write(" & ".join(self.format_value(value) for value in row) + " \\\\\n")
+
+    def write_footer(self):
+        self.stream.write("\\end{tabular}\n")
+
+
+class BinaryWriter(TableWriter):
+    """
+    Rows appended as raw float64 records to `<path>` with a JSON sidecar
+    describing the columns; see RawArrayWriter.
+    """
+    extension = "bin"
+
+    def __init__(self, path: str, columns: Sequence[str], significant_digits: int = 6):
+        self.array = RawArrayWriter(path, dtype=np.float64, row_shape=(len(columns),), columns=columns)
+        super().__init__(self.array.stream, columns, significant_digits)
+
+    def write_row(self, row: Sequence):
+        self.array.append(row)
+
+    def write_rows(self, rows: Iterable[Sequence]):
+        block = np.asarray(list(rows), dtype=np.float64).reshape(-1, len(self.columns))
+        self.array.append(block)
+        self.rows += len(block)
+
+    def close(self):
+        self.array.close()
+
+
+TABLE_WRITERS = {
+    "markdown": MarkdownWriter,
+    "md": MarkdownWriter,
+    "csv": CSVWriter,
+    "json": JSONWriter,
+    "latex": LatexWriter,
+    "tex": LatexWriter,
+    "binary": BinaryWriter,
+    "bin": BinaryWriter,
+}
+
+
+def get_table_writer(
+        output_format: str,
+        columns: Sequence[str],
+        path: Optional[str] = None,
+        significant_digits: int = 6,
+        ) -> TableWriter:
+    """
+    Writer for `output_format` streaming to `path`, or to stdout when no path
+    is given. The binary format always needs a path.
+    """
+    if output_format not in TABLE_WRITERS:
+        raise TypeError(f"Unknown output format '{output_format}', expected one of {list(TABLE_WRITERS)}")
+    writer_class = TABLE_WRITERS[output_format]
+    if writer_class is BinaryWriter:
+        if path is None:
+            raise TypeError("The binary output format requires a file path")
+        return BinaryWriter(path, columns, significant_digits)
+    stream = sys.stdout if path is None else open(path, "w", newline="")
+    return writer_class(stream, columns, significant_digits)
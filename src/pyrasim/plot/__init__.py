@@ -0,0 +1,27 @@
+import os
+
+# Set to 1 to never import matplotlib: plot() calls are then skipped
+HEADLESS_ENV = "PYRASIM_HEADLESS"
+
+
+def is_headless() -> bool:
+    return os.environ.get(HEADLESS_ENV, "") not in ("", "0")
+
+
+def set_headless(headless: bool = True):
+    """
+    Switch the headless mode. It is kept in the environment, so worker
+    processes started afterwards inherit it.
+    """
+    os.environ[HEADLESS_ENV] = "1" if headless else "0"
+
+
+def pyplot():
+    """
+    matplotlib.pyplot, imported on first use so that simulations and batch
+    workers never load the plotting stack, or None in headless mode.
+    """
+    if is_headless():
+        return None
+    import matplotlib.pyplot as plt
+    return plt
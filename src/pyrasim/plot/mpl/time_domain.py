@@ -0,0 +1,151 @@
+import numpy as np
+import numpy.typing as npt
+from typing import List, Optional, Tuple
+
+from pyrasim.signals.time_axis import TimeAxis
+
+# Columns (pixels) decimated to when the axes width is not known
+DEFAULT_COLUMNS = 2000
+
+# Samples reduced at once, which bounds the temporaries on long signals
+CHUNK_SAMPLES = 2**20
+
+
+def minmax_decimate(
+        samples: npt.NDArray,
+        columns: int = DEFAULT_COLUMNS,
+        start: int = 0,
+        stop: Optional[int] = None,
+        ) -> Tuple[npt.NDArray[np.int64], npt.NDArray]:
+    """
+    Min/max envelope of samples[start:stop] over `columns` equal bins: the
+    minimum and maximum of every bin, in sample order, so that a line drawn
+    through them covers the same pixels as the full signal. Slices of at
+    most 2 samples per column are returned as they are.
+
+    The bins are reduced over reshaped views of at most CHUNK_SAMPLES
+    samples at a time, so a memmap-backed waveform is only read, never
+    copied whole.
+
+    Returns:
+        (indices, values) of the kept samples, at most 2·columns of each
+    """
+    stop = len(samples) if stop is None else stop
+    start, stop = max(start, 0), min(stop, len(samples))
+    if stop - start <= 2*columns:
+        return np.arange(start, stop), np.asarray(samples[start:stop])
+
+    width = -(-(stop - start)//columns)
+    full = (stop - start)//width
+    # Whole bins in blocks of about CHUNK_SAMPLES (argmin/argmax copy
+    # read-only inputs such as cached samples), then the last partial bin
+    rows = max(CHUNK_SAMPLES//width, 1)
+    end = start + full*width
+    bounds = [(lo, min(lo + rows*width, end), width) for lo in range(start, end, rows*width)]
+    if end < stop:
+        bounds.append((end, stop, stop - end))
+
+    indices, values = [], []
+    for lo, hi, size in bounds:
+        block = np.asarray(samples[lo:hi]).reshape(-1, size)
+        pairs = np.sort(np.stack([np.argmin(block, axis=1), np.argmax(block, axis=1)], axis=1), axis=1)
+        row = np.arange(len(block))[:, None]
+        indices.append((lo + row*size + pairs).ravel())
+        values.append(block[row, pairs].ravel())
+    return np.concatenate(indices), np.concatenate(values)
+
+
+def _times(time_axis, indices: npt.NDArray[np.int64]) -> npt.NDArray[np.float64]:
+    if isinstance(time_axis, TimeAxis):
+        return time_axis.start + indices/time_axis.sample_rate
+    return np.asarray(time_axis)[indices]
+
+
+class DecimatedLine:
+    """
+    Line of a long sampled signal drawn from its min/max envelope, about two
+    points per pixel column of the axes. Whenever the x limits change (zoom,
+    pan), the visible samples are decimated again, so zooming in reveals
+    the detail down to the individual samples.
+
+    Args:
+        ax: matplotlib Axes to draw on
+        time_axis: TimeAxis (or array) of the samples
+        samples: real samples
+        columns: points budget in columns, the axes width in pixels by default
+    """
+
+    def __init__(self, ax, time_axis, samples: npt.NDArray, columns: Optional[int] = None, **line_kwargs):
+        self.ax = ax
+        self.time_axis = time_axis
+        self.samples = samples
+        self.columns = columns
+        indices, values = minmax_decimate(samples, self._columns())
+        self.line, = ax.plot(_times(time_axis, indices), values, **line_kwargs)
+        self._callback = ax.callbacks.connect("xlim_changed", self._redraw)
+
+    def _columns(self) -> int:
+        if self.columns is not None:
+            return self.columns
+        width = self.ax.get_window_extent().width
+        return int(width) if width > 1 else DEFAULT_COLUMNS
+
+    def _visible(self, left: float, right: float) -> Tuple[int, int]:
+        if isinstance(self.time_axis, TimeAxis):
+            start = int(np.floor((left - self.time_axis.start)*self.time_axis.sample_rate))
+            stop = int(np.ceil((right - self.time_axis.start)*self.time_axis.sample_rate)) + 1
+        else:
+            times = np.asarray(self.time_axis)
+            start = int(np.searchsorted(times, left)) - 1
+            stop = int(np.searchsorted(times, right)) + 1
+        return max(start, 0), min(stop, len(self.samples))
+
+    def _redraw(self, ax):
+        start, stop = self._visible(*ax.get_xlim())
+        indices, values = minmax_decimate(self.samples, self._columns(), start, stop)
+        self.line.set_data(_times(self.time_axis, indices), values)
+        ax.figure.canvas.draw_idle()
+
+    def remove(self):
+        self.ax.callbacks.disconnect(self._callback)
+        self.line.remove()
+
+
+def plot_waveform(waveform, ax, columns: Optional[int] = None, **line_kwargs) -> List[DecimatedLine]:
+    """
+    Draw a waveform on `ax` as DecimatedLines: one line for real samples,
+    "real" and "imag" lines for complex ones.
+    """
+    samples = waveform.amplitude_axis
+    if not np.iscomplexobj(samples):
+        return [DecimatedLine(ax, waveform.time_axis, samples, columns, **line_kwargs)]
+    return [
+        DecimatedLine(ax, waveform.time_axis, part, columns, label=label, **line_kwargs)
+        for label, part in (("real", samples.real), ("imag", samples.imag))
+        ]
+
+
+def waveform_figure(waveform, path: Optional[str] = None, columns: Optional[int] = None, figsize=(10, 4), dpi: int = 100):
+    """
+    Figure of a waveform built without pyplot: no GUI backend, no global
+    figure state and no blocking show(), so batch jobs and threads can
+    render plots. The figure is saved to `path` when given.
+
+    Returns:
+        matplotlib.figure.Figure, whose lines re-decimate on zoom if it is
+        later shown interactively
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    lines = plot_waveform(waveform, ax, columns)
+    if len(lines) > 1:
+        ax.legend(loc="upper right")
+    ax.set_ylabel("Amplitude")
+    ax.set_xlabel("Time (s)")
+    if path is not None:
+        figure.savefig(path)
+    return figure
@@ -1,9 +1,117 @@
+import numpy as np
 from dataclasses import dataclass
-from pyrasim.constants import LIGHT_SPEED
-from pyrasim.signals import SineWaveform
+from typing import Iterator
+from pyrasim import instrumentation
+from pyrasim.constants import LIGHT_SPEED, SIMULATION_MODES
+from pyrasim.signals import BasebandWaveform, SineWaveform
+from pyrasim.signals.alignment import sample_count
+from pyrasim.signals.precision import complex_dtype, expj, real_dtype
+from pyrasim.signals.sinusoid import Waveform
+from .burst import Burst, synthesize_burst
+from .doppler import RangeDopplerMap, RangeDopplerProcessor
+from .plans import ProcessingPlan, processing_plan
+from .processing import RangeProfile, mix_iq, range_profile
+from .scene import Scene
 
+# One pulse of a schedule: carrier f_i, transmit time t_i, width and phase
+PULSE_DTYPE = np.dtype([
+    ("frequency", np.float64),
+    ("t_start", np.float64),
+    ("duration", np.float64),
+    ("phase", np.float64),
+])
+
+@dataclass(frozen=True, eq=True)
 class SteppedFrequencyParams():
-    pass
+    """
+    Validated, immutable waveform parameters of a stepped frequency radar,
+    without the targets. Slotted, so records held by the million (e.g. the
+    points of a sweep) cost about 170 bytes each. The derived unambiguous range
+    c/(2Δf) and range resolution c/(2NΔf) are computed once, on creation.
+
+    N_bursts: int
+    n_pulses: int, frequency steps per burst
+    freq_step_size: float (Hz)
+    freq_start: float (Hz)
+    pulse_width: float (s)
+    pulse_repetion_interval: float (s)
+    transmitted_amplitude: float
+    transmitted_relative_phase: float (rad)
+    """
+    __slots__ = (
+        "N_bursts", "n_pulses", "freq_step_size", "freq_start", "pulse_width",
+        "pulse_repetion_interval", "transmitted_amplitude", "transmitted_relative_phase",
+        "_unambiguous_range", "_range_resolution",
+    )
+    N_bursts: int
+    n_pulses: int
+    freq_step_size: float
+    freq_start: float
+    pulse_width: float
+    pulse_repetion_interval: float
+    transmitted_amplitude: float
+    transmitted_relative_phase: float
+
+    def __post_init__(self):
+        if int(self.N_bursts) != self.N_bursts or self.N_bursts < 1:
+            raise TypeError("N_bursts must be a positive integer")
+        if int(self.n_pulses) != self.n_pulses or self.n_pulses < 1:
+            raise TypeError("n_pulses must be a positive integer")
+        if not self.freq_step_size > 0:
+            raise TypeError("Frequency step size must be positive")
+        if not 0 < self.pulse_width <= self.pulse_repetion_interval:
+            raise TypeError("Pulse width must be positive and not longer than the pulse repetition interval")
+        object.__setattr__(self, "_unambiguous_range", LIGHT_SPEED/(2*self.freq_step_size))
+        object.__setattr__(self, "_range_resolution", self._unambiguous_range/self.n_pulses)
+
+    # Frozen and slotted: pickling (e.g. to sweep workers) restores the slots directly
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    @property
+    def unambiguous_range(self) -> float:
+        """
+        R_amb = c/(2Δf)
+        """
+        return self._unambiguous_range
+
+    @property
+    def range_resolution(self) -> float:
+        """
+        ΔR = c/(2NΔf)
+        """
+        return self._range_resolution
+
+    @property
+    def bandwidth(self) -> float:
+        return self.n_pulses*self.freq_step_size
+
+    @property
+    def burst_period(self) -> float:
+        return self.n_pulses*self.pulse_repetion_interval
+
+    def schedule(self, n_bursts: int = None) -> np.ndarray:
+        """
+        Pulse schedule of `n_bursts` bursts (N_bursts by default) as a
+        structured array of PULSE_DTYPE, 32 bytes per pulse: pulse k has
+        the step frequency k mod N of the shared processing_plan(), as
+        SteppedFrequencyCW synthesizes it, starts at kT and lasts the pulse
+        width.
+        """
+        if n_bursts == None:
+            n_bursts = self.N_bursts
+        k = np.arange(n_bursts * self.n_pulses)
+        frequencies = processing_plan(self.n_pulses, self.freq_step_size, self.freq_start).frequencies
+        schedule = np.empty(len(k), dtype=PULSE_DTYPE)
+        schedule["frequency"] = frequencies[k % self.n_pulses]
+        schedule["t_start"] = k*self.pulse_repetion_interval
+        schedule["duration"] = self.pulse_width
+        schedule["phase"] = self.transmitted_relative_phase
+        return schedule
 
 @dataclass
 class SteppedFrequencyCW():
@@ -16,6 +124,15 @@ class SteppedFrequencyCW():
     freq_start: float   (Hz)
     pulse_width: float  (s)
     pulse_repetion_period: float    (s)
+    sample_rate: float (Hz), common to every pulse, defaults to 4 f_max + 1
+    scene: Scene, targets replacing target_range/target_velocity; target_range
+        then only sets the range gate
+    dtype: float32 or float64 precision of the samples, I/Q and profiles;
+        None follows the global precision (signals.precision)
+    baseband_sample_rate: float (Hz), rate of the complex envelopes of the
+        "baseband" mode, defaults to max(4 n_pulses Δf, 64/pulse_width)
+    synthesis: carrier generator of the synthesized bursts, "direct" or
+        "nco", see synthesize_burst()
     """
     N_bursts: int
     n_pulses: int
@@ -27,55 +144,337 @@ class SteppedFrequencyCW():
     pulse_repetion_interval: float
     transmitted_amplitude: float
     transmitted_relative_phase: float
+    sample_rate: float = None
+    scene: Scene = None
+    dtype: np.dtype = None
+    baseband_sample_rate: float = None
+    synthesis: str = "direct"
+
+    def __post_init__(self):
+        """
+        Use Nyquist teorem as default sample rate. Mixing doubles the highest
+        step frequency, so the default covers twice its band.
+        """
+        # Raises TypeError on invalid waveform parameters
+        params = self.params
+        if self.sample_rate == None:
+            self.sample_rate = 4 * np.max(np.abs(self.frequencies)) + 1
+        # The envelopes only carry the swept band and the gate edges
+        if self.baseband_sample_rate == None:
+            self.baseband_sample_rate = max(4 * params.bandwidth, 64/params.pulse_width)
+
+    @property
+    def params(self) -> SteppedFrequencyParams:
+        """
+        Waveform parameters as an immutable SteppedFrequencyParams record.
+        """
+        return SteppedFrequencyParams(
+            self.N_bursts, self.n_pulses, self.freq_step_size, self.freq_start, self.pulse_width,
+            self.pulse_repetion_interval, self.transmitted_amplitude, self.transmitted_relative_phase,
+            )
+
+    def schedule(self, n_bursts: int = None) -> np.ndarray:
+        """
+        Structured array (frequency, t_start, duration, phase) of every
+        transmitted pulse, see SteppedFrequencyParams.schedule().
+        """
+        return self.params.schedule(n_bursts)
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """
+        f_i = f_0 + iΔf for every pulse of a burst
+        """
+        return self.plan.frequencies
+
+    @property
+    def plan(self) -> ProcessingPlan:
+        """
+        Shared step frequencies, FFT size and range axis of this radar.
+        """
+        return processing_plan(self.n_pulses, self.freq_step_size, self.freq_start)
+
+    @property
+    def range_delay(self) -> float:
+        """
+        Delay of the range gate, 2R/c
+        """
+        return self.target_range/(LIGHT_SPEED/2)
+
+    @property
+    def targets(self) -> Scene:
+        """
+        Scatterers seen by the radar, a single point target at target_range
+        moving at target_velocity unless a scene is given.
+        """
+        if self.scene == None:
+            return Scene.point(self.target_range, self.target_velocity)
+        return self.scene
+
+    def _pulses(self, k):
+        """
+        Frequency and start time of pulse(s) k, counted from the first burst.
+        """
+        return self.plan.frequencies[k % self.n_pulses], k * self.pulse_repetion_interval
+
+    def _bursts(self, n_bursts: int) -> np.ndarray:
+        return np.arange(n_bursts * self.n_pulses)
+
+    def _burst(self, k: np.ndarray, window_delay: float, duration: float, analytic: bool = False) -> Burst:
+        """
+        Pulses k sampled over [t_k + window_delay, t_k + window_delay + duration),
+        where t_k is the transmit time of pulse k.
+        """
+        frequencies, time_start = self._pulses(k)
+        with instrumentation.stage("sfcw.burst") as stage:
+            burst = synthesize_burst(
+                    amplitude=self.transmitted_amplitude,
+                    frequencies=frequencies,
+                    phase=self.transmitted_relative_phase,
+                    time_start=time_start + window_delay,
+                    duration=duration,
+                    sample_rate=self.sample_rate,
+                    analytic=analytic,
+                    synthesis=self.synthesis,
+                    dtype=self.dtype
+                    )
+            stage.record(burst.samples.size, burst.samples.nbytes)
+        return burst
+
+    def _baseband_burst(self, k: np.ndarray, window_delay: float, duration: float) -> Burst:
+        """
+        Complex envelopes of pulses k about their own carrier f_k over the
+        same windows as _burst(). The transmitted pulse is a pure carrier, so
+        its envelope is the constant A e^{j(θ - π/2)}.
+        """
+        frequencies, time_start = self._pulses(k)
+        envelope = self.transmitted_amplitude*np.exp(1j*(self.transmitted_relative_phase - np.pi/2))
+        samples = np.full((len(k), sample_count(duration, self.baseband_sample_rate)), envelope, dtype=complex_dtype(self.dtype))
+        return Burst(frequencies, time_start + window_delay, self.baseband_sample_rate, samples, baseband=True)
+
+    def _waveform(self, i: int, window_delay: float, duration: float) -> SineWaveform:
+        frequency, time_start = self._pulses(i)
+        waveform = SineWaveform(
+                amplitude=self.transmitted_amplitude,
+                frequency=frequency,
+                phase=self.transmitted_relative_phase,
+                time_start=time_start + window_delay,
+                duration=duration,
+                sample_rate=self.sample_rate,
+                synthesis=self.synthesis,
+                dtype=self.dtype,
+                )
+        return waveform
+
+    def _cycles(self, cycles: np.ndarray) -> np.ndarray:
+        """
+        Fractional part of a phase in cycles, reduced in float64 and then cast
+        to the sample precision.
+        """
+        return np.mod(cycles, 1).astype(real_dtype(self.dtype), copy=False)
+
+    def _echo_envelope(self, k: np.ndarray, n_samples: int, sample_rate: float) -> np.ndarray:
+        """
+        (pulses, samples) complex envelope of the returns of every target
+        inside the range-gate window of pulses k.
+
+        Target m contributes a_m e^{-j2πf_k τ_km} on the samples its echo
+        covers. The rectangular echoes are accumulated as +/- steps on a
+        difference array and integrated with a cumulative sum, so memory is
+        (pulses, samples) whatever the number of targets.
+        """
+        frequencies, time_start = self._pulses(k)
+        rows = np.arange(len(k))[:, None]
+        steps = np.zeros((len(k), n_samples + 1), dtype=complex_dtype(self.dtype))
+        for chunk in self.targets.chunks(len(k)):
+            tau = chunk.echo_delay(time_start)
+            echo = chunk.amplitudes * expj(-2*np.pi*self._cycles(frequencies[:, None]*tau))
+            start = np.clip(np.ceil((tau - self.range_delay)*sample_rate), 0, n_samples).astype(int)
+            stop = np.clip(np.ceil((tau - self.range_delay + self.pulse_width)*sample_rate), 0, n_samples).astype(int)
+            np.add.at(steps, (rows, start), echo)
+            np.add.at(steps, (rows, stop), -echo)
+        return np.cumsum(steps[:, :-1], axis=1)
+
+    def _gated_echo(self, k: np.ndarray, reference: Burst = None) -> Burst:
+        """
+        Received pulses k sampled over the range-gate window: the sum of the
+        returns of every target, Re(z_k(t) E_k(t)) with z_k the analytic
+        reference and E_k the echo envelope. With a baseband reference the
+        complex envelope z_k(t) E_k(t) is returned instead.
+        """
+        if reference == None:
+            reference = self._burst(k, self.range_delay, self.pulse_width, analytic=True)
+        with instrumentation.stage("sfcw.echo") as stage:
+            samples = reference.samples * self._echo_envelope(k, reference.n_samples, reference.sample_rate)
+            if not reference.baseband:
+                samples = np.real(samples)
+            stage.record(samples.size, samples.nbytes)
+        return Burst(reference.frequencies, reference.time_start, reference.sample_rate, samples, reference.baseband)
+
+    def transmitted_burst(self, n_bursts: int = 1) -> Burst:
+        """
+        x_i(t) for every pulse of the first `n_bursts` bursts
+        """
+        return self._burst(self._bursts(n_bursts), 0, self.pulse_width)
+
+    def received_burst(self, n_bursts: int = 1) -> Burst:
+        """
+        y_i(t) over the range gate for every pulse of the first `n_bursts` bursts
+        """
+        return self._gated_echo(self._bursts(n_bursts))
+
+    def reference_burst(self, n_bursts: int = 1) -> Burst:
+        """
+        z_i(t) for every pulse of the first `n_bursts` bursts
+        """
+        return self._burst(self._bursts(n_bursts), 0, self.pulse_repetion_interval)
 
     def transmitted_waveform(self, i: int) -> SineWaveform:
         """
         x_i(t)
         pg. 204
         """
-        freq_i = self.freq_start + i * self.freq_step_size
-        return SineWaveform(
-                amplitude = self.transmitted_amplitude, 
-                frequency=freq_i, 
-                phase=self.transmitted_relative_phase, 
-                time_start=i*self.pulse_repetion_interval,
-                duration=self.pulse_width
-                )
+        return self._waveform(i, 0, self.pulse_width)
 
-    def received_waveform(self, i: int):
+    def received_waveform(self, i: int) -> Waveform:
         """
-        y_i(t)=B_i
+        y_i(t)=B_i, summed over every target, over the range gate
         pg. 205
         """
-        freq_i = self.freq_start + i * self.freq_step_size
-        range_delay = self.target_range/(LIGHT_SPEED/2)
-        return SineWaveform(
-                amplitude = self.transmitted_amplitude, 
-                frequency = freq_i, 
-                phase = self.transmitted_relative_phase, 
-                time_start = i*self.pulse_repetion_interval+range_delay,
-                duration=self.pulse_width
-                )
+        return self._gated_echo(np.array([i])).waveform(0)
 
-    def reference_waveform(self, i: int):
+    def reference_waveform(self, i: int) -> SineWaveform:
         """
         z_i(t)
         """
-        freq_i = self.freq_start + i * self.freq_step_size
-        return SineWaveform(
-                amplitude=self.transmitted_amplitude, 
-                frequency=freq_i, 
-                phase=self.transmitted_relative_phase, 
-                time_start=i*self.pulse_repetion_interval,
-                duration=self.pulse_repetion_interval
-                 )
-    
-
-    def operate(self):
-        for i in range(self.n_pulses):
-            x = self.transmitted_waveform(i)
-            y = self.transmitted_waveform(i)
-            z = self.transmitted_waveform(i)
-            
-            samp_time = i*self.pulse_repetion_interval + (2*self.target_range)/LIGHT_SPEED
+        return self._waveform(i, 0, self.pulse_repetion_interval)
 
+    def received_baseband_burst(self, n_bursts: int = 1) -> Burst:
+        """
+        Complex envelopes of y_i(t) over the range gate, sampled at
+        baseband_sample_rate; Burst.upconvert() gives the RF samples.
+        """
+        k = self._bursts(n_bursts)
+        return self._gated_echo(k, self._baseband_burst(k, self.range_delay, self.pulse_width))
+
+    def received_baseband_waveform(self, i: int) -> BasebandWaveform:
+        """
+        y_i(t) over the range gate as a BasebandWaveform about f_i
+        """
+        k = np.array([i])
+        return self._gated_echo(k, self._baseband_burst(k, self.range_delay, self.pulse_width)).waveform(0)
+
+    def _time_domain_iq(self, k: np.ndarray) -> np.ndarray:
+        z = self._burst(k, self.range_delay, self.pulse_width, analytic=True)
+        return mix_iq(self._gated_echo(k, z), z, self.transmitted_amplitude)
+
+    def _baseband_iq(self, k: np.ndarray) -> np.ndarray:
+        """
+        _time_domain_iq() on the complex envelopes: the carriers cancel in the
+        mixing, so only baseband_sample_rate samples per second are needed.
+        """
+        z = self._baseband_burst(k, self.range_delay, self.pulse_width)
+        return mix_iq(self._gated_echo(k, z), z, self.transmitted_amplitude)
+
+    def _analytic_iq(self, k: np.ndarray) -> np.ndarray:
+        """
+        Closed form of the gated I/Q samples of ideal point targets,
+
+        B_i = A sum_m a_m e^{-j2πf_i τ_im} max(0, 1 - |τ_im - τ_g|/T)
+
+        with τ_im = 2(R_m + v_m t_i)/c, τ_g the gate delay and T the pulse
+        width. Targets are processed in chunks that bound the (pulses, targets)
+        matrices.
+        """
+        frequencies, time_start = self._pulses(k)
+        iq = np.zeros(len(k), dtype=complex_dtype(self.dtype))
+        for chunk in self.targets.chunks(len(k)):
+            tau = chunk.echo_delay(time_start)
+            overlap = np.clip(1 - np.abs(tau - self.range_delay)/self.pulse_width, 0, 1)
+            echo = expj(-2*np.pi*self._cycles(frequencies[:, None]*tau))
+            echo *= overlap
+            iq += echo @ chunk.amplitudes.astype(echo.dtype, copy=False)
+        return self.transmitted_amplitude * iq
+
+    def iq_chunks(self, n_bursts: int = None, chunk_bursts: int = 64, mode: str = "time") -> Iterator[np.ndarray]:
+        """
+        I/Q samples of `chunk_bursts` bursts at a time, as (bursts, n_pulses)
+        arrays; see iq_samples.
+        """
+        if mode not in SIMULATION_MODES:
+            raise TypeError(f"Simulation mode must be one of {SIMULATION_MODES}")
+        if n_bursts == None:
+            n_bursts = self.N_bursts
+        iq = {"time": self._time_domain_iq, "analytic": self._analytic_iq, "baseband": self._baseband_iq}[mode]
+        for b in range(0, n_bursts, chunk_bursts):
+            k = np.arange(b * self.n_pulses, min(b + chunk_bursts, n_bursts) * self.n_pulses)
+            with instrumentation.stage(f"sfcw.iq.{mode}") as stage:
+                chunk = iq(k).reshape(-1, self.n_pulses)
+                stage.record(chunk.size, chunk.nbytes)
+            yield chunk
+
+    def iq_samples(self, n_bursts: int = None, chunk_bursts: int = 64, mode: str = "time") -> np.ndarray:
+        """
+        I/Q sample of every step, taken at the range gate 2R/c of each pulse.
+
+        In "time" mode the received pulses are mixed with the analytic
+        reference over the gate window. Bursts are synthesized `chunk_bursts`
+        at a time so only one chunk of time-domain samples is alive at once.
+        "baseband" mode does the same on the complex envelopes of the pulses,
+        at baseband_sample_rate instead of the RF sample rate. In "analytic"
+        mode the same samples are evaluated in closed form, without any
+        time-domain synthesis.
+
+        Returns:
+            (n_bursts, n_pulses) complex I/Q samples
+        """
+        if n_bursts == None:
+            n_bursts = self.N_bursts
+        iq = np.empty((n_bursts, self.n_pulses), dtype=complex_dtype(self.dtype))
+        b = 0
+        for chunk in self.iq_chunks(n_bursts, chunk_bursts, mode):
+            iq[b:b + len(chunk)] = chunk
+            b += len(chunk)
+        return iq
+
+    def operate(
+            self,
+            n_bursts: int = None,
+            pad_factor: int = 1,
+            chunk_bursts: int = 64,
+            mode: str = "time",
+            ) -> RangeProfile:
+        """
+        Synthetic range profile of each burst: I/Q mixing, sampling at the
+        range gate and zero-padded IFFT over the frequency steps.
+
+        Returns:
+            RangeProfile with (n_bursts, bins) profiles
+        """
+        iq = self.iq_samples(n_bursts, chunk_bursts, mode)
+        return range_profile(iq, self.freq_step_size, pad_factor)
+
+    def range_doppler(
+            self,
+            n_bursts: int = None,
+            chunk_bursts: int = 64,
+            mode: str = "analytic",
+            range_window: str = "hann",
+            doppler_window: str = "hann",
+            pad_factor: int = 1,
+            doppler_pad_factor: int = 1,
+            compensate: bool = True,
+            ) -> RangeDopplerMap:
+        """
+        Range-Doppler map of `n_bursts` bursts (N_bursts by default): the I/Q
+        samples are streamed `chunk_bursts` at a time into a
+        RangeDopplerProcessor, see there for the processing.
+        """
+        if n_bursts == None:
+            n_bursts = self.N_bursts
+        processor = RangeDopplerProcessor(
+            self.n_pulses, n_bursts, self.freq_start, self.freq_step_size,
+            self.pulse_repetion_interval, range_window, doppler_window,
+            pad_factor, doppler_pad_factor, compensate, self.dtype,
+            )
+        return processor.process(self.iq_chunks(n_bursts, chunk_bursts, mode))
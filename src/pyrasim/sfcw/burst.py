@@ -0,0 +1,138 @@
+import numpy as np
+import numpy.typing as npt
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from pyrasim.signals.sinusoid import ComplexWaveform, Waveform
+from pyrasim.signals.alignment import sample_count
+from pyrasim.signals.baseband import BasebandWaveform, rf_factor, upconvert
+from pyrasim.signals.nco import SYNTHESIS_MODES, nco_cosines, nco_phasors
+from pyrasim.signals.precision import expj, real_dtype
+from pyrasim.signals.time_axis import TimeAxis
+
+
+@dataclass
+class Burst:
+    """
+    Sampled pulses of one or more SFCW bursts stored as a single
+    (pulses, samples) array. Row k holds pulse k sampled from time_start[k]
+    at sample_rate.
+
+    frequencies: (pulses,) carrier frequency of each row (Hz)
+    time_start: (pulses,) start time of each row (s)
+    sample_rate: common sample rate (Hz)
+    samples: (pulses, samples) real or complex amplitudes
+    baseband: samples are complex envelopes about frequencies[k], see
+        BasebandWaveform, instead of RF samples
+    """
+    frequencies: npt.NDArray[np.float64]
+    time_start: npt.NDArray[np.float64]
+    sample_rate: float
+    samples: npt.NDArray[Union[np.float64, np.complex128]]
+    baseband: bool = False
+
+    @property
+    def n_pulses(self) -> int:
+        return self.samples.shape[0]
+
+    @property
+    def n_samples(self) -> int:
+        return self.samples.shape[1]
+
+    @property
+    def time_axis(self) -> npt.NDArray[np.float64]:
+        """
+        (pulses, samples) absolute sampling instants.
+        """
+        return self.time_start[:, None] + np.arange(self.n_samples)/self.sample_rate
+
+    def waveform(self, i: int) -> Waveform:
+        """
+        Pulse i as a Waveform whose amplitude_axis is a view of the burst.
+        """
+        if self.baseband:
+            return BasebandWaveform.from_envelope(self.samples[i], self.frequencies[i], self.time_start[i], self.sample_rate)
+        waveform_class = ComplexWaveform if np.iscomplexobj(self.samples) else Waveform
+        waveform = waveform_class(
+            duration=self.n_samples/self.sample_rate,
+            time_start=self.time_start[i],
+            sample_rate=self.sample_rate
+            )
+        waveform.time_axis = TimeAxis(self.time_start[i], self.sample_rate, self.n_samples)
+        waveform.amplitude_axis = self.samples[i]
+        return waveform
+
+    def upconvert(self, factor: Optional[int] = None) -> "Burst":
+        """
+        Real RF burst from a baseband one, every row interpolated by `factor`
+        (by default the smallest meeting Nyquist at the highest carrier) and
+        modulated by its own carrier.
+        """
+        if not self.baseband:
+            raise TypeError("Only baseband bursts can be upconverted")
+        factor = factor or rf_factor(np.max(np.abs(self.frequencies)), self.sample_rate)
+        samples = upconvert(self.samples, self.frequencies, self.time_start, self.sample_rate, factor)
+        return Burst(self.frequencies, self.time_start, factor*self.sample_rate, samples)
+
+
+def synthesize_burst(
+        amplitude: float,
+        frequencies: npt.NDArray[np.float64],
+        phase: float,
+        time_start: npt.NDArray[np.float64],
+        duration: float,
+        sample_rate: float,
+        delay: Union[float, npt.NDArray[np.float64]] = 0.0,
+        analytic: bool = False,
+        synthesis: str = "direct",
+        dtype: npt.DTypeLike = None,
+        ) -> Burst:
+    """
+    Sample A sin(2πf_k (t - delay_k) + θ) for every pulse k over
+    [time_start[k], time_start[k] + duration) in one broadcasted pass.
+
+    With `analytic` the complex signal A e^{j(2πf_k (t - delay_k) + θ - π/2)}
+    is returned instead, whose real part is the sine above.
+
+    The carrier phase at each pulse start is reduced modulo one cycle before
+    broadcasting, so late pulses keep their phase precision.
+
+    `synthesis` selects how the carrier is generated: "direct" evaluates
+    sin/exp on every sample, "nco" rotates a per-pulse phasor table
+    (nco_phasors). Samples are float32 or float64 according to `dtype`, the
+    global precision by default; pulse start phases are always reduced in
+    float64.
+    """
+    if synthesis not in SYNTHESIS_MODES:
+        raise TypeError(f"Synthesis must be one of {SYNTHESIS_MODES}")
+    dtype = real_dtype(dtype)
+    frequencies = np.asarray(frequencies, dtype=np.float64)
+    time_start = np.asarray(time_start, dtype=np.float64)
+    local_time = np.arange(sample_count(duration, sample_rate))/sample_rate
+
+    start_cycles = frequencies*(time_start - delay)
+    start_cycles -= np.floor(start_cycles)
+
+    if synthesis == "nco":
+        # e^{j(x - π/2)} has real part sin(x)
+        generator = nco_phasors if analytic else nco_cosines
+        samples = generator(frequencies, start_cycles + phase/(2*np.pi) - 0.25, sample_rate, len(local_time), dtype)
+        samples = np.ascontiguousarray(samples)
+        samples *= np.asarray(amplitude, dtype=samples.real.dtype)
+        return Burst(frequencies, time_start, sample_rate, samples)
+
+    samples = np.multiply.outer(frequencies, local_time)
+    samples += start_cycles[:, None]
+    if dtype == np.float32:
+        # Reduce to one cycle in float64 before the single precision sin/exp
+        samples -= np.floor(samples)
+        samples = samples.astype(dtype)
+    samples *= 2*np.pi
+    samples += phase
+    if analytic:
+        samples -= np.pi/2
+        samples = expj(samples)
+    else:
+        np.sin(samples, out=samples)
+    samples *= amplitude
+    return Burst(frequencies, time_start, sample_rate, samples)
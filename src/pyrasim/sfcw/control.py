@@ -0,0 +1,186 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .utils import _getXmlRpc
+
+
+@dataclass
+class ControlStats:
+    """
+    Round-trip counters of a FlowgraphController.
+    """
+    commands: int = 0
+    round_trips: int = 0
+    latency: float = 0.0
+    max_latency: float = 0.0
+
+    def record(self, commands: int, latency: float):
+        self.commands += commands
+        self.round_trips += 1
+        self.latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def as_dict(self) -> Dict:
+        return {
+            "commands": self.commands,
+            "round_trips": self.round_trips,
+            "mean_latency": self.latency/self.round_trips if self.round_trips else 0.0,
+            "max_latency": self.max_latency,
+            "commands_per_second": self.commands/self.latency if self.latency else 0.0,
+        }
+
+
+class FlowgraphController:
+    """
+    XML-RPC control of a GNU Radio-style flowgraph over one persistent
+    connection.
+
+    The ServerProxy is created once and reused, so its HTTP/1.1 transport
+    keeps the connection open between calls (the server must speak HTTP/1.1).
+    Every request runs on a single worker thread, which keeps the proxy
+    single-threaded while letting run_schedule() set the next step ahead of
+    acquisition.
+
+    Args:
+        host, port: address of the flowgraph XML-RPC server
+        setter: name of the frequency setter exposed by the flowgraph
+        batch_size: commands per system.multicall round trip
+    """
+
+    def __init__(
+            self,
+            host: str = "localhost",
+            port: int = 8080,
+            setter: str = "set_center_freq",
+            batch_size: int = 256,
+            proxy: Optional["ServerProxy"] = None,
+            ):
+        self.proxy = proxy or _getXmlRpc(host, port)
+        self.setter = setter
+        self.batch_size = batch_size
+        self.stats = ControlStats()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown()
+        self.proxy("close")()
+
+    def _call(self, name: str, *args) -> Any:
+        start = time.perf_counter()
+        result = getattr(self.proxy, name)(*args)
+        self.stats.record(1, time.perf_counter() - start)
+        return result
+
+    def _multicall(self, name: str, values: Sequence) -> List:
+        from xmlrpc.client import MultiCall
+
+        results = []
+        for i in range(0, len(values), self.batch_size):
+            multicall = MultiCall(self.proxy)
+            batch = values[i:i + self.batch_size]
+            for value in batch:
+                getattr(multicall, name)(value)
+            start = time.perf_counter()
+            results.extend(multicall())
+            self.stats.record(len(batch), time.perf_counter() - start)
+        return results
+
+    def call(self, name: str, *args) -> Any:
+        return self._executor.submit(self._call, name, *args).result()
+
+    def set_frequency(self, frequency: float) -> Any:
+        return self.call(self.setter, float(frequency))
+
+    def set_frequencies(self, frequencies: Sequence[float]) -> List:
+        """
+        Send a whole step schedule with system.multicall, batch_size commands
+        per round trip.
+        """
+        values = [float(frequency) for frequency in frequencies]
+        return self._executor.submit(self._multicall, self.setter, values).result()
+
+    def run_schedule(
+            self,
+            frequencies: Sequence[float],
+            acquire: Callable[[int, float], Any],
+            process: Optional[Callable[[Any], Any]] = None,
+            ) -> List:
+        """
+        Step through `frequencies`: set step i, acquire(i, f_i), then process
+        the data. The frequency of step i+1 is sent as soon as step i has been
+        acquired, so the round trip overlaps with process().
+
+        Returns:
+            process() results (or the acquired data) of every step
+        """
+        results = []
+        if len(frequencies) == 0:
+            return results
+        pending = self._executor.submit(self._call, self.setter, float(frequencies[0]))
+        for i, frequency in enumerate(frequencies):
+            pending.result()
+            data = acquire(i, frequency)
+            if i + 1 < len(frequencies):
+                pending = self._executor.submit(self._call, self.setter, float(frequencies[i + 1]))
+            results.append(process(data) if process else data)
+        return results
+
+
+def _keep_alive_server(host: str, port: int) -> "SimpleXMLRPCServer":
+    """
+    SimpleXMLRPCServer speaking HTTP/1.1, so clients keep their connection.
+    xmlrpc.server is only imported here, when a stand-in is started.
+    """
+    from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+    class KeepAliveRequestHandler(SimpleXMLRPCRequestHandler):
+        protocol_version = "HTTP/1.1"
+    return SimpleXMLRPCServer((host, port), requestHandler=KeepAliveRequestHandler, logRequests=False, allow_none=True)
+
+
+class FlowgraphStandIn:
+    """
+    Local SimpleXMLRPCServer mimicking a flowgraph's XML-RPC block, with
+    set_<name>/get_<name> methods for each variable and system.multicall,
+    served over keep-alive HTTP/1.1 from a background thread.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 0, variables: Sequence[str] = ("center_freq",)):
+        self.server = _keep_alive_server(host, port)
+        self.server.register_multicall_functions()
+        self.values: Dict[str, Any] = {}
+        self.history: List = []
+        for name in variables:
+            self.server.register_function(self._setter(name), f"set_{name}")
+            self.server.register_function(self._getter(name), f"get_{name}")
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def _setter(self, name: str):
+        def set_value(value):
+            self.values[name] = value
+            self.history.append((name, value))
+        return set_value
+
+    def _getter(self, name: str):
+        return lambda: self.values.get(name)
+
+    @property
+    def address(self):
+        return self.server.server_address
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,226 @@
+import numpy as np
+import numpy.typing as npt
+from dataclasses import dataclass, field
+from math import lgamma, log, log1p
+from typing import Callable, Optional, Tuple, Union
+
+from pyrasim import instrumentation
+from .doppler import RangeDopplerMap
+from .processing import RangeProfile
+
+CFAR_METHODS = ("ca", "go", "so", "os")
+
+# Bytes of power samples (and OS windows) processed per tile
+TILE_BYTES = 2**20
+
+
+def _solve_scale(pfa_of: Callable[[float], float], pfa: float) -> float:
+    """
+    Threshold factor α with pfa_of(α) = pfa, by bisection on log α
+    (pfa_of decreases with α).
+    """
+    low, high = -20.0, 20.0
+    for _ in range(64):
+        middle = (low + high)/2
+        if pfa_of(np.exp(middle)) > pfa:
+            low = middle
+        else:
+            high = middle
+    return float(np.exp(high))
+
+
+def _pfa_go_so(n: int, greatest: bool) -> Callable[[float], float]:
+    """
+    Pfa(β) of greatest-of/smallest-of CFAR with n cells per half and the
+    threshold β times the larger/smaller half sum, square-law detector.
+    """
+    # log C(n-1+k, k), so the terms C(n-1+k, k)(2+β)^{-n-k} stay finite for large n
+    k = np.arange(n)
+    log_binomial = np.array([lgamma(n + i) - lgamma(i + 1) - lgamma(n) for i in range(n)])
+
+    def pfa(beta):
+        tail = 2*np.sum(np.exp(log_binomial - (n + k)*log(2 + beta)))
+        return 2*np.exp(-n*log1p(beta)) - tail if greatest else tail
+    return pfa
+
+
+def threshold_factor(method: str, n_training: int, pfa: float, rank: Optional[int] = None) -> float:
+    """
+    α such that detecting power > α·noise gives the false alarm probability
+    `pfa` in exponentially distributed (square-law detected Gaussian) noise,
+    where noise is the mean of the training cells (CA), of the larger or
+    smaller half (GO, SO) or the rank-th smallest training cell (OS).
+    """
+    if method not in CFAR_METHODS:
+        raise TypeError(f"CFAR method must be one of {CFAR_METHODS}")
+    n = n_training
+    if method == "ca":
+        return n*(pfa**(-1/n) - 1)
+    if method == "os":
+        return _solve_scale(lambda a: np.prod([(n - i)/(n - i + a) for i in range(rank)]), pfa)
+    half = n//2
+    return half*_solve_scale(_pfa_go_so(half, method == "go"), pfa)
+
+
+@dataclass
+class Detections:
+    """
+    Compact list of CFAR detections.
+
+    rows: burst (range profiles) or Doppler bin (range-Doppler maps) index
+    bins: range bin index
+    ranges: range of each detection (m)
+    velocities: radial velocity (m/s), only for range-Doppler maps
+    snr: cell power over the estimated noise power (linear)
+    """
+    rows: npt.NDArray[np.int64]
+    bins: npt.NDArray[np.int64]
+    ranges: npt.NDArray[np.float64]
+    velocities: Optional[npt.NDArray[np.float64]]
+    snr: npt.NDArray[np.float64]
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def snr_db(self) -> npt.NDArray[np.float64]:
+        return 10*np.log10(self.snr)
+
+
+@dataclass
+class CFAR:
+    """
+    Constant false alarm rate detector over range profiles and range-Doppler
+    maps, on the square-law detected power |x|^2.
+
+    Around every cell under test, `guard` cells are skipped and the next
+    `training` cells on each side estimate the noise. On maps both are
+    (doppler, range) pairs and the training region is the ring between the
+    two rectangles; an integer applies to both axes. Profiles are only
+    trained along range. Both axes wrap around, as FFT outputs do.
+
+    CA averages the training cells, GO/SO take the greater/smaller of the
+    mean of the strips before and after the cell in range, and OS takes the
+    rank-th smallest training cell (by default at 3/4 of them). CA, GO and
+    SO use box sums of a summed-area table, so their cost does not depend on
+    the window size; OS sorts every window partially. Maps are processed in
+    row tiles of about tile_bytes and only the detections are kept.
+    """
+    method: str = "ca"
+    guard: Union[int, Tuple[int, int]] = 2
+    training: Union[int, Tuple[int, int]] = 8
+    pfa: float = 1e-6
+    rank: Optional[int] = None
+    tile_bytes: int = TILE_BYTES
+
+    _scales: dict = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.method not in CFAR_METHODS:
+            raise TypeError(f"CFAR method must be one of {CFAR_METHODS}")
+
+    def _cells(self, two_dimensional: bool):
+        guard = np.broadcast_to(self.guard, 2)
+        training = np.broadcast_to(self.training, 2)
+        if not two_dimensional:
+            return 0, int(guard[-1]), 0, int(training[-1])
+        return int(guard[0]), int(guard[1]), int(training[0]), int(training[1])
+
+    def _scale(self, n_training: int) -> Tuple[float, int]:
+        rank = self.rank or max(int(round(0.75*n_training)), 1)
+        # Keyed on every setting the factor depends on, as the fields may change
+        key = (self.method, n_training, self.pfa, rank)
+        if key not in self._scales:
+            self._scales[key] = threshold_factor(self.method, n_training, self.pfa, rank)
+        return self._scales[key], rank
+
+    def detect_power(self, values: npt.NDArray, two_dimensional: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Detections in a (rows, bins) array of powers, or of complex samples
+        whose power |x|^2 is then formed one tile at a time.
+
+        Returns:
+            (rows, bins, snr) of every cell above its threshold
+        """
+        values = np.atleast_2d(values)
+        n_rows, n_bins = values.shape
+        gd, gr, td, tr = self._cells(two_dimensional)
+        pd, pr = gd + td, gr + tr
+        height, width = 2*pd + 1, 2*pr + 1
+        n_training = height*width - (2*gd + 1)*(2*gr + 1)
+        if self.method in ("go", "so"):
+            n_training = 2*height*tr
+        scale, rank = self._scale(n_training)
+
+        row_bytes = (n_bins + 2*pr)*values.itemsize
+        if self.method == "os":
+            row_bytes *= height*width
+        tile = max(self.tile_bytes//row_bytes, 1)
+        columns = np.arange(-pr, n_bins + pr) % n_bins
+
+        with instrumentation.stage("sfcw.cfar") as stage:
+            found = ([], [], [])
+            for r0 in range(0, n_rows, tile):
+                r1 = min(r0 + tile, n_rows)
+                rows = np.arange(r0 - pd, r1 + pd) % n_rows
+                padded = values[np.ix_(rows, columns)]
+                if np.iscomplexobj(padded):
+                    padded = np.abs(padded)**2
+                if self.method == "os":
+                    noise = self._order_statistic(padded, (gd, gr, td, tr), rank)
+                else:
+                    noise = self._box_noise(padded, (gd, gr, td, tr), r1 - r0, n_bins)
+                cells = padded[pd:pd + r1 - r0, pr:pr + n_bins]
+                detected = cells > scale*noise
+                i, j = np.nonzero(detected)
+                found[0].append(i + r0)
+                found[1].append(j)
+                found[2].append(cells[i, j]/noise[i, j])
+            stage.record(values.size)
+        return tuple(np.concatenate(arrays) for arrays in found)
+
+    def _box_noise(self, padded, cells, n_rows, n_bins):
+        gd, gr, td, tr = cells
+        pd, pr = gd + td, gr + tr
+        table = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1))
+        np.cumsum(np.cumsum(padded, axis=0, dtype=np.float64), axis=1, out=table[1:, 1:])
+
+        def box(a, b, c, d):
+            # Sum over rows [i+a, i+b) and columns [j+c, j+d) around every cell (i, j)
+            return (
+                table[pd + b:pd + b + n_rows, pr + d:pr + d + n_bins]
+                - table[pd + a:pd + a + n_rows, pr + d:pr + d + n_bins]
+                - table[pd + b:pd + b + n_rows, pr + c:pr + c + n_bins]
+                + table[pd + a:pd + a + n_rows, pr + c:pr + c + n_bins]
+                )
+
+        if self.method == "ca":
+            ring = box(-pd, pd + 1, -pr, pr + 1) - box(-gd, gd + 1, -gr, gr + 1)
+            return ring/((2*pd + 1)*(2*pr + 1) - (2*gd + 1)*(2*gr + 1))
+        before = box(-pd, pd + 1, -pr, -gr)
+        after = box(-pd, pd + 1, gr + 1, pr + 1)
+        pick = np.maximum if self.method == "go" else np.minimum
+        return pick(before, after)/((2*pd + 1)*tr)
+
+    def _order_statistic(self, padded, cells, rank):
+        gd, gr, td, tr = cells
+        pd, pr = gd + td, gr + tr
+        mask = np.ones((2*pd + 1, 2*pr + 1), dtype=bool)
+        mask[td:td + 2*gd + 1, tr:tr + 2*gr + 1] = False
+        windows = np.lib.stride_tricks.sliding_window_view(padded, mask.shape)
+        training = windows[..., mask]
+        return np.partition(training, rank - 1, axis=-1)[..., rank - 1]
+
+    def detect_profiles(self, profile: RangeProfile) -> Detections:
+        """
+        Detections along range in every burst of a RangeProfile.
+        """
+        rows, bins, snr = self.detect_power(profile.profiles, two_dimensional=False)
+        return Detections(rows, bins, profile.ranges[bins], None, snr)
+
+    def detect_map(self, rdm: RangeDopplerMap) -> Detections:
+        """
+        Detections in a RangeDopplerMap.
+        """
+        rows, bins, snr = self.detect_power(rdm.values)
+        return Detections(rows, bins, rdm.ranges[bins], rdm.velocities[rows], snr)
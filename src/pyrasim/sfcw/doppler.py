@@ -0,0 +1,169 @@
+import numpy as np
+import numpy.typing as npt
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from pyrasim import instrumentation
+from pyrasim.constants import LIGHT_SPEED
+from pyrasim.signals.precision import complex_dtype
+from .plans import cached, fft_size, processing_plan, window
+
+
+def velocity_axis(n_doppler: int, burst_period: float, center_frequency: float) -> npt.NDArray[np.float64]:
+    """
+    Radial velocity of each Doppler bin, ascending (fftshift order):
+    v = ν c/(2f_c) for the slow-time frequencies ν of a burst period.
+    Positive velocities move away from the radar.
+    """
+    return np.fft.fftshift(np.fft.fftfreq(n_doppler, burst_period))*LIGHT_SPEED/(2*center_frequency)
+
+
+def coupling_compensation(
+        frequencies: npt.NDArray[np.float64],
+        velocities: npt.NDArray[np.float64],
+        pulse_repetition_interval: float,
+        ) -> npt.NDArray[np.complex128]:
+    """
+    (velocities, steps) phasors removing the range-velocity coupling of SFCW.
+
+    A target moving at v adds the phase -4πf_i v iT/c to step i, since pulse
+    i is sent iT after the start of its burst. Across the steps this is a
+    spurious range shift (and spread); multiplying the steps of the Doppler
+    bin of velocity v by e^{+j4πf_i v iT/c} puts its targets back at their
+    range.
+    """
+    delay = 2*np.multiply.outer(velocities, np.arange(len(frequencies))*pulse_repetition_interval)/LIGHT_SPEED
+    return np.exp(2j*np.pi*np.mod(frequencies*delay, 1))
+
+
+@dataclass
+class RangeDopplerMap:
+    """
+    Range-Doppler map of a sequence of bursts.
+
+    ranges: (bins,) range of each column (m)
+    velocities: (doppler,) radial velocity of each row (m/s)
+    values: (doppler, bins) complex 2-D transform output
+    """
+    ranges: npt.NDArray[np.float64]
+    velocities: npt.NDArray[np.float64]
+    values: npt.NDArray[np.complex128]
+
+    @property
+    def magnitude(self) -> npt.NDArray[np.float64]:
+        return np.abs(self.values)
+
+    def peak(self):
+        """
+        (range, velocity) of the strongest cell.
+        """
+        d, r = np.unravel_index(np.argmax(np.abs(self.values)), self.values.shape)
+        return self.ranges[r], self.velocities[d]
+
+
+class RangeDopplerProcessor:
+    """
+    Fast-time/slow-time processing of SFCW I/Q bursts into a range-Doppler map.
+
+    Bursts are fed in chunks of (bursts, n_pulses) I/Q samples and written,
+    windowed along both axes, straight into a preallocated slow-time matrix.
+    process() then runs an IFFT over the bursts (Doppler), applies the
+    range-velocity coupling compensation of each Doppler bin and runs the
+    zero-padded IFFT over the steps (range). FFT sizes, windows and
+    compensation phasors are computed once, and the work buffers are reused
+    by every call, so the map returned by process() is overwritten by the
+    next one.
+
+    Args:
+        n_pulses, n_bursts: frequency steps per burst and bursts per map
+        freq_start, freq_step_size: f_0 and Δf (Hz)
+        pulse_repetition_interval: T (s)
+        range_window, doppler_window: names of WINDOWS
+        pad_factor, doppler_pad_factor: zero padding on top of the next power of two
+        compensate: apply the range-velocity coupling compensation
+        dtype: float32 or float64 precision, None for the global one
+    """
+
+    def __init__(
+            self,
+            n_pulses: int,
+            n_bursts: int,
+            freq_start: float,
+            freq_step_size: float,
+            pulse_repetition_interval: float,
+            range_window: str = "hann",
+            doppler_window: str = "hann",
+            pad_factor: int = 1,
+            doppler_pad_factor: int = 1,
+            compensate: bool = True,
+            dtype: Optional[npt.DTypeLike] = None,
+            ):
+        plan = processing_plan(n_pulses, freq_step_size, freq_start, range_window, pad_factor)
+        self.n_pulses = n_pulses
+        self.n_bursts = n_bursts
+        self.n_fft = plan.n_fft
+        self.n_doppler = fft_size(n_bursts, doppler_pad_factor)
+        dtype = complex_dtype(dtype)
+
+        center_frequency = np.mean(plan.frequencies)
+        burst_period = n_pulses*pulse_repetition_interval
+        self.ranges = plan.ranges
+        self.velocities = cached(
+            ("velocities", self.n_doppler, burst_period, center_frequency),
+            lambda: velocity_axis(self.n_doppler, burst_period, center_frequency),
+            )
+
+        self.range_window = plan.taper.astype(dtype)
+        self.doppler_window = window(doppler_window, n_bursts).astype(dtype)
+        self.compensation = None
+        if compensate:
+            # Rows in FFT order, as the Doppler transform leaves them
+            self.compensation = cached(
+                ("compensation", n_pulses, freq_step_size, freq_start, pulse_repetition_interval, self.n_doppler, dtype),
+                lambda: coupling_compensation(
+                    plan.frequencies, np.fft.ifftshift(self.velocities), pulse_repetition_interval
+                    ).astype(dtype),
+                )
+
+        self._slow_time = np.zeros((self.n_doppler, n_pulses), dtype=dtype)
+        self._map = np.empty((self.n_doppler, self.n_fft), dtype=dtype)
+        self._bursts = 0
+
+    def reset(self):
+        self._slow_time[:] = 0
+        self._bursts = 0
+
+    def add(self, iq: npt.NDArray[np.complex128]):
+        """
+        Append a (bursts, n_pulses) chunk of I/Q samples.
+        """
+        iq = iq.reshape(-1, self.n_pulses)
+        b = self._bursts
+        if b + len(iq) > self.n_bursts:
+            raise TypeError(f"More than {self.n_bursts} bursts were added")
+        rows = self._slow_time[b:b + len(iq)]
+        np.multiply(iq, self.range_window, out=rows)
+        rows *= self.doppler_window[b:b + len(iq), None]
+        self._bursts += len(iq)
+
+    def process(self, chunks: Optional[Iterable[npt.NDArray[np.complex128]]] = None) -> RangeDopplerMap:
+        """
+        Range-Doppler map of the bursts added so far and those of `chunks`,
+        e.g. SteppedFrequencyCW.iq_chunks(). The processor is reset afterwards.
+        """
+        for chunk in chunks or ():
+            self.add(chunk)
+        with instrumentation.stage("sfcw.range_doppler") as stage:
+            # Assigned into the preallocated buffers rather than with the
+            # out= argument of np.fft, which only exists from NumPy 2.0
+            spectrum = self._slow_time
+            spectrum[:] = np.fft.ifft(spectrum, axis=0)
+            if self.compensation is not None:
+                spectrum *= self.compensation
+            # Range transform stored straight into the fftshifted Doppler rows
+            half = (self.n_doppler + 1)//2
+            self._map[:self.n_doppler - half] = np.fft.ifft(spectrum[half:], n=self.n_fft, axis=1)
+            self._map[self.n_doppler - half:] = np.fft.ifft(spectrum[:half], n=self.n_fft, axis=1)
+            stage.record(self._map.size)
+        self.reset()
+        return RangeDopplerMap(self.ranges, self.velocities, self._map)
@@ -0,0 +1,267 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from pyrasim.signals.precision import complex_dtype, real_dtype
+from . import SteppedFrequencyCW
+from .detection import CFAR
+from .plans import processing_plan
+
+# Trials of one work unit: its random stream and the batch it is simulated in
+BATCH_TRIALS = 256
+
+
+@dataclass
+class NoiseModel:
+    """
+    Thermal noise and clutter added to the I/Q samples of every step.
+
+    snr_db: per-step SNR of a unit amplitude target at the range gate, i.e.
+        |A|^2 over the complex Gaussian noise power; the range IFFT then adds
+        the coherent integration gain 10 log10(n_pulses)
+    clutter_to_noise_db: per-step clutter power over the noise power, None
+        for no clutter
+    clutter_shape: K-distribution shape ν of the clutter texture, None for
+        Gaussian (Rayleigh amplitude) clutter; small ν gives spiky clutter
+    """
+    snr_db: float = 10.0
+    clutter_to_noise_db: Optional[float] = None
+    clutter_shape: Optional[float] = None
+
+    def noise_power(self, amplitude: float = 1.0) -> float:
+        return abs(amplitude)**2 / 10**(self.snr_db/10)
+
+    def add(self, iq: npt.NDArray[np.complexfloating], rng: np.random.Generator, amplitude: float = 1.0):
+        """
+        Add noise and clutter in place to a (trials, bursts, steps) batch.
+
+        Clutter is stationary: each trial draws one complex return per
+        range cell, the same for all its bursts, and maps it onto the steps
+        with a DFT over the cells, as the echo of a scatterer in each cell.
+        """
+        noise_power = self.noise_power(amplitude)
+        iq += _complex_normal(rng, iq.shape, noise_power, iq.dtype)
+        if self.clutter_to_noise_db is None:
+            return
+        trials, _, steps = iq.shape
+        cells = _complex_normal(rng, (trials, 1, steps), noise_power * 10**(self.clutter_to_noise_db/10), iq.dtype)
+        if self.clutter_shape is not None:
+            cells *= np.sqrt(rng.gamma(self.clutter_shape, 1/self.clutter_shape, cells.shape)).astype(cells.real.dtype)
+        iq += np.fft.fft(cells, axis=-1, norm="ortho")
+
+
+def _complex_normal(rng, shape, power, dtype):
+    """
+    Circular complex Gaussian samples of mean power `power`.
+    """
+    samples = rng.standard_normal((*shape, 2), dtype=real_dtype(dtype))
+    samples *= np.sqrt(power/2)
+    return samples.view(dtype)[..., 0]
+
+
+@dataclass
+class TrialStatistics:
+    """
+    Detection counts aggregated over Monte Carlo trials. Only integer counts
+    are kept, so merging work units in any order gives the same result.
+
+    trials: simulated trials
+    profiles: range profiles tested, one per burst of every trial
+    detections: (profile, target) pairs detected within the tolerance
+    opportunities: (profile, target) pairs
+    false_alarms: detections outside every target tolerance
+    cells: cells tested for false alarms, 0 when the range cells are not
+        independent (zero-padded profiles), which leaves pfa at NaN
+    """
+    trials: int = 0
+    profiles: int = 0
+    detections: int = 0
+    opportunities: int = 0
+    false_alarms: int = 0
+    cells: int = 0
+
+    def __add__(self, other: "TrialStatistics") -> "TrialStatistics":
+        return TrialStatistics(
+            self.trials + other.trials,
+            self.profiles + other.profiles,
+            self.detections + other.detections,
+            self.opportunities + other.opportunities,
+            self.false_alarms + other.false_alarms,
+            self.cells + other.cells,
+            )
+
+    @property
+    def pd(self) -> float:
+        return self.detections/self.opportunities if self.opportunities else float("nan")
+
+    @property
+    def pfa(self) -> float:
+        return self.false_alarms/self.cells if self.cells else float("nan")
+
+
+@dataclass
+class _Unit:
+    """
+    Everything a worker needs for one work unit, pickled once per unit.
+    """
+    iq: npt.NDArray[np.complexfloating]
+    taper: npt.NDArray[np.floating]
+    n_fft: int
+    target_bins: npt.NDArray[np.int64]
+    tolerance: int
+    count_false_alarms: bool
+    amplitude: float
+    noise: NoiseModel
+    detector: CFAR
+
+
+def _run_unit(unit: _Unit, seed: np.random.SeedSequence, n_trials: int) -> TrialStatistics:
+    """
+    Simulate `n_trials` trials as one batch and reduce them to counts. Only
+    the counts leave the worker, never the trial arrays.
+    """
+    rng = np.random.default_rng(seed)
+    iq = np.broadcast_to(unit.iq, (n_trials, *unit.iq.shape)).copy()
+    unit.noise.add(iq, rng, unit.amplitude)
+    iq *= unit.taper
+    profiles = np.fft.ifft(iq, n=unit.n_fft, axis=-1).reshape(-1, unit.n_fft)
+    rows, bins, _ = unit.detector.detect_power(profiles, two_dimensional=False)
+
+    # Bins within the tolerance of each target, and of any target
+    offsets = np.arange(-unit.tolerance, unit.tolerance + 1)
+    windows = (unit.target_bins[:, None] + offsets) % unit.n_fft
+    near = np.zeros(unit.n_fft, dtype=bool)
+    near[windows] = True
+
+    detections = 0
+    for target in windows:
+        hit = np.zeros(len(profiles), dtype=bool)
+        hit[rows[np.isin(bins, target)]] = True
+        detections += int(np.count_nonzero(hit))
+    statistics = TrialStatistics(
+        trials=n_trials,
+        profiles=len(profiles),
+        detections=detections,
+        opportunities=len(profiles)*len(windows),
+        )
+    if unit.count_false_alarms:
+        statistics.false_alarms = int(np.count_nonzero(~near[bins]))
+        statistics.cells = len(profiles)*int(np.count_nonzero(~near))
+    return statistics
+
+
+def _units(n_trials: int, batch_trials: int) -> Iterator[int]:
+    for start in range(0, n_trials, batch_trials):
+        yield min(batch_trials, n_trials - start)
+
+
+def run_trials(
+        sfcw: SteppedFrequencyCW,
+        n_trials: int,
+        noise: NoiseModel,
+        detector: Optional[CFAR] = None,
+        n_bursts: int = None,
+        mode: str = "analytic",
+        window: str = "rectangular",
+        pad_factor: int = 1,
+        tolerance: int = 1,
+        seed: Union[int, np.random.SeedSequence] = 0,
+        batch_trials: int = BATCH_TRIALS,
+        jobs: int = 1,
+        ) -> TrialStatistics:
+    """
+    Pd and Pfa of `detector` on the range profiles of `sfcw` in noise and
+    clutter, estimated over `n_trials` Monte Carlo trials.
+
+    The noise-free I/Q samples are simulated once, then every trial adds its
+    own noise and clutter and detects along range in each burst. A target
+    counts as detected in a profile when a detection falls within
+    `tolerance` bins of its range bin; detections further from every target
+    are false alarms.
+
+    The CFAR thresholds assume independent range cells. That only holds
+    when the profile is not zero-padded, i.e. pad_factor is 1 and n_pulses
+    a power of two: the default rectangular window then gives a measured Pfa
+    at the design value, while tapered windows correlate neighbouring cells
+    and raise it (about twice the design value with "hann"). Zero-padding
+    interpolates between the cells and correlates them as well, so on padded
+    profiles no false alarms are counted and the returned pfa is NaN; Pd is
+    estimated either way.
+
+    Trials are split into work units of `batch_trials` trials, simulated as
+    one vectorized batch each. Unit u draws from the u-th child spawned from
+    `seed` by this call (SeedSequence.spawn), so the result only depends on
+    seed, the children it spawned before and batch_trials, never on `jobs`.
+    An int seed is a fresh SeedSequence, so the same int always gives the
+    same result. With jobs > 1 the units run on a
+    ProcessPoolExecutor, with at most a few units per worker in flight.
+
+    Args:
+        n_bursts: bursts per trial, N_bursts by default
+        mode: simulation mode of the noise-free I/Q samples
+        window: range window, one of WINDOWS
+        jobs: worker processes, 0 for one per CPU
+    """
+    detector = detector or CFAR()
+    if n_bursts == None:
+        n_bursts = sfcw.N_bursts
+    plan = processing_plan(sfcw.n_pulses, sfcw.freq_step_size, sfcw.freq_start, window, pad_factor)
+    resolution = plan.ranges[1]
+    dtype = complex_dtype(sfcw.dtype)
+    unit = _Unit(
+        iq=sfcw.iq_samples(n_bursts, mode=mode).astype(dtype, copy=False),
+        taper=plan.taper.astype(real_dtype(sfcw.dtype)),
+        n_fft=plan.n_fft,
+        target_bins=np.round(sfcw.targets.ranges/resolution).astype(np.int64) % plan.n_fft,
+        tolerance=tolerance,
+        count_false_alarms=plan.n_fft == sfcw.n_pulses,
+        amplitude=sfcw.transmitted_amplitude,
+        noise=noise,
+        detector=detector,
+        )
+    seed = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    sizes = list(_units(n_trials, batch_trials))
+    # spawn() continues after the children `seed` already spawned, so the
+    # streams never overlap those of earlier calls with the same seed
+    units = zip(seed.spawn(len(sizes)), sizes)
+
+    statistics = TrialStatistics()
+    if jobs == 1:
+        for child, trials in units:
+            statistics += _run_unit(unit, child, trials)
+        return statistics
+
+    jobs = jobs or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for child, trials in units:
+            pending.append(executor.submit(_run_unit, unit, child, trials))
+            if len(pending) >= 4*jobs:
+                statistics += pending.popleft().result()
+        while pending:
+            statistics += pending.popleft().result()
+    return statistics
+
+
+def detection_curve(
+        sfcw: SteppedFrequencyCW,
+        snr_db: Sequence[float],
+        n_trials: int,
+        noise: Optional[NoiseModel] = None,
+        **kwargs,
+        ) -> List[TrialStatistics]:
+    """
+    run_trials() at every SNR of `snr_db`, on top of the clutter settings of
+    `noise`. Every SNR uses the same seed, so the curve is smooth (common
+    random numbers) as well as reproducible.
+    """
+    noise = noise or NoiseModel()
+    return [
+        run_trials(sfcw, n_trials, NoiseModel(snr, noise.clutter_to_noise_db, noise.clutter_shape), **kwargs)
+        for snr in snr_db
+        ]
@@ -0,0 +1,98 @@
+import numpy as np
+import numpy.typing as npt
+from dataclasses import dataclass
+from typing import Callable, Hashable
+
+from pyrasim.constants import LIGHT_SPEED
+from pyrasim.signals.cache import SampleCache
+
+# Constants shared by every burst and sweep point with the same parameters
+plan_cache = SampleCache(max_bytes=64 * 2**20)
+
+WINDOWS = {
+    "rectangular": np.ones,
+    "hann": np.hanning,
+    "hamming": np.hamming,
+    "blackman": np.blackman,
+    "bartlett": np.bartlett,
+    "kaiser": lambda n: np.kaiser(n, 8.0),
+}
+
+
+def fft_size(n_steps: int, pad_factor: int = 1) -> int:
+    """
+    Power of two of at least n_steps, times the zero-padding factor.
+    """
+    return pad_factor * (1 << int(np.ceil(np.log2(max(n_steps, 1)))))
+
+
+def range_axis(n_fft: int, freq_step_size: float) -> npt.NDArray[np.float64]:
+    """
+    R_k = k c/(2 n_fft Δf), spanning the unambiguous range c/(2Δf).
+    """
+    return np.arange(n_fft) * LIGHT_SPEED/(2 * n_fft * freq_step_size)
+
+
+def cached(key: Hashable, compute: Callable[[], npt.NDArray]) -> npt.NDArray:
+    """
+    Read-only array of `key` from plan_cache, computed on a miss.
+    """
+    return plan_cache.get_or_put(key, lambda: (compute(),))[0]
+
+
+def window(name: str, n: int) -> npt.NDArray[np.float64]:
+    """
+    Taper of length n, one of WINDOWS, shared through plan_cache.
+    """
+    if name not in WINDOWS:
+        raise TypeError(f"Window must be one of {tuple(WINDOWS)}")
+    return cached(("window", name, n), lambda: WINDOWS[name](n))
+
+
+@dataclass(frozen=True)
+class ProcessingPlan:
+    """
+    Constants of the range processing of N steps of Δf from f_0, padded and
+    tapered: FFT size, step frequencies, range window and range axis. The
+    arrays are read-only, as they are shared through plan_cache.
+    """
+    n_pulses: int
+    freq_step_size: float
+    freq_start: float
+    window: str
+    pad_factor: int
+    n_fft: int
+    frequencies: npt.NDArray[np.float64]
+    taper: npt.NDArray[np.float64]
+    ranges: npt.NDArray[np.float64]
+
+    @property
+    def nbytes(self) -> int:
+        return self.frequencies.nbytes + self.taper.nbytes + self.ranges.nbytes
+
+
+def _plan(n_pulses, freq_step_size, freq_start, window_name, pad_factor) -> ProcessingPlan:
+    n_fft = fft_size(n_pulses, pad_factor)
+    frequencies = freq_start + np.arange(n_pulses)*freq_step_size
+    ranges = range_axis(n_fft, freq_step_size)
+    for array in (frequencies, ranges):
+        array.flags.writeable = False
+    return ProcessingPlan(
+        n_pulses, freq_step_size, freq_start, window_name, pad_factor,
+        n_fft, frequencies, window(window_name, n_pulses), ranges,
+        )
+
+
+def processing_plan(
+        n_pulses: int,
+        freq_step_size: float,
+        freq_start: float = 0.0,
+        window: str = "rectangular",
+        pad_factor: int = 1,
+        ) -> ProcessingPlan:
+    """
+    ProcessingPlan of (N, Δf, f_0, window, pad factor), built once and then
+    served from plan_cache (LRU, 64 MiB, thread-safe; see plan_cache.stats()).
+    """
+    key = ("plan", n_pulses, freq_step_size, freq_start, window, pad_factor)
+    return plan_cache.get_or_put(key, lambda: (_plan(n_pulses, freq_step_size, freq_start, window, pad_factor),))[0]
@@ -0,0 +1,73 @@
+import numpy as np
+import numpy.typing as npt
+from dataclasses import dataclass
+
+from pyrasim import instrumentation
+from .burst import Burst
+from .plans import processing_plan
+
+
+@dataclass
+class RangeProfile:
+    """
+    Synthetic range profiles of one or more bursts.
+
+    ranges: (bins,) range of each bin (m)
+    profiles: (bursts, bins) complex IFFT output
+    """
+    ranges: npt.NDArray[np.float64]
+    profiles: npt.NDArray[np.complex128]
+
+    @property
+    def magnitude(self) -> npt.NDArray[np.float64]:
+        return np.abs(self.profiles)
+
+
+def mix_iq(
+        received: Burst,
+        reference: Burst,
+        reference_amplitude: float = 1.0,
+        ) -> npt.NDArray[np.complex128]:
+    """
+    I/Q value of every pulse at the range gate.
+
+    The received pulses are mixed with the analytic reference sampled over
+    the same gate window, and the product is integrated over the gate, which
+    removes the 2f term. A reference of amplitude A_z leaves (A_z/2) times
+    the received I/Q value, so the product is scaled by 2/A_z: the result is
+    the amplitude and phase of the received pulse, whatever the reference
+    amplitude.
+
+    Baseband bursts are mixed the same way on their complex envelopes.
+
+    Args:
+        received: (pulses, samples) real received burst over the gate windows
+        reference: (pulses, samples) analytic reference over the same windows
+        reference_amplitude: A_z, the constant modulus of the reference
+
+    Returns:
+        (pulses,) complex I/Q samples
+    """
+    # Complex envelopes carry no 2f term and no factor 1/2
+    scale = (1 if received.baseband else 2)/reference_amplitude
+    return scale*np.mean(received.samples*np.conj(reference.samples), axis=-1)
+
+
+def range_profile(
+        iq: npt.NDArray[np.complex128],
+        freq_step_size: float,
+        pad_factor: int = 1,
+        ) -> RangeProfile:
+    """
+    Zero-padded IFFT over the frequency steps of each burst.
+
+    Args:
+        iq: (..., steps) I/Q samples, one row per burst
+        freq_step_size: Δf (Hz)
+        pad_factor: zero-padding factor on top of the next power of two
+    """
+    plan = processing_plan(iq.shape[-1], freq_step_size, pad_factor=pad_factor)
+    with instrumentation.stage("sfcw.range_profile") as stage:
+        profiles = np.fft.ifft(iq, n=plan.n_fft, axis=-1)
+        stage.record(profiles.size, profiles.nbytes)
+    return RangeProfile(ranges=plan.ranges, profiles=profiles)
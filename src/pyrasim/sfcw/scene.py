@@ -0,0 +1,53 @@
+import numpy as np
+import numpy.typing as npt
+from dataclasses import dataclass
+from typing import Iterator, Union
+
+from pyrasim.constants import LIGHT_SPEED
+
+# Upper bound on the elements of the (pulses, targets) matrices built at once
+CHUNK_ELEMENTS = 2**22
+
+
+@dataclass
+class Scene:
+    """
+    Point scatterers stored as struct-of-arrays columns.
+
+    ranges: (targets,) range at t = 0 (m)
+    velocities: (targets,) radial velocity (ms-1)
+    amplitudes: (targets,) complex RCS amplitude relative to the transmitted amplitude
+    """
+    ranges: npt.NDArray[np.float64]
+    velocities: npt.NDArray[np.float64] = 0.0
+    amplitudes: npt.NDArray[Union[np.float64, np.complex128]] = 1.0
+
+    def __post_init__(self):
+        self.ranges = np.atleast_1d(np.asarray(self.ranges, dtype=np.float64))
+        self.velocities = np.broadcast_to(np.asarray(self.velocities, dtype=np.float64), self.ranges.shape)
+        self.amplitudes = np.broadcast_to(np.asarray(self.amplitudes), self.ranges.shape)
+        if self.ranges.ndim != 1:
+            raise TypeError("Scene columns must be one dimensional")
+
+    def __len__(self):
+        return len(self.ranges)
+
+    @classmethod
+    def point(cls, target_range: float, target_velocity: float = 0.0, amplitude: complex = 1.0):
+        return cls([target_range], [target_velocity], [amplitude])
+
+    def echo_delay(self, time: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        (pulses, targets) round-trip delay of the echoes of pulses sent at
+        `time` (stop-and-hop).
+        """
+        return (self.ranges + np.multiply.outer(time, self.velocities))/(LIGHT_SPEED/2)
+
+    def chunks(self, n_pulses: int) -> Iterator["Scene"]:
+        """
+        Views of consecutive targets such that a (n_pulses, chunk) matrix stays
+        below CHUNK_ELEMENTS.
+        """
+        size = max(CHUNK_ELEMENTS // max(n_pulses, 1), 1)
+        for i in range(0, len(self), size):
+            yield Scene(self.ranges[i:i + size], self.velocities[i:i + size], self.amplitudes[i:i + size])
@@ -0,0 +1,217 @@
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from .processing import RangeProfile, range_profile
+from .utils import _getZMQPubSocket, _getZMQSocket, _zmq
+
+BACKPRESSURE_POLICIES = ("block", "drop")
+
+
+@dataclass
+class StreamStats:
+    """
+    Throughput counters of one end of a stream.
+
+    dropped counts messages, whatever their number of bursts, so the two
+    ends compare: messages discarded by the publisher's "drop" policy, and
+    messages missing from the sequence numbers at the subscriber.
+    """
+    messages: int = 0
+    bursts: int = 0
+    bytes: int = 0
+    dropped: int = 0
+    stalls: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    def count(self, bursts: int, nbytes: int):
+        self.messages += 1
+        self.bursts += bursts
+        self.bytes += nbytes
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def as_dict(self) -> Dict:
+        elapsed = self.elapsed
+        return {
+            "messages": self.messages,
+            "bursts": self.bursts,
+            "bytes": self.bytes,
+            "dropped": self.dropped,
+            "stalls": self.stalls,
+            "elapsed": elapsed,
+            "bursts_per_second": self.bursts/elapsed if elapsed else 0.0,
+            "bytes_per_second": self.bytes/elapsed if elapsed else 0.0,
+        }
+
+
+class RingBuffer:
+    """
+    Fixed-capacity FIFO of I/Q bursts, one (n_pulses,) row per burst, stored
+    in a single preallocated array. When full, the oldest bursts are
+    overwritten and counted as overruns.
+    """
+
+    def __init__(self, capacity: int, n_pulses: int, dtype: npt.DTypeLike = np.complex128):
+        self.buffer = np.zeros((capacity, n_pulses), dtype=dtype)
+        self.capacity = capacity
+        self.head = 0       # index of the oldest burst
+        self.size = 0
+        self.overruns = 0
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def free(self) -> int:
+        return self.capacity - self.size
+
+    def push(self, bursts: npt.NDArray):
+        bursts = bursts.reshape(-1, self.buffer.shape[1])
+        if len(bursts) > self.capacity:
+            self.overruns += len(bursts) - self.capacity
+            bursts = bursts[-self.capacity:]
+        overflow = max(self.size + len(bursts) - self.capacity, 0)
+        if overflow:
+            self.overruns += overflow
+            self.head = (self.head + overflow) % self.capacity
+            self.size -= overflow
+        tail = (self.head + self.size) % self.capacity
+        first = min(len(bursts), self.capacity - tail)
+        self.buffer[tail:tail + first] = bursts[:first]
+        self.buffer[:len(bursts) - first] = bursts[first:]
+        self.size += len(bursts)
+
+    def pop(self, n: Optional[int] = None) -> npt.NDArray:
+        """
+        Remove and return the `n` oldest bursts (all of them by default).
+        """
+        n = self.size if n is None else min(n, self.size)
+        index = (self.head + np.arange(n)) % self.capacity
+        bursts = self.buffer[index]
+        self.head = (self.head + n) % self.capacity
+        self.size -= n
+        return bursts
+
+
+class BurstPublisher:
+    """
+    Publishes I/Q bursts as two-frame ZMQ messages: a small JSON header
+    (sequence number, dtype, shape and caller metadata) followed by the raw
+    NumPy buffer, sent without copying.
+
+    The socket is created with ZMQ_XPUB_NODROP, so reaching the send
+    high-water mark raises instead of silently discarding. With the "block"
+    policy the publisher then waits for the subscribers to catch up; with
+    "drop" the message is discarded and counted.
+    """
+
+    def __init__(self, socket: "zmq.Socket", policy: str = "block", timeout: int = 1000):
+        if policy not in BACKPRESSURE_POLICIES:
+            raise TypeError(f"Backpressure policy must be one of {BACKPRESSURE_POLICIES}")
+        self.socket = socket
+        self.policy = policy
+        self.timeout = timeout
+        self.sequence = 0
+        self.stats = StreamStats()
+
+    def publish(self, iq: npt.NDArray, **metadata) -> bool:
+        """
+        Send a (bursts, n_pulses) block as one message. Returns False if it
+        was dropped.
+        """
+        iq = np.ascontiguousarray(iq)
+        header = json.dumps({
+            "sequence": self.sequence,
+            "dtype": iq.dtype.str,
+            "shape": iq.shape,
+            "metadata": metadata,
+        }).encode()
+        self.sequence += 1
+        zmq = _zmq()
+        while True:
+            try:
+                self.socket.send_multipart([header, iq], flags=zmq.NOBLOCK, copy=False)
+                self.stats.count(len(iq), iq.nbytes)
+                return True
+            except zmq.Again:
+                if self.policy == "drop":
+                    self.stats.dropped += 1
+                    return False
+                self.stats.stalls += 1
+                self.socket.poll(self.timeout, zmq.POLLOUT)
+
+    def publish_chunks(self, chunks: Iterator[npt.NDArray], **metadata) -> Dict:
+        """
+        Publish every block of `chunks`, e.g. SteppedFrequencyCW.iq_chunks().
+        """
+        for chunk in chunks:
+            self.publish(chunk, **metadata)
+        return self.stats.as_dict()
+
+
+class BurstSubscriber:
+    """
+    Receives bursts published by BurstPublisher on a SUB socket and queues
+    them in a RingBuffer that feeds the range-profile processing.
+    """
+
+    def __init__(self, socket: "zmq.Socket", ring: RingBuffer):
+        self.socket = socket
+        self.ring = ring
+        self.stats = StreamStats()
+        self.sequence = None
+        self.metadata: Dict = {}
+        self._message_bursts = 1
+
+    def receive(self, timeout: int = 0) -> int:
+        """
+        Move the messages available within `timeout` ms into the ring buffer,
+        as long as the last message size still fits. Messages left on the
+        socket fill its high-water mark, which pushes back on the publisher.
+
+        Returns the number of bursts received. Gaps in the sequence numbers
+        are added to stats.dropped as lost messages.
+        """
+        zmq = _zmq()
+        received = 0
+        while self.ring.free >= self._message_bursts and self.socket.poll(timeout, zmq.POLLIN):
+            header, payload = self.socket.recv_multipart(copy=False)
+            header = json.loads(header.bytes)
+            iq = np.frombuffer(payload.buffer, dtype=np.dtype(header["dtype"])).reshape(header["shape"])
+            if self.sequence is not None and header["sequence"] > self.sequence + 1:
+                self.stats.dropped += header["sequence"] - self.sequence - 1
+            self.sequence = header["sequence"]
+            self.metadata = header["metadata"]
+            self.ring.push(iq)
+            self.stats.count(len(iq), iq.nbytes)
+            self._message_bursts = len(iq)
+            received += len(iq)
+            timeout = 0
+        return received
+
+    def range_profiles(self, freq_step_size: float, pad_factor: int = 1, n_bursts: Optional[int] = None) -> RangeProfile:
+        """
+        Range profiles of the oldest `n_bursts` queued bursts (all by default).
+        """
+        return range_profile(self.ring.pop(n_bursts), freq_step_size, pad_factor)
+
+
+def inproc_pair(
+        name: str = "pyrasim-bursts",
+        hwm: int = 1000,
+        context: Optional["zmq.Context"] = None,
+        ) -> Tuple["zmq.Socket", "zmq.Socket"]:
+    """
+    Connected in-process PUB/SUB sockets, a local stand-in for the SDR link.
+    """
+    context = context or _zmq().Context.instance()
+    publisher = _getZMQPubSocket(None, None, context=context, address=f"inproc://{name}", hwm=hwm)
+    subscriber = _getZMQSocket(None, None, context=context, address=f"inproc://{name}", hwm=hwm)
+    return publisher, subscriber
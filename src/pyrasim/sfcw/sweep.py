@@ -0,0 +1,121 @@
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import SteppedFrequencyCW
+
+# Swept SteppedFrequencyCW fields followed by the summary of each point
+COLUMNS = (
+    "target_range",
+    "target_velocity",
+    "freq_step_size",
+    "n_pulses",
+    "peak_range",
+    "peak_magnitude",
+    "range_resolution",
+    "unambiguous_range",
+)
+
+
+def grid_size(grid: Dict[str, Sequence]) -> int:
+    return int(np.prod([len(values) for values in grid.values()]))
+
+
+def grid_points(grid: Dict[str, Sequence]) -> Iterator[Dict[str, float]]:
+    """
+    Cartesian product of the swept values, generated lazily.
+    """
+    names = list(grid)
+    for values in itertools.product(*(grid[name] for name in names)):
+        yield dict(zip(names, values))
+
+
+def run_point(base: Dict, point: Dict, mode: str = "analytic", pad_factor: int = 1) -> Tuple[Tuple, np.ndarray]:
+    """
+    Simulate one grid point and reduce it to a row of COLUMNS and the
+    burst-averaged range profile magnitude.
+    """
+    sfcw = SteppedFrequencyCW(**{**base, **point})
+    params = sfcw.params
+    profile = sfcw.operate(pad_factor=pad_factor, mode=mode)
+    magnitude = np.mean(profile.magnitude, axis=0)
+    peak = int(np.argmax(magnitude))
+    return (
+        sfcw.target_range,
+        sfcw.target_velocity,
+        sfcw.freq_step_size,
+        sfcw.n_pulses,
+        profile.ranges[peak],
+        magnitude[peak],
+        params.range_resolution,
+        params.unambiguous_range,
+    ), magnitude
+
+
+def _run_chunk(
+        base: Dict,
+        points: List[Dict],
+        mode: str,
+        pad_factor: int,
+        profiles: bool,
+        ) -> Tuple[List[Tuple], Optional[List[np.ndarray]]]:
+    """
+    Run one work unit. Only the summary rows, and the profile magnitudes when
+    asked for, leave the worker, never the waveforms.
+    """
+    results = [run_point(base, point, mode, pad_factor) for point in points]
+    rows = [row for row, _ in results]
+    return rows, [magnitude for _, magnitude in results] if profiles else None
+
+
+def _chunks(points: Iterator[Dict], chunk_size: int) -> Iterator[List[Dict]]:
+    while True:
+        chunk = list(itertools.islice(points, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_sweep(
+        base: Dict,
+        grid: Dict[str, Sequence],
+        jobs: int = 1,
+        chunk_size: int = 16,
+        mode: str = "analytic",
+        pad_factor: int = 1,
+        profiles: bool = False,
+        ) -> Iterator[Tuple[List[Tuple], Optional[List[np.ndarray]]]]:
+    """
+    Run every point of `grid` on top of the `base` SteppedFrequencyCW
+    arguments, yielding the result rows of each chunk in grid order, together
+    with the range profile magnitudes of its points when `profiles` is set.
+
+    With jobs > 1 the chunks run on a ProcessPoolExecutor. At most a few
+    chunks per worker are in flight, so neither the grid nor the results are
+    ever held in memory as a whole.
+
+    Args:
+        base: SteppedFrequencyCW keyword arguments shared by every point
+        grid: swept SteppedFrequencyCW fields and their values
+        jobs: worker processes, 0 for one per CPU
+        chunk_size: grid points per work unit
+    """
+    chunks = _chunks(grid_points(grid), chunk_size)
+    if jobs == 1:
+        for chunk in chunks:
+            yield _run_chunk(base, chunk, mode, pad_factor, profiles)
+        return
+
+    jobs = jobs or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_run_chunk, base, chunk, mode, pad_factor, profiles))
+            if len(pending) >= 4*jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
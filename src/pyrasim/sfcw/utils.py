@@ -1,12 +1,30 @@
-import zmq
-from xmlrpc.client import ServerProxy
+# zmq and xmlrpc are imported by the helpers on first use, so that importing
+# pyrasim (e.g. in sweep workers) does not load the transport libraries
+def _zmq():
+    import zmq
+    return zmq
 
-def _getZMQSocket(host:str, port: int):
-    context = zmq.Context()
+def _getZMQSocket(host:str, port: int, context: "zmq.Context" = None, address: str = None, hwm: int = None):
+    zmq = _zmq()
+    context = context or zmq.Context()
     socket = context.socket(zmq.SUB)
-    socket.connect(f"tcp://{host}:{port}")
+    if hwm is not None:
+        socket.setsockopt(zmq.RCVHWM, hwm)
+    socket.connect(address or f"tcp://{host}:{port}")
     socket.setsockopt(zmq.SUBSCRIBE, b'')
     return socket
 
+def _getZMQPubSocket(host:str, port: int, context: "zmq.Context" = None, address: str = None, hwm: int = None):
+    zmq = _zmq()
+    context = context or zmq.Context()
+    socket = context.socket(zmq.PUB)
+    if hwm is not None:
+        socket.setsockopt(zmq.SNDHWM, hwm)
+    # Raise zmq.Again at the high-water mark instead of dropping silently
+    socket.setsockopt(zmq.XPUB_NODROP, 1)
+    socket.bind(address or f"tcp://{host}:{port}")
+    return socket
+
 def _getXmlRpc(host:str, port: int):
-    return ServerProxy(f"http://{host}:{port}")
\ No newline at end of file
+    from xmlrpc.client import ServerProxy
+    return ServerProxy(f"http://{host}:{port}")
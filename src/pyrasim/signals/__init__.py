@@ -1,2 +1,8 @@
 from .sinusoid import Sinusoid, SineWaveform, CosineWaveform
-from .sinusoid import ComplexSinusoid, ComplexSinusoidWaveform
\ No newline at end of file
+from .sinusoid import ComplexSinusoid, ComplexSinusoidWaveform
+from .cache import SampleCache, sample_cache
+from .store import MemmapStore
+from .time_axis import TimeAxis
+from .bank import SinusoidBank
+from .precision import get_precision, set_precision, precision
+from .baseband import BasebandWaveform
@@ -0,0 +1,74 @@
+import numpy as np
+from typing import Callable, Optional, Tuple
+
+from .store import blockwise
+
+
+def sample_index(time: float, sample_rate: float) -> int:
+    """
+    Integer index of the sample taken at `time` on the grid n/sample_rate.
+    """
+    return int(np.round(time * sample_rate))
+
+
+def sample_count(duration: float, sample_rate: float) -> int:
+    """
+    Number of samples in np.arange(0, duration, 1/sample_rate), without
+    building it.
+    """
+    return max(int(np.ceil(duration/(1.0/sample_rate))), 0)
+
+
+def overlap_combine(
+        a: np.ndarray,
+        a_start: int,
+        b: np.ndarray,
+        b_start: int,
+        op: Callable[[np.ndarray, np.ndarray], np.ndarray],
+        allocate: Callable[..., np.ndarray] = np.zeros,
+        block_size: Optional[int] = None,
+        ) -> Tuple[int, np.ndarray]:
+    """
+    Merge two sampled signals placed on the same sample grid.
+
+    The result spans both signals. Where they overlap the samples are
+    combined with `op`, elsewhere the samples of whichever signal is present
+    are copied and gaps between them are left at zero.
+
+    ----------------------------
+    |     a     |***op**|   b   |
+    ----------------------------
+    a_start   b_start  a_end  b_end
+
+    Args:
+        a, b: sample arrays (real or complex)
+        a_start, b_start: sample index of the first sample of `a` and `b`
+        op: element-wise operation applied on the overlap, e.g. np.add
+        allocate: allocate(length, dtype) returning a zero-filled result
+            array, e.g. MemmapStore.allocate
+        block_size: process the samples in blocks of this size, so
+            memmap-backed operands are never loaded whole
+
+    Returns:
+        (start, result): sample index of the first result sample and the
+        merged array.
+    """
+    a_end = a_start + len(a)
+    b_end = b_start + len(b)
+    start = min(a_start, b_start)
+    end = max(a_end, b_end)
+
+    result = allocate(end - start, dtype=np.result_type(a.dtype, b.dtype))
+    blockwise(result[a_start - start:a_end - start], np.asarray, a, block_size=block_size)
+    blockwise(result[b_start - start:b_end - start], np.asarray, b, block_size=block_size)
+
+    # Overlap, empty when the signals are disjoint
+    i = max(a_start, b_start)
+    j = min(a_end, b_end)
+    if i < j:
+        blockwise(
+            result[i - start:j - start], op,
+            a[i - a_start:j - a_start], b[i - b_start:j - b_start],
+            block_size=block_size
+            )
+    return start, result
@@ -0,0 +1,155 @@
+import numpy as np
+import numpy.typing as npt
+from dataclasses import dataclass
+from typing import Iterable
+
+from .alignment import sample_count
+from .precision import expj
+from .sinusoid import ComplexSinusoid, Sinusoid, Waveform
+from .time_axis import TimeAxis
+
+# Tones evaluated together; with a fixed block of samples this bounds the
+# (samples, tones) matrices whatever the number of tones
+TONE_TILE = 256
+
+# Samples per block of the direct path, so a block is TONE_TILE x 256 cosines
+BLOCK_SAMPLES = 256
+
+# Samples synthesized by one matrix product of the uniform path
+CHUNK_SAMPLES = 2**16
+
+
+@dataclass
+class SinusoidBank:
+    """
+    Sum of K sinusoids stored as arrays
+
+    x(t) = sum_k A_k cos(2πf_k t + θ_k)
+
+    Adding banks only concatenates the columns; merged() combines the
+    components of equal frequency through their phasors A_k e^{jθ_k}.
+    """
+
+    amplitudes: npt.NDArray[np.float64]
+    frequencies: npt.NDArray[np.float64]
+    phases: npt.NDArray[np.float64] = 0.0
+
+    def __post_init__(self):
+        self.amplitudes = np.atleast_1d(np.asarray(self.amplitudes, dtype=np.float64))
+        self.frequencies = np.broadcast_to(np.asarray(self.frequencies, dtype=np.float64), self.amplitudes.shape)
+        self.phases = np.broadcast_to(np.asarray(self.phases, dtype=np.float64), self.amplitudes.shape)
+
+    def __len__(self):
+        return len(self.amplitudes)
+
+    @classmethod
+    def from_sinusoids(cls, sinusoids: Iterable[Sinusoid]) -> "SinusoidBank":
+        sinusoids = list(sinusoids)
+        if any(isinstance(s, ComplexSinusoid) for s in sinusoids):
+            raise TypeError("SinusoidBank only holds real sinusoids!")
+        columns = np.array([(s.amplitude, s.frequency, s.phase) for s in sinusoids], dtype=np.float64).reshape(-1, 3)
+        return cls(columns[:, 0], columns[:, 1], columns[:, 2])
+
+    @property
+    def phasors(self) -> npt.NDArray[np.complex128]:
+        return self.amplitudes * np.exp(1j*self.phases)
+
+    def merged(self) -> "SinusoidBank":
+        """
+        One component per distinct frequency, summing the phasors of the
+        components that share it (np.add.at grouping). Negative frequencies
+        are folded onto positive ones, cos(-ωt + θ) = cos(ωt - θ).
+        """
+        negative = self.frequencies < 0
+        frequencies = np.abs(self.frequencies)
+        phasors = np.where(negative, np.conj(self.phasors), self.phasors)
+        unique, inverse = np.unique(frequencies, return_inverse=True)
+        total = np.zeros(len(unique), dtype=np.complex128)
+        np.add.at(total, inverse, phasors)
+        return SinusoidBank(np.abs(total), unique, np.angle(total))
+
+    def __add__(self, other) -> "SinusoidBank":
+        if isinstance(other, Sinusoid):
+            other = SinusoidBank.from_sinusoids([other])
+        if not isinstance(other, SinusoidBank):
+            return NotImplemented
+        return SinusoidBank(
+            np.concatenate([self.amplitudes, other.amplitudes]),
+            np.concatenate([self.frequencies, other.frequencies]),
+            np.concatenate([self.phases, other.phases]),
+            )
+
+    def __radd__(self, other) -> "SinusoidBank":
+        # sum() starts from 0
+        if isinstance(other, (int, float)) and other == 0:
+            return self
+        return self.__add__(other)
+
+    def _tiles(self):
+        for j in range(0, len(self), TONE_TILE):
+            yield slice(j, j + TONE_TILE)
+
+    def _sample_amplitudes(self, time_axis: np.array) -> npt.NDArray[np.float64]:
+        """
+        Sum of the tones on `time_axis`. Uniform TimeAxis samples go through
+        _sample_uniform(); any other time axis is evaluated directly, in
+        blocks of BLOCK_SAMPLES samples by TONE_TILE tones whose cosines are
+        accumulated with a matrix-vector product.
+        """
+        if isinstance(time_axis, TimeAxis):
+            return self._sample_uniform(time_axis)
+        time_axis = np.asarray(time_axis, dtype=np.float64)
+        angular_frequencies = 2*np.pi*self.frequencies
+        result = np.zeros(len(time_axis), dtype=np.float64)
+        for tones in self._tiles():
+            for i in range(0, len(time_axis), BLOCK_SAMPLES):
+                argument = np.multiply.outer(time_axis[i:i + BLOCK_SAMPLES], angular_frequencies[tones])
+                argument += self.phases[tones]
+                np.cos(argument, out=argument)
+                result[i:i + BLOCK_SAMPLES] += argument @ self.amplitudes[tones]
+        return result
+
+    def _sample_uniform(self, time_axis: TimeAxis) -> npt.NDArray[np.float64]:
+        """
+        Sum of the tones on a uniform time axis as matrix products.
+
+        With the samples split into blocks of B = BLOCK_SAMPLES starting at
+        t_b, sample m of block b is
+
+        x(t_b + m/fs) = Re sum_k E[m, k] C[b, k],
+        E[m, k] = e^{j2πf_k m/fs},  C[b, k] = A_k e^{j(2πf_k t_b + θ_k)}
+
+        E is the same for every block, so each tone tile costs B + n/B
+        complex exponentials instead of n cosines, and the sum over the tones
+        is a BLAS product. Phases are reduced to one cycle in float64.
+        """
+        n_blocks = -(-len(time_axis)//BLOCK_SAMPLES)
+        result = np.zeros((n_blocks, BLOCK_SAMPLES), dtype=np.float64)
+        offsets = np.arange(BLOCK_SAMPLES)/time_axis.sample_rate
+        block_starts = time_axis.start + np.arange(n_blocks)*(BLOCK_SAMPLES/time_axis.sample_rate)
+        group = max(CHUNK_SAMPLES//BLOCK_SAMPLES, 1)
+        for tones in self._tiles():
+            frequencies = self.frequencies[tones]
+            steps = expj(2*np.pi*np.mod(np.multiply.outer(frequencies, offsets), 1))
+            phasors = self.amplitudes[tones]*np.exp(1j*self.phases[tones])
+            for b in range(0, n_blocks, group):
+                cycles = np.mod(np.multiply.outer(block_starts[b:b + group], frequencies), 1)
+                coefficients = expj(2*np.pi*cycles)
+                coefficients *= phasors
+                result[b:b + group] += (coefficients @ steps).real
+        return result.reshape(-1)[:len(time_axis)]
+
+    def sample(self, time_axis: np.array) -> npt.NDArray[np.float64]:
+        return self._sample_amplitudes(time_axis)
+
+    def waveform(self, duration: float, time_start: float = 0.0, sample_rate: float = None) -> Waveform:
+        """
+        Sampled sum of the tones. The default sample rate follows the Nyquist
+        teorem on the highest frequency.
+        """
+        if sample_rate == None:
+            sample_rate = 2 * np.max(np.abs(self.frequencies)) + 1
+        waveform = Waveform(duration=duration, time_start=time_start, sample_rate=sample_rate)
+        waveform.time_axis = TimeAxis(time_start, sample_rate, sample_count(duration, sample_rate))
+        waveform.amplitude_axis = self._sample_amplitudes(waveform.time_axis)
+        return waveform
@@ -0,0 +1,144 @@
+import numpy as np
+import numpy.typing as npt
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from .nco import nco_phasors
+from .sinusoid import ComplexWaveform, Waveform
+from .time_axis import TimeAxis
+
+# Taps of each polyphase branch of the interpolation filter
+TAPS_PER_PHASE = 16
+
+
+def rf_factor(center_frequency: float, sample_rate: float) -> int:
+    """
+    Smallest integer interpolation factor L such that the RF signal,
+    occupying center_frequency ± sample_rate/2, meets the Nyquist theorem at
+    L sample_rate.
+    """
+    return int(np.floor((2*np.abs(center_frequency) + sample_rate)/sample_rate)) + 1
+
+
+def interpolation_filter(factor: int, taps_per_phase: int = TAPS_PER_PHASE, beta: float = 8.0) -> npt.NDArray[np.float64]:
+    """
+    Kaiser-windowed sinc low-pass with cutoff at the input Nyquist frequency,
+    split into its `factor` polyphase branches.
+
+    Returns:
+        (taps_per_phase, factor) matrix H with H[k, p] = h[k factor + p]
+    """
+    n_taps = taps_per_phase*factor
+    delay = (taps_per_phase//2)*factor
+    h = np.sinc((np.arange(n_taps) - delay)/factor)*np.kaiser(n_taps, beta)
+    h = h.reshape(taps_per_phase, factor)
+    # Unit gain on every branch
+    return h/h.sum(axis=0)
+
+
+def interpolate(samples: npt.NDArray, factor: int, taps_per_phase: int = TAPS_PER_PHASE) -> npt.NDArray:
+    """
+    Polyphase interpolation by `factor` along the last axis.
+
+    Output sample n = m factor + p is sum_k H[k, p] x[m - k]: each branch
+    filters the input at the low rate, so no zero-stuffed signal is formed.
+    The filter delay is removed, so output sample m factor lands on input
+    sample m. The first and last taps_per_phase/2 input samples see the
+    filter transient against the zero padding.
+    """
+    H = interpolation_filter(factor, taps_per_phase).astype(np.finfo(samples.dtype).dtype)
+    lead = taps_per_phase//2
+    padding = [(0, 0)]*(samples.ndim - 1) + [(taps_per_phase - 1 - lead, lead)]
+    windows = np.lib.stride_tricks.sliding_window_view(np.pad(samples, padding), taps_per_phase, axis=-1)
+    out = windows[..., ::-1] @ H
+    return out.reshape(samples.shape[:-1] + (-1,))
+
+
+def upconvert(
+        envelope: npt.NDArray[np.complex128],
+        center_frequency: Union[float, npt.NDArray[np.float64]],
+        time_start: Union[float, npt.NDArray[np.float64]],
+        sample_rate: float,
+        factor: Optional[int] = None,
+        taps_per_phase: int = TAPS_PER_PHASE,
+        ) -> npt.NDArray[np.float64]:
+    """
+    Real RF samples Re(x(t) e^{j2πf_c t}) of the complex envelope x, sampled
+    at factor sample_rate: polyphase interpolation of the envelope followed
+    by an NCO carrier.
+
+    Args:
+        envelope: (..., samples) complex envelope at sample_rate
+        center_frequency: f_c (Hz), one per row for 2-D envelopes
+        time_start: absolute time of the first sample, one per row
+        sample_rate: envelope sample rate (Hz)
+        factor: interpolation factor, by default the smallest meeting Nyquist
+    """
+    if factor == None:
+        factor = rf_factor(np.max(np.abs(center_frequency)), sample_rate)
+    samples = interpolate(envelope, factor, taps_per_phase)
+    center_frequency = np.asarray(center_frequency, dtype=np.float64)
+    carrier = nco_phasors(
+        center_frequency, center_frequency*time_start, factor*sample_rate,
+        samples.shape[-1], np.finfo(samples.dtype).dtype,
+        )
+    return np.real(samples*carrier)
+
+
+@dataclass
+class BasebandWaveform(ComplexWaveform):
+    """
+    Complex envelope x(t) of the band-pass signal Re(x(t) e^{j2πf_c t}).
+
+    Only the low-rate envelope is stored and processed; sample_rate refers
+    to it and need only cover the signal bandwidth. Real RF samples are
+    produced on request by upconvert(). Envelopes about the same f_c can be
+    added; they cannot be multiplied.
+    """
+    center_frequency: float = 0.0
+
+    @classmethod
+    def from_envelope(cls, envelope, center_frequency: float, time_start: float, sample_rate: float) -> "BasebandWaveform":
+        waveform = cls(
+            duration=len(envelope)/sample_rate,
+            time_start=time_start,
+            sample_rate=sample_rate,
+            center_frequency=center_frequency,
+            )
+        waveform.time_axis = TimeAxis(time_start, sample_rate, len(envelope))
+        waveform.amplitude_axis = np.asarray(envelope)
+        return waveform
+
+    def _from_samples(self, time_start, duration, amplitude_axis, store=None):
+        result = BasebandWaveform.from_envelope(amplitude_axis, self.center_frequency, time_start, self.sample_rate)
+        result.duration = duration
+        result.store = store
+        return result
+
+    def _combine(self, other, op):
+        if not isinstance(other, BasebandWaveform) or other.center_frequency != self.center_frequency:
+            raise TypeError("Baseband waveforms must share the center frequency!")
+        return super()._combine(other, op)
+
+    def __mul__(self, other):
+        """
+        Not defined: the product of two envelopes is not the envelope of the
+        product of their RF signals, which is (1/2)Re(x1 x2*) plus a 2f_c
+        term. Mix baseband signals with sfcw.processing.mix_iq().
+        """
+        raise TypeError("Baseband waveforms cannot be multiplied, mix them with mix_iq()")
+
+    def rf_sample_rate(self, factor: Optional[int] = None) -> float:
+        return (factor or rf_factor(self.center_frequency, self.sample_rate))*self.sample_rate
+
+    def upconvert(self, factor: Optional[int] = None, taps_per_phase: int = TAPS_PER_PHASE) -> Waveform:
+        """
+        Real RF waveform at factor sample_rate, by default the lowest integer
+        multiple of the envelope rate that meets the Nyquist theorem.
+        """
+        factor = factor or rf_factor(self.center_frequency, self.sample_rate)
+        samples = upconvert(np.asarray(self.amplitude_axis), self.center_frequency, self.time_start, self.sample_rate, factor, taps_per_phase)
+        waveform = Waveform(duration=self.duration, time_start=self.time_start, sample_rate=factor*self.sample_rate)
+        waveform.time_axis = TimeAxis(self.time_start, factor*self.sample_rate, len(samples))
+        waveform.amplitude_axis = samples
+        return waveform
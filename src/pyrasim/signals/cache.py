@@ -0,0 +1,117 @@
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+def _nbytes(value: Tuple[Any, ...]) -> int:
+    return sum(getattr(item, "nbytes", 0) for item in value)
+
+
+class SampleCache:
+    """
+    Least-recently-used store for sampled waveforms with a memory budget.
+
+    Entries are tuples of arrays (or of objects exposing `nbytes`) keyed by
+    the parameters that produced them. When the total size exceeds
+    `max_bytes` the oldest entries are evicted, and an entry larger than the
+    whole budget is never stored. Every operation holds a lock, so a cache
+    can be shared by threads, and hits, misses and evictions are counted.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2**20):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, ...]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable):
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, ...]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """
+        Store `value` under `key` and return it. Arrays are made read-only
+        since they are shared by every reader of the entry.
+        """
+        for item in value:
+            if isinstance(item, np.ndarray):
+                item.flags.writeable = False
+        size = _nbytes(value)
+        if size > self.max_bytes:
+            return value
+        with self._lock:
+            self.invalidate(key)
+            self._entries[key] = value
+            self.nbytes += size
+            self._evict()
+        return value
+
+    def get_or_put(self, key: Hashable, compute: Callable[[], Tuple[Any, ...]]) -> Tuple[Any, ...]:
+        """
+        Cached value of `key`, computing and storing it on a miss. The
+        computation runs outside the lock, so concurrent misses on the same
+        key may both compute it; the last one is kept.
+        """
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, compute())
+        return value
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self.nbytes -= _nbytes(value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def resize(self, max_bytes: int):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "nbytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits/lookups if lookups else 0.0,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def _evict(self):
+        while self.nbytes > self.max_bytes and self._entries:
+            _, value = self._entries.popitem(last=False)
+            self.nbytes -= _nbytes(value)
+            self.evictions += 1
+
+
+# Shared by every lazily sampled waveform
+sample_cache = SampleCache()
@@ -0,0 +1,98 @@
+import numpy as np
+import numpy.typing as npt
+from typing import Union
+
+# Samples per block of the rotation table; block starts follow the recurrence
+NCO_BLOCK = 4096
+
+SYNTHESIS_MODES = ("direct", "nco")
+
+
+def nco_phasors(
+        frequency: Union[float, npt.NDArray[np.float64]],
+        start_cycles: Union[float, npt.NDArray[np.float64]],
+        sample_rate: float,
+        length: int,
+        dtype: npt.DTypeLike = np.float64,
+        block: int = NCO_BLOCK,
+        ) -> npt.NDArray[Union[np.complex128, np.complex64]]:
+    """
+    Numerically controlled oscillator, e^{j2π(c + f n/fs)} for n = 0, ..., length-1.
+
+    Instead of one transcendental call per sample, a table of the first
+    `block` phasors e^{j2πf k/fs} is evaluated once and every block of output
+    is that table rotated by the block start phasor. Block starts follow the
+    recurrence s_{b+1} = s_b e^{j2πf block/fs}, renormalized to |s| = 1 after
+    each step. Phases are reduced modulo one cycle before exponentiation, so
+    the result does not degrade at late start times as cos(ωt) does.
+
+    Error bound against exact arithmetic, with ε the float64 unit roundoff
+    and ε_out that of the output dtype:
+
+        |error| <= 2πε·length·|f|/fs + 4ε·ceil(length/block) + 2ε_out
+
+    The first term comes from rounding f/fs and is shared with any float64
+    generator. The second is the drift of the recurrence. The direct method
+    instead loses 2πε·|f|·t, which grows with the absolute time t. For 2^24
+    float64 samples at f/fs ≈ 0.12 starting at t = 1000 s, the NCO stays
+    below 3e-9 while cos(ωt) is off by 1.6e-6. In float32 the output
+    rounding, about 1.2e-7, dominates.
+
+    Args:
+        frequency: oscillator frequency (Hz); arrays give one row per frequency
+        start_cycles: phase of the first sample, in cycles
+        sample_rate: sample rate (Hz)
+        length: samples per row
+        dtype: float32 or float64 precision of the complex output
+        block: rotation table size
+
+    Returns:
+        complex64 or complex128 array of shape broadcast(frequency, start_cycles) + (length,)
+    """
+    starts, table, shape, length = _rotations(frequency, start_cycles, sample_rate, length, dtype, block)
+    phasors = np.multiply(starts, table)
+    return phasors.reshape(shape + (-1,))[..., :length]
+
+
+def nco_cosines(
+        frequency: Union[float, npt.NDArray[np.float64]],
+        start_cycles: Union[float, npt.NDArray[np.float64]],
+        sample_rate: float,
+        length: int,
+        dtype: npt.DTypeLike = np.float64,
+        block: int = NCO_BLOCK,
+        ) -> npt.NDArray[Union[np.float64, np.float32]]:
+    """
+    Real part of nco_phasors(), cos(2π(c + f n/fs)), computed as
+    Re(s)Re(p) - Im(s)Im(p) so no complex output is formed. Same error bound.
+    """
+    starts, table, shape, length = _rotations(frequency, start_cycles, sample_rate, length, dtype, block)
+    cosines = np.multiply(starts.real, table.real)
+    cosines -= np.multiply(starts.imag, table.imag)
+    return cosines.reshape(shape + (-1,))[..., :length]
+
+
+def _rotations(frequency, start_cycles, sample_rate, length, dtype, block):
+    """
+    (..., blocks, 1) block start phasors from the renormalized recurrence and
+    (..., 1, block) rotation table, both in the complex counterpart of `dtype`.
+    """
+    dtype = np.result_type(dtype, np.complex64)
+    frequency = np.asarray(frequency, dtype=np.float64)
+    start_cycles = np.asarray(start_cycles, dtype=np.float64)
+    shape = np.broadcast(frequency, start_cycles).shape
+    step = np.broadcast_to(frequency/sample_rate, shape)[..., None]
+
+    block = max(min(block, length), 1)
+    n_blocks = -(-length // block)
+    table = np.exp(2j*np.pi*((step*np.arange(block)) % 1.0)).astype(dtype)
+    rotation = np.exp(2j*np.pi*((step*block) % 1.0))
+
+    starts = np.empty(shape + (n_blocks, 1), dtype=np.complex128)
+    start = np.broadcast_to(np.exp(2j*np.pi*(start_cycles % 1.0)), shape)[..., None]
+    for b in range(n_blocks):
+        starts[..., b, :] = start
+        start = start*rotation
+        start /= np.abs(start)
+
+    return starts.astype(dtype), table[..., None, :], shape, length
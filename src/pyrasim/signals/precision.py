@@ -0,0 +1,75 @@
+import contextlib
+import numpy as np
+import numpy.typing as npt
+from typing import Optional
+
+PRECISIONS = (np.dtype(np.float32), np.dtype(np.float64))
+
+# Real dtype of generated samples for objects without their own dtype
+_default_dtype = np.dtype(np.float64)
+
+
+def _validate(dtype: npt.DTypeLike) -> np.dtype:
+    dtype = np.dtype(dtype)
+    # complex64/complex128 select the precision of their real part
+    if dtype.kind == "c":
+        dtype = np.finfo(dtype).dtype
+    if dtype not in PRECISIONS:
+        raise TypeError(f"Precision must be one of {[p.name for p in PRECISIONS]}")
+    return dtype
+
+
+def get_precision() -> np.dtype:
+    return _default_dtype
+
+
+def set_precision(dtype: npt.DTypeLike) -> np.dtype:
+    """
+    Set the global sample precision, float32 or float64. Returns the previous one.
+    """
+    global _default_dtype
+    previous, _default_dtype = _default_dtype, _validate(dtype)
+    return previous
+
+
+@contextlib.contextmanager
+def precision(dtype: npt.DTypeLike):
+    """
+    Temporarily change the global sample precision:
+
+        with precision(np.float32):
+            radar.operate()
+    """
+    previous = set_precision(dtype)
+    try:
+        yield _default_dtype
+    finally:
+        set_precision(previous)
+
+
+def real_dtype(dtype: Optional[npt.DTypeLike] = None) -> np.dtype:
+    """
+    Real sample dtype of an object whose dtype is `dtype`, the global
+    precision when None.
+    """
+    return _default_dtype if dtype is None else _validate(dtype)
+
+
+def complex_dtype(dtype: Optional[npt.DTypeLike] = None) -> np.dtype:
+    """
+    Complex counterpart of real_dtype(dtype): complex64 or complex128.
+    """
+    return np.result_type(real_dtype(dtype), np.complex64)
+
+
+def expj(x: npt.NDArray) -> npt.NDArray:
+    """
+    e^{jx} in the precision of `x`, written as cos(x) + j sin(x) into the
+    real and imaginary parts, which unlike np.exp(1j*x) is vectorized for
+    float32 as well.
+    """
+    x = np.asarray(x)
+    out = np.empty(x.shape, dtype=np.result_type(x.dtype, np.complex64))
+    np.cos(x, out=out.real)
+    np.sin(x, out=out.imag)
+    return out
@@ -1,11 +1,17 @@
 import numpy as np
 import numpy.typing as npt
-import matplotlib.pyplot as plt
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
-from typing import Union, List
+from typing import List, Optional, Union
 
-DEBUG = 1
+from pyrasim import instrumentation
+from pyrasim.plot import pyplot
+from .alignment import overlap_combine, sample_count, sample_index
+from .cache import sample_cache
+from .nco import SYNTHESIS_MODES, nco_cosines, nco_phasors
+from .precision import complex_dtype, expj, real_dtype
+from .store import BLOCK_SIZE, MemmapStore, blockwise
+from .time_axis import TimeAxis
 
 @dataclass
 class Sinusoid:
@@ -20,11 +26,22 @@ class Sinusoid:
     amplitude: float = 1
     frequency: float = 10
     phase: float = 0
+
+    # Sample generator, "direct" (cos/exp per sample) or "nco" (phasor
+    # recurrence, see nco_phasors), and the precision of the samples,
+    # float32 or float64 (None follows precision.set_precision()). Sampled
+    # waveforms take both as constructor fields, see LazySampledWaveform
+    synthesis = "direct"
+    dtype = None
     
     # Properties
     @property
     def angular_frequency(self) -> float:
         return 2 * np.pi * self.frequency
+
+    @property
+    def sample_dtype(self) -> np.dtype:
+        return real_dtype(self.dtype)
     
 
     @property
@@ -41,22 +58,71 @@ class Sinusoid:
         return (1.0/period)*np.sum(np.power(np.abs(self._sample_amplitudes(time_axis)), 2))
     
     # Methods
+    def _oscillator(self, time_axis: TimeAxis, generator=nco_cosines):
+        """
+        cos(ωt+phase) (or e^{j(ωt+phase)} with nco_phasors) on a uniform time
+        axis from the NCO generator.
+        """
+        start_cycles = self.frequency*time_axis.start + self.phase/(2*np.pi)
+        return generator(self.frequency, start_cycles, time_axis.sample_rate, len(time_axis), self.sample_dtype)
+
+    def _argument(self, time_axis):
+        """
+        ωt+phase for the direct generator, evaluated in float64. For single
+        precision samples it is first reduced to one cycle, so cos/exp can run
+        in float32 without losing the phase of late samples.
+        """
+        if self.sample_dtype == np.float64:
+            return self.angular_frequency*np.asarray(time_axis) + self.phase
+        cycles = self.frequency*np.asarray(time_axis, dtype=np.float64) + self.phase/(2*np.pi)
+        cycles -= np.floor(cycles)
+        return (2*np.pi*cycles).astype(np.float32)
+
+    def _nco(self, time_axis) -> bool:
+        if self.synthesis not in SYNTHESIS_MODES:
+            raise TypeError(f"Synthesis must be one of {SYNTHESIS_MODES}")
+        # The recurrence needs uniform sampling; plain arrays are sampled directly
+        return self.synthesis == "nco" and isinstance(time_axis, TimeAxis)
+
     def _sample_amplitudes(self, time_axis: np.array):
-        return self.amplitude * np.cos(self.angular_frequency*time_axis + self.phase)
+        if self._nco(time_axis):
+            return (self.amplitude * self._oscillator(time_axis)).astype(self.sample_dtype, copy=False)
+        return (self.amplitude * np.cos(self._argument(time_axis))).astype(self.sample_dtype, copy=False)
 
 
     
     # Operators
     def __add__(self, other):
-        if self.frequency == other.frequency:
+        """
+        Same-frequency sinusoids combine into one sinusoid of the same kind,
+        real ones of different frequencies into a SinusoidBank. SinusoidBank
+        only holds real tones, so complex sinusoids of different frequencies,
+        or a complex and a real one, raise TypeError.
+        """
+        from .bank import SinusoidBank
+
+        if not isinstance(other, (Sinusoid, SinusoidBank)):
+            return NotImplemented
+        complex_operands = isinstance(self, ComplexSinusoid), isinstance(other, ComplexSinusoid)
+        if isinstance(other, Sinusoid) and complex_operands[0] != complex_operands[1]:
+            raise TypeError("Real and complex sinusoids cannot be added!")
+        if isinstance(other, Sinusoid) and self.frequency == other.frequency:
             A1 = self.amplitude
             A2 = other.amplitude
             theta1 = self.phase
             theta2 = other.phase
             A = np.power(np.power(A1, 2) + np.power(A2, 2)  + 2*A1*A2*np.cos(theta1-theta2), 0.5)
-            theta = np.arctan((A1*np.sin(theta1) + A2*np.sin(theta2))/(A1*np.cos(theta1) + A2*np.cos(theta2)))
-            return Sinusoid(amplitude=A, frequency=self.frequency, phase=theta)
-
+            theta = np.arctan2(A1*np.sin(theta1) + A2*np.sin(theta2), A1*np.cos(theta1) + A2*np.cos(theta2))
+            return type(self)(amplitude=A, frequency=self.frequency, phase=theta)
+        if complex_operands[0]:
+            raise TypeError("Complex sinusoids of different frequencies cannot be added!")
+        return SinusoidBank.from_sinusoids([self]) + other
+
+    def __radd__(self, other):
+        # sum() starts from 0
+        if isinstance(other, (int, float)) and other == 0:
+            return self
+        return NotImplemented
 
     # Plotting
     
@@ -67,6 +133,9 @@ class Sinusoid:
         Args:
             sample_rate (int): sampling rate for the sinusoid. Default 100 times the frequency
         """
+        plt = pyplot()
+        if plt is None:
+            return
 
         if sample_rate == None:
             sample_rate = 2 * np.abs(self.frequency) + 1
@@ -85,8 +154,11 @@ class Waveform(ABC):
     time_start: float = 0.0
     sample_rate: int = None
 
-    time_axis: npt.NDArray[np.float_] = field(init=False, repr=False)
-    amplitude_axis: npt.NDArray[Union[np.float_, np.complex_]] = field(init=False, repr=False)
+    time_axis: TimeAxis = field(init=False, repr=False)
+    amplitude_axis: npt.NDArray[Union[np.float64, np.complex128]] = field(init=False, repr=False)
+
+    # MemmapStore holding the samples, None when they live in memory
+    store = None
     
     # Properties
     @property
@@ -95,314 +167,148 @@ class Waveform(ABC):
 
     def __len__(self):
         return len(self.time_axis)
+
+    def _from_samples(self, time_start, duration, amplitude_axis, store=None):
+        result_class = ComplexWaveform if np.iscomplexobj(amplitude_axis) else Waveform
+        result = result_class(duration=duration, time_start=time_start, sample_rate=self.sample_rate)
+        result.time_axis = TimeAxis(time_start, self.sample_rate, len(amplitude_axis))
+        result.amplitude_axis = amplitude_axis
+        result.store = store
+        return result
+
+    def blocks(self, block_size: int = BLOCK_SIZE):
+        """
+        Iterate over (time_axis, amplitude_axis) slices of `block_size` samples.
+        """
+        for i in range(0, len(self), block_size):
+            yield self.time_axis[i:i + block_size], self.amplitude_axis[i:i + block_size]
+
+    def to_memmap(self, store: MemmapStore):
+        """
+        Copy of the waveform with its samples on `store`, written block by block.
+        """
+        amplitude_axis = store.allocate(len(self), self.amplitude_axis.dtype)
+        blockwise(amplitude_axis, np.asarray, self.amplitude_axis, block_size=store.block_size)
+        return self._from_samples(self.time_start, self.duration, amplitude_axis, store)
     
-    def __add__(self, other):
-        if self.sample_rate == other.sample_rate:
-            duration = max(self.time_end, other.time_end) - min(self.time_start, other.time_start)
-            add_result = Waveform(
-                duration=duration, 
-                time_start= min(self.time_start, other.time_start),
-                sample_rate= self.sample_rate
-                )
-            add_result.time_axis = np.arange(0, duration, 1.0/add_result.sample_rate, dtype=np.float_) + add_result.time_start
-            add_result.amplitude_axis = np.zeros(len(add_result))
-
-            s_i = np.isclose(add_result.time_axis, self.time_axis[0]).nonzero()[0][0]
-            s_j = np.isclose(add_result.time_axis, self.time_axis[-1]).nonzero()[0][0]
-            o_i = np.isclose(add_result.time_axis, other.time_axis[0]).nonzero()[0][0]
-            o_j = np.isclose(add_result.time_axis, other.time_axis[-1]).nonzero()[0][0]
-
-            if DEBUG:
-                print(f"si: {s_i}, sj: {s_j}, oi: {o_i}, oj: {o_j}")
-            if (o_i <= s_j and s_i <= o_i):
-                """
-                ----------------------------
-                |           |***n***|       |
-                ----------------------------
-                s_i        o_i    s_j     o_j
-                """
-                if DEBUG:
-                    print("case 1")
-                
-                n = s_j - o_i + 1
-                o_k = 0                 # starting index in other array
-                s_k = len(self) - n     # starting index in self array
-                r_k = o_i               # starting index in result array
-                # Sum intersection
-                while r_k <= min(s_j, o_j):
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k] + other.amplitude_axis[o_k]
-                    r_k += 1
-                    s_k += 1
-                    o_k += 1
-                # Left side
-                r_k = 0
-                s_k = 0
-                while r_k < o_i:
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k]
-                    r_k += 1
-                    s_k += 1
-                # Right side
-                r_k = min(s_j, o_j) + 1
-                o_k = n
-                while r_k <= o_j:
-                    add_result.amplitude_axis[r_k] = other.amplitude_axis[o_k]
-                    r_k += 1
-                    o_k += 1
-                # If other is included in self
-                s_k = o_j - s_i + 1
-                while r_k <= max(o_j, s_j):
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k]
-                    r_k += 1
-                    s_k += 1
-            elif (o_i > s_j and o_j > s_i):
-                """
-                -------------       ---------
-                |           |       |       |
-                -------------       ---------
-                s_i        s_j     o_i     o_j
-                """
-                if DEBUG:
-                    print("case 2")
-                # Left side
-                r_k = s_i
-                s_k = 0
-                while r_k <= s_j:
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k]
-                    r_k += 1
-                    s_k += 1
-                # Right side
-                r_k = o_i
-                o_k = 0
-                while r_k <= o_j:
-                    add_result.amplitude_axis[r_k] = other.amplitude_axis[o_k]
-                    r_k += 1
-                    o_k += 1
-            elif (s_i <= o_j and o_i <= s_i):
-                """
-                ----------------------------
-                |           |***n***|       |
-                ----------------------------
-                o_i        s_i    o_j     s_j
-                """
-                if DEBUG:
-                    print("case 3")
-                n = o_j - s_i + 1
-                o_k = len(other) - n    # starting index in other array
-                s_k = 0                 # starting index in self array
-                r_k = s_i               # starting index in result array
-                # Sum intersection
-                while r_k <= min(o_j, s_j):
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k] + other.amplitude_axis[o_k]
-                    r_k += 1
-                    s_k += 1
-                    o_k += 1
-                # Left side
-                r_k = 0
-                o_k = 0
-                while r_k < s_i:
-                    add_result.amplitude_axis[r_k] = other.amplitude_axis[o_k]
-                    r_k += 1
-                    o_k += 1
-                # Right side
-                r_k = min(o_j, s_j) + 1
-                s_k = n
-                while r_k <= s_j:
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k]
-                    r_k += 1
-                    s_k += 1
-                # If self is included in other
-                o_k = s_j - o_i + 1
-                while r_k <= max(o_j, s_j):
-                    add_result.amplitude_axis[r_k] = other.amplitude_axis[o_k]
-                    r_k += 1
-                    o_k += 1
-
-            elif (s_i > o_j and s_j > o_i):
-                """
-                -------------       ---------
-                |           |       |       |
-                -------------       ---------
-                o_i        o_j     s_i     s_j
-                """
-                if DEBUG:
-                    print("case 4")
-                # Left side
-                r_k = o_i
-                o_k = 0
-                while r_k <= o_j:
-                    add_result.amplitude_axis[r_k] = other.amplitude_axis[o_k]
-                    r_k += 1
-                    o_k += 1
-                # Right side
-                r_k = s_i
-                s_k = 0
-                while r_k <= s_j:
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k]
-                    r_k += 1
-                    s_k += 1
-        
-            return add_result
-        else:
+    def _combine(self, other, op):
+        """
+        Align both waveforms on the common sample grid and merge them with `op`.
+        Non-overlapping samples are copied from whichever waveform is present.
+        """
+        if self.sample_rate != other.sample_rate:
             raise TypeError("Waveforms are not of the same sample rate!")
 
+        s_i = sample_index(self.time_start, self.sample_rate)
+        o_i = sample_index(other.time_start, other.sample_rate)
+
+        # Memmap-backed operands keep the result on their store
+        store = self.store or other.store
+        with instrumentation.stage("signals.arithmetic") as stage:
+            if store == None:
+                _, amplitude_axis = overlap_combine(self.amplitude_axis, s_i, other.amplitude_axis, o_i, op)
+            else:
+                _, amplitude_axis = overlap_combine(
+                    self.amplitude_axis, s_i, other.amplitude_axis, o_i, op,
+                    allocate=store.allocate, block_size=store.block_size
+                    )
+            stage.record(len(amplitude_axis), amplitude_axis.nbytes)
+
+        time_start = min(self.time_start, other.time_start)
+        duration = max(self.time_end, other.time_end) - time_start
+        return self._from_samples(time_start, duration, amplitude_axis, store)
+
+    def __add__(self, other):
+        return self._combine(other, np.add)
+
     def __mul__(self, other):
-        if self.sample_rate == other.sample_rate:
-            duration = max(self.time_end, other.time_end) - min(self.time_start, other.time_start)
-            add_result = Waveform(
-                duration=duration, 
-                time_start= min(self.time_start, other.time_start),
-                sample_rate= self.sample_rate
-                )
-            add_result.time_axis = np.arange(0, duration, 1.0/add_result.sample_rate, dtype=np.float_) + add_result.time_start
-            add_result.amplitude_axis = np.zeros(len(add_result))
-
-            s_i = np.isclose(add_result.time_axis, self.time_axis[0]).nonzero()[0][0]
-            s_j = np.isclose(add_result.time_axis, self.time_axis[-1]).nonzero()[0][0]
-            o_i = np.isclose(add_result.time_axis, other.time_axis[0]).nonzero()[0][0]
-            o_j = np.isclose(add_result.time_axis, other.time_axis[-1]).nonzero()[0][0]
-
-            if DEBUG:
-                print(f"si: {s_i}, sj: {s_j}, oi: {o_i}, oj: {o_j}")
-            if (o_i <= s_j and s_i <= o_i):
-                """
-                ----------------------------
-                |           |***n***|       |
-                ----------------------------
-                s_i        o_i    s_j     o_j
-                """
-                if DEBUG:
-                    print("case 1")
-                
-                n = s_j - o_i + 1
-                o_k = 0                 # starting index in other array
-                s_k = len(self) - n     # starting index in self array
-                r_k = o_i               # starting index in result array
-                # Sum intersection
-                while r_k <= min(s_j, o_j):
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k] * other.amplitude_axis[o_k]
-                    r_k += 1
-                    s_k += 1
-                    o_k += 1
-                # Left side
-                r_k = 0
-                s_k = 0
-                while r_k < o_i:
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k]
-                    r_k += 1
-                    s_k += 1
-                # Right side
-                r_k = min(s_j, o_j) + 1
-                o_k = n
-                while r_k <= o_j:
-                    add_result.amplitude_axis[r_k] = other.amplitude_axis[o_k]
-                    r_k += 1
-                    o_k += 1
-                # If other is included in self
-                s_k = o_j - s_i + 1
-                while r_k <= max(o_j, s_j):
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k]
-                    r_k += 1
-                    s_k += 1
-            elif (o_i > s_j and o_j > s_i):
-                """
-                -------------       ---------
-                |           |       |       |
-                -------------       ---------
-                s_i        s_j     o_i     o_j
-                """
-                if DEBUG:
-                    print("case 2")
-                # Left side
-                r_k = s_i
-                s_k = 0
-                while r_k <= s_j:
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k]
-                    r_k += 1
-                    s_k += 1
-                # Right side
-                r_k = o_i
-                o_k = 0
-                while r_k <= o_j:
-                    add_result.amplitude_axis[r_k] = other.amplitude_axis[o_k]
-                    r_k += 1
-                    o_k += 1
-            elif (s_i <= o_j and o_i <= s_i):
-                """
-                ----------------------------
-                |           |***n***|       |
-                ----------------------------
-                o_i        s_i    o_j     s_j
-                """
-                if DEBUG:
-                    print("case 3")
-                n = o_j - s_i + 1
-                o_k = len(other) - n    # starting index in other array
-                s_k = 0                 # starting index in self array
-                r_k = s_i               # starting index in result array
-                # Sum intersection
-                while r_k <= min(o_j, s_j):
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k] * other.amplitude_axis[o_k]
-                    r_k += 1
-                    s_k += 1
-                    o_k += 1
-                # Left side
-                r_k = 0
-                o_k = 0
-                while r_k < s_i:
-                    add_result.amplitude_axis[r_k] = other.amplitude_axis[o_k]
-                    r_k += 1
-                    o_k += 1
-                # Right side
-                r_k = min(o_j, s_j) + 1
-                s_k = n
-                while r_k <= s_j:
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k]
-                    r_k += 1
-                    s_k += 1
-                # If self is included in other
-                o_k = s_j - o_i + 1
-                while r_k <= max(o_j, s_j):
-                    add_result.amplitude_axis[r_k] = other.amplitude_axis[o_k]
-                    r_k += 1
-                    o_k += 1
-
-            elif (s_i > o_j and s_j > o_i):
-                """
-                -------------       ---------
-                |           |       |       |
-                -------------       ---------
-                o_i        o_j     s_i     s_j
-                """
-                if DEBUG:
-                    print("case 4")
-                # Left side
-                r_k = o_i
-                o_k = 0
-                while r_k <= o_j:
-                    add_result.amplitude_axis[r_k] = other.amplitude_axis[o_k]
-                    r_k += 1
-                    o_k += 1
-                # Right side
-                r_k = s_i
-                s_k = 0
-                while r_k <= s_j:
-                    add_result.amplitude_axis[r_k] = self.amplitude_axis[s_k]
-                    r_k += 1
-                    s_k += 1
-        
-            return add_result
-        else:
-            raise TypeError("Waveforms are not of the same sample rate!")
+        return self._combine(other, np.multiply)
 
     # Plotting
     def plot(self):
-        plt.plot(self.time_axis, self.amplitude_axis)
+        """
+        Plot the waveform from its min/max envelope, decimated again on zoom
+        (see plot.mpl.time_domain; waveform_figure() renders without show()).
+        """
+        plt = pyplot()
+        if plt is None:
+            return
+        from pyrasim.plot.mpl.time_domain import plot_waveform
+        plot_waveform(self, plt.gca())
         plt.ylabel("Amplitude")
         plt.xlabel("Time (s)")
         plt.show()
     
 @dataclass
-class CosineWaveform(Waveform, Sinusoid):
+class LazySampledWaveform:
+    """
+    Mixin for waveforms whose samples follow from their parameters.
+
+    The time axis is implicit (TimeAxis). Samples are generated on first
+    access of `amplitude_axis` and kept in the shared `sample_cache` keyed by
+    the waveform parameters, so constructing a waveform allocates nothing and
+    repeated reads are free.
+
+    synthesis: sample generator, "direct" or "nco"
+    dtype: float32 or float64 precision of the samples, None follows the
+        global precision
+    """
+    # Last in the constructor of the waveforms, after sample_rate
+    synthesis: str = "direct"
+    dtype: Optional[npt.DTypeLike] = None
+
+    @property
+    def _sample_key(self):
+        return (
+            type(self), self.amplitude, self.frequency, self.phase,
+            self.duration, self.time_start, self.sample_rate,
+            self.synthesis, self.sample_dtype
+            )
+
+    @property
+    def time_axis(self) -> TimeAxis:
+        return TimeAxis(self.time_start, self.sample_rate, len(self))
+
+    @property
+    def amplitude_axis(self):
+        return sample_cache.get_or_put(self._sample_key, self._synthesize)[0]
+
+    def _synthesize(self):
+        with instrumentation.stage("signals.synthesis") as stage:
+            samples = self._sample_amplitudes(self.time_axis)
+            stage.record(samples.size, samples.nbytes)
+        return (samples,)
+
+    def __len__(self):
+        return sample_count(self.duration, self.sample_rate)
+
+    def to_memmap(self, store: MemmapStore):
+        """
+        Waveform with the samples generated block by block straight onto
+        `store`, without materializing them in memory.
+        """
+        time_axis = self.time_axis
+        dtype = self._sample_amplitudes(time_axis[:1]).dtype
+        amplitude_axis = store.allocate(len(time_axis), dtype)
+        blockwise(amplitude_axis, self._sample_amplitudes, time_axis, block_size=store.block_size)
+        return self._from_samples(self.time_start, self.duration, amplitude_axis, store)
+
+    def invalidate(self):
+        """
+        Drop the cached samples of this waveform.
+        """
+        sample_cache.invalidate(self._sample_key)
+
+    def update_sample_rate(self, sample_rate):
+        self.invalidate()
+        self.sample_rate = sample_rate
+
+    def update_phase(self, phase):
+        self.invalidate()
+        self.phase = phase
+
+@dataclass
+class CosineWaveform(LazySampledWaveform, Waveform, Sinusoid):
     
     def __post_init__(self):
         """
@@ -416,21 +322,7 @@ class CosineWaveform(Waveform, Sinusoid):
         else:
             # set default sample rate
             self.sample_rate = 2 * np.abs(self.frequency) + 1 
-        
-        if DEBUG:
-            print(f"sample_rate: {self.sample_rate}, frequency: {self.frequency}")
-        
-        self.time_axis = np.arange(0, self.duration, 1.0/self.sample_rate, dtype=float) + self.time_start
-        self.amplitude_axis = self._sample_amplitudes(self.time_axis)
-
-    def update_sample_rate(self, sample_rate):
-        self.sample_rate = sample_rate
-        self.time_axis = np.arange(0, self.duration, 1.0/self.sample_rate, dtype=float) + self.time_start
-        self.amplitude_axis = self._sample_amplitudes(self.time_axis)
-
-    def update_phase(self, phase):
-        self.phase = phase
-        self.amplitude_axis = self._sample_amplitudes(self.time_axis)
+        instrumentation.count("signals.waveforms")
     
 class SineWaveform(CosineWaveform):
 
@@ -448,8 +340,9 @@ class ComplexSinusoid(Sinusoid):
     """
 
     def _sample_amplitudes(self, time_axis: np.array):
-        phi = self.angular_frequency * time_axis
-        return self.amplitude*np.exp(1j*(phi+ self.phase)) 
+        if self._nco(time_axis):
+            return (self.amplitude * self._oscillator(time_axis, nco_phasors)).astype(complex_dtype(self.dtype), copy=False)
+        return (self.amplitude*expj(self._argument(time_axis))).astype(complex_dtype(self.dtype), copy=False)
     
     # Plotting
     def plot(self, sample_rate:int = None):
@@ -459,6 +352,9 @@ class ComplexSinusoid(Sinusoid):
         Args:
             sample_rate (int): sampling rate for the sinusoid. Default 100 times the frequency
         """
+        plt = pyplot()
+        if plt is None:
+            return
 
         if sample_rate == None:
             sample_rate = 2 * np.abs(self.frequency) + 1
@@ -474,19 +370,21 @@ class ComplexSinusoid(Sinusoid):
         plt.show()
 
 class ComplexWaveform(Waveform):
-    time_axis: npt.NDArray[np.float_] = field(init=False, repr=False)
-    amplitude_axis: npt.NDArray[np.float_] = field(init=False, repr=False)
+    time_axis: TimeAxis = field(init=False, repr=False)
+    amplitude_axis: npt.NDArray[np.float64] = field(init=False, repr=False)
     # Plotting
     def plot(self):
-        plt.plot(self.time_axis, np.real(self.amplitude_axis))
-        plt.plot(self.time_axis, np.imag(self.amplitude_axis))
+        plt = pyplot()
+        if plt is None:
+            return
+        from pyrasim.plot.mpl.time_domain import plot_waveform
+        plot_waveform(self, plt.gca())
         plt.ylabel("Amplitude")
         plt.xlabel("Time (s)")
         plt.show()
 
-# TODO: edit __add__ to work with complex
 @dataclass
-class ComplexSinusoidWaveform(ComplexWaveform, ComplexSinusoid):
+class ComplexSinusoidWaveform(LazySampledWaveform, ComplexWaveform, ComplexSinusoid):
     def __post_init__(self):
         """
         Use Nyquist teorem as default sample rate if has no value.
@@ -494,28 +392,26 @@ class ComplexSinusoidWaveform(ComplexWaveform, ComplexSinusoid):
         if self.sample_rate == None:
             self.sample_rate = 2 * np.abs(self.frequency) + 1     
 
-    @property
-    def time_axis(self):
-        return np.arange(0, self.duration, 1.0/self.sample_rate) + self.time_start
-    
-    @property
-    def amplitude_axis(self):
-        return self._sample_amplitudes(self.time_axis)
-    
     def conjugate(self):
-        return ComplexSinusoidWaveform(
+        conjugate = ComplexSinusoidWaveform(
             self.amplitude, 
             -1*self.frequency, 
             -1*self.phase, 
             self.duration,
             self.time_start,
-            self.sample_rate
+            self.sample_rate,
+            synthesis=self.synthesis,
+            dtype=self.dtype,
             )
+        return conjugate
     
     # Plotting
     def plot(self):
-        plt.plot(self.time_axis, np.real(self.amplitude_axis))
-        plt.plot(self.time_axis, np.imag(self.amplitude_axis))
+        plt = pyplot()
+        if plt is None:
+            return
+        from pyrasim.plot.mpl.time_domain import plot_waveform
+        plot_waveform(self, plt.gca())
         plt.legend(['real', 'imag'], loc='upper right')
         plt.ylabel("Amplitude")
         plt.xlabel("Time (s)")
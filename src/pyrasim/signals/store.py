@@ -0,0 +1,59 @@
+import itertools
+import os
+import shutil
+import tempfile
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+# Samples processed at once on memmap-backed waveforms
+BLOCK_SIZE = 2**20
+
+
+class MemmapStore:
+    """
+    Backing store that places waveform samples on np.memmap files, so
+    waveforms larger than RAM can be generated and combined block by block.
+
+    Files are created in `directory`, or in a private temporary directory that
+    is removed by cleanup() (or when leaving the store as a context manager).
+    """
+
+    def __init__(self, directory: Optional[str] = None, block_size: int = BLOCK_SIZE):
+        self._owns_directory = directory is None
+        self.directory = tempfile.mkdtemp(prefix="pyrasim-") if directory is None else directory
+        self.block_size = block_size
+        self._counter = itertools.count()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cleanup()
+
+    def allocate(self, shape: Union[int, Tuple[int, ...]], dtype: npt.DTypeLike = np.float64) -> np.memmap:
+        """
+        New zero-filled memmap of `shape` and `dtype`.
+        """
+        path = os.path.join(self.directory, f"samples-{next(self._counter)}.dat")
+        shape = (shape,) if np.isscalar(shape) else tuple(shape)
+        if int(np.prod(shape)) == 0:
+            # np.memmap cannot map an empty file
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="w+", shape=shape)
+
+    def cleanup(self):
+        if self._owns_directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def blockwise(out: np.ndarray, op, *inputs: np.ndarray, block_size: Optional[int] = None):
+    """
+    out[:] = op(*inputs), evaluated over blocks of `block_size` samples so no
+    full-length temporary is created. Without a block size it runs in one go.
+    """
+    block_size = block_size or max(len(out), 1)
+    for i in range(0, len(out), block_size):
+        out[i:i + block_size] = op(*(array[i:i + block_size] for array in inputs))
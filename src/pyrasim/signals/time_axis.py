@@ -0,0 +1,73 @@
+import numpy as np
+import numpy.typing as npt
+from typing import Union
+
+
+class TimeAxis:
+    """
+    Uniformly sampled time axis t_n = start + n/sample_rate, n = 0, ..., length-1.
+
+    Only start, sample_rate and length are stored. Indexing returns sample
+    times, slicing returns another TimeAxis, and np.asarray() materializes
+    the samples on demand.
+    """
+    __slots__ = ("start", "sample_rate", "length")
+
+    def __init__(self, start: float, sample_rate: float, length: int):
+        self.start = start
+        self.sample_rate = sample_rate
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __repr__(self):
+        return f"TimeAxis(start={self.start}, sample_rate={self.sample_rate}, length={self.length})"
+
+    def __eq__(self, other):
+        if isinstance(other, TimeAxis):
+            return (self.start, self.sample_rate, self.length) == (other.start, other.sample_rate, other.length)
+        return NotImplemented
+
+    @property
+    def end(self) -> float:
+        """
+        Time just after the last sample, start + length/sample_rate.
+        """
+        return self.start + self.length/self.sample_rate
+
+    def index(self, time: float) -> int:
+        """
+        Index of the sample nearest to `time`.
+        """
+        return int(np.round((time - self.start)*self.sample_rate))
+
+    def __getitem__(self, key) -> Union[float, "TimeAxis", npt.NDArray[np.float64]]:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.length)
+            length = len(range(start, stop, step))
+            if step > 0:
+                return TimeAxis(self.start + start/self.sample_rate, self.sample_rate/step, length)
+            return np.asarray(self)[key]
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += self.length
+            if not 0 <= key < self.length:
+                raise IndexError("TimeAxis index out of range")
+            return self.start + key/self.sample_rate
+        return np.asarray(self)[key]
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(np.arange(self.length)/self.sample_rate + self.start, dtype=dtype)
+
+    def __add__(self, offset: float) -> Union["TimeAxis", npt.NDArray[np.float64]]:
+        if np.isscalar(offset):
+            return TimeAxis(self.start + offset, self.sample_rate, self.length)
+        return np.asarray(self) + offset
+
+    __radd__ = __add__
+
+    def __sub__(self, offset: float) -> Union["TimeAxis", npt.NDArray[np.float64]]:
+        if np.isscalar(offset):
+            return TimeAxis(self.start - offset, self.sample_rate, self.length)
+        return np.asarray(self) - offset